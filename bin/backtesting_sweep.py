@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import path_util  # noqa: F401
+import yaml
+
+from hummingbot.client.settings import CONTROLLERS_CONF_DIR_PATH
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.strategy_v2.backtesting.backtesting_cache import BacktestingCache
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.parameter_sweep import ParameterSweep, grid_search_params, random_search_params
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Backtests a controller config for a grid or a random sample of parameters.")
+        self.add_argument("--config", "-c",
+                          type=str,
+                          required=True,
+                          help="Specify a file in `conf/controllers` to use as the base controller config.")
+        self.add_argument("--start",
+                          type=parse_time,
+                          required=True,
+                          help="Start of the backtest, as YYYY-MM-DD or a unix timestamp.")
+        self.add_argument("--end",
+                          type=parse_time,
+                          required=True,
+                          help="End of the backtest, as YYYY-MM-DD or a unix timestamp.")
+        self.add_argument("--resolution",
+                          type=str,
+                          default="1m",
+                          help="Interval of the candles used to simulate the executors.")
+        self.add_argument("--trade-cost",
+                          type=float,
+                          default=0.0006,
+                          help="Cost of each trade as a fraction of its amount.")
+        self.add_argument("--grid", "-g",
+                          action="append",
+                          default=[],
+                          metavar="PARAM=V1,V2,...",
+                          help="Values of a parameter of the grid, can be used several times.")
+        self.add_argument("--random", "-r",
+                          action="append",
+                          default=[],
+                          metavar="PARAM=LOW:HIGH|V1,V2,...",
+                          help="Range or choices of a parameter of the random search, can be used several times.")
+        self.add_argument("--samples", "-n",
+                          type=int,
+                          default=20,
+                          help="Number of combinations of the random search.")
+        self.add_argument("--seed",
+                          type=int,
+                          required=False,
+                          help="Seed of the random search.")
+        self.add_argument("--workers", "-w",
+                          type=int,
+                          required=False,
+                          help="Number of backtesting processes, the number of CPUs by default.")
+        self.add_argument("--cache",
+                          action="store_true",
+                          help="Reuse the controller features and simulations stored by previous runs.")
+        self.add_argument("--sort-by",
+                          type=str,
+                          default="net_pnl_quote",
+                          help="Metric used to sort the results.")
+        self.add_argument("--top",
+                          type=int,
+                          default=20,
+                          help="Number of results to print.")
+
+
+def parse_time(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+    return int(datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp())
+
+
+def parse_values(values: str) -> List[Any]:
+    return [yaml.safe_load(value) for value in values.split(",")]
+
+
+def parse_params(arguments: List[str], allow_ranges: bool = False) -> Dict[str, Any]:
+    params = {}
+    for argument in arguments:
+        name, _, values = argument.partition("=")
+        if not values:
+            raise ValueError(f"Invalid parameter {argument}, expected PARAM=VALUES.")
+        if allow_ranges and ":" in values and "," not in values:
+            params[name] = tuple(yaml.safe_load(bound) for bound in values.split(":", 1))
+        else:
+            params[name] = parse_values(values)
+    return params
+
+
+def print_progress(row: Dict[str, Any], completed: int, total: int):
+    metric = row.get("net_pnl_quote")
+    status = f"net_pnl_quote: {metric:.4f}" if metric is not None else "failed"
+    sys.stdout.write(f"\r[{completed}/{total}] {row['config_hash']} {status}")
+    sys.stdout.flush()
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    base_config = BacktestingEngineBase.load_controller_config(args.config, CONTROLLERS_CONF_DIR_PATH)
+    params_list = []
+    if len(args.grid) > 0:
+        params_list.extend(grid_search_params(parse_params(args.grid)))
+    if len(args.random) > 0:
+        params_list.extend(random_search_params(parse_params(args.random, allow_ranges=True), args.samples, args.seed))
+    if len(params_list) == 0:
+        params_list.append({})
+
+    sweep = ParameterSweep(base_config=base_config,
+                           start=args.start,
+                           end=args.end,
+                           backtesting_resolution=args.resolution,
+                           trade_cost=args.trade_cost,
+                           max_workers=args.workers,
+                           backtesting_cache=BacktestingCache() if args.cache else None)
+    results_df = sweep.run(params_list, on_result=print_progress)
+    sys.stdout.write("\n")
+    if args.sort_by in results_df.columns:
+        results_df = results_df.sort_values(args.sort_by, ascending=False)
+    print(format_df_for_printout(results_df.head(args.top), table_format="psql", index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+
+import path_util  # noqa: F401
+
+from hummingbot import init_logging
+from hummingbot.client.config.config_helpers import load_client_config_map_from_file
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange.paper_trade.market_data_service import PaperTradeMarketDataService
+from hummingbot.connector.exchange.paper_trade.market_data_service_data_source import MARKET_DATA_SERVICE_SOCKET_PATH
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Shares the exchange market data connections of the paper trade bots of a host. "
+                                     "Bots use it when paper_trade_market_data_socket is set in their client config.")
+        self.add_argument("--socket", "-s",
+                          type=str,
+                          default=MARKET_DATA_SERVICE_SOCKET_PATH,
+                          help="Path of the unix socket the bots connect to.")
+
+
+async def run_service(socket_path: str):
+    client_config_map = load_client_config_map_from_file()
+    init_logging("hummingbot_logs.yml", client_config_map)
+    # The connectors read the client config from the main application
+    HummingbotApplication.main_application(client_config_map=client_config_map)
+
+    service = PaperTradeMarketDataService(socket_path=socket_path)
+    await service.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    try:
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    except Exception:
+        ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(ev_loop)
+    try:
+        ev_loop.run_until_complete(run_service(args.socket))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
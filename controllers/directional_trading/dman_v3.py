@@ -2,7 +2,6 @@ import time
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -14,6 +13,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
 )
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
 from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop
+from hummingbot.strategy_v2.utils.incremental_indicators import BollingerBands, IndicatorEngine
 
 
 class DManV3ControllerConfig(DirectionalTradingControllerConfigBase):
@@ -161,6 +161,7 @@ class DManV3Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = IndicatorEngine([BollingerBands(length=config.bb_length, std=config.bb_std)])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -168,8 +169,10 @@ class DManV3Controller(DirectionalTradingControllerBase):
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+        # Add indicators, only recomputed when a candle closes or the current candle changes
+        if not self.indicators.update(df):
+            return
+        df = self.indicators.features
 
         # Generate signal
         long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
@@ -1,6 +1,5 @@
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -9,6 +8,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
 )
+from hummingbot.strategy_v2.utils.incremental_indicators import ATR, EMA, MACD, IndicatorEngine
 
 
 class SmugPlugControllerConfig(DirectionalTradingControllerConfigBase):
@@ -72,6 +72,13 @@ class SmugPlugController(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = IndicatorEngine([
+            MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal),
+            ATR(length=config.atr_length),
+            EMA(length=config.ema_short),
+            EMA(length=config.ema_medium),
+            EMA(length=config.ema_long),
+        ])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -79,12 +86,10 @@ class SmugPlugController(DirectionalTradingControllerBase):
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
-        # Add indicators
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
-        df.ta.atr(length=self.config.atr_length, append=True)
-        df.ta.ema(length=self.config.ema_short, append=True)
-        df.ta.ema(length=self.config.ema_medium, append=True)
-        df.ta.ema(length=self.config.ema_long, append=True)
+        # Add indicators, only recomputed when a candle closes or the current candle changes
+        if not self.indicators.update(df):
+            return
+        df = self.indicators.features
         df["long_atr_support"] = df["close"].shift(1) - df[f"ATRr_{self.config.atr_length}"] * self.config.atr_multiplier
         df["short_atr_resistance"] = df["close"].shift(1) + df[f"ATRr_{self.config.atr_length}"] * self.config.atr_multiplier
 
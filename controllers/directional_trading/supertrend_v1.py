@@ -1,6 +1,5 @@
 from typing import List, Optional
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
@@ -9,6 +8,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
 )
+from hummingbot.strategy_v2.utils.incremental_indicators import IndicatorEngine, SuperTrend as SuperTrendIndicator
 
 
 class SuperTrendConfig(DirectionalTradingControllerConfigBase):
@@ -45,6 +45,7 @@ class SuperTrend(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        self.indicators = IndicatorEngine([SuperTrendIndicator(length=config.length, multiplier=config.multiplier)])
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
@@ -52,8 +53,10 @@ class SuperTrend(DirectionalTradingControllerBase):
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
                                                       max_records=self.max_records)
-        # Add indicators
-        df.ta.supertrend(length=self.config.length, multiplier=self.config.multiplier, append=True)
+        # Add indicators, only recomputed when a candle closes or the current candle changes
+        if not self.indicators.update(df):
+            return
+        df = self.indicators.features
         df["percentage_distance"] = abs(df["close"] - df[f"SUPERT_{self.config.length}_{self.config.multiplier}"]) / df["close"]
 
         # Generate long and short conditions
@@ -130,6 +130,7 @@ def init_logging(conf_filename: str,
                  client_config_map: "_ClientConfigAdapter",
                  override_log_level: Optional[str] = None,
                  strategy_file_path: str = "hummingbot"):
+    import atexit
     import io
     import logging.config
     from os.path import join
@@ -138,13 +139,20 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_queue import LogQueue
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
         logging.setLogRecordFactory(StructLogRecord)
         logging.setLoggerClass(StructLogger)
+        # Handles the queued records before the handlers are closed on exit
+        atexit.register(LogQueue.get_instance().stop)
         STRUCT_LOGGER_SET = True
 
+    # The queued records are handled before dictConfig closes the handlers of the previous configuration
+    log_queue = LogQueue.get_instance()
+    log_queue.stop()
+
     # Do not raise exceptions during log handling
     logging.raiseExceptions = False
 
@@ -162,6 +170,8 @@ def init_logging(conf_filename: str,
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
         logging.config.dictConfig(config_dict)
+    # The handlers run on the logging thread, so logging doesn't block the event loop with their I/O
+    log_queue.start([logging.getLogger()] + [logging.getLogger(name) for name in config_dict.get("loggers", {})])
 
 
 def get_strategy_list() -> List[str]:
@@ -65,6 +65,7 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_events",
                              "mqtt_external_events",
                              "mqtt_autostart",
+                             "mqtt_loop_metrics",
                              "instance_id",
                              "send_error_logs",
                              "ethereum_chain_name",
@@ -667,7 +667,7 @@ class GatewayCommand(GatewayChainApiManager):
         if exchange_name in self._market:
             return await self._update_balances(self._market[exchange_name])
         else:
-            await Security.wait_til_decryption_done()
+            await Security.wait_til_connector_decryption_done(exchange_name)
             api_keys = Security.api_keys(
                 exchange_name) if not is_gateway_markets else {}
             return await self.add_gateway_exchange(exchange_name, client_config_map, **api_keys)
@@ -154,7 +154,7 @@ class StatusCommand:
             self.notify('  - Strategy check: Please import or create a strategy.')
             return False
 
-        if not Security.is_decryption_done():
+        if not all(Security.is_connector_decryption_done(str(exchange)) for exchange in required_exchanges):
             self.notify('  - Security check: Encrypted files are being processed. Please wait and try again later.')
             return False
 
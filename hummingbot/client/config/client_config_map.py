@@ -136,6 +136,14 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_loop_metrics: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable event loop lag and task metrics in the MQTT status updates"
+            ),
+        ),
+    )
 
     class Config:
         title = "mqtt_bridge"
@@ -317,6 +325,52 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_market_data_socket: Optional[str] = Field(
+        default=None,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the socket path of a paper trade market data service to get the market data from, shared with"
+                " other bots (leave empty to connect to the exchanges directly)"
+            ),
+        ),
+    )
+    paper_trade_queue_position_fills: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Fill paper trade limit orders only after the order book queue ahead of them is traded (Yes/No)?"
+            ),
+        ),
+    )
+    paper_trade_order_entry_latency_ms: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the mean latency of the paper trade limit orders reaching the order book in ms",
+        ),
+    )
+    paper_trade_order_entry_latency_std_ms: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the standard deviation of the paper trade order entry latency in ms",
+        ),
+    )
+    paper_trade_cancel_latency_ms: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the mean latency of the paper trade order cancellations in ms",
+        ),
+    )
+    paper_trade_cancel_latency_std_ms: float = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the standard deviation of the paper trade cancel latency in ms",
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
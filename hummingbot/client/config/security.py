@@ -1,7 +1,10 @@
 import asyncio
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -25,6 +28,12 @@ class Security:
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
     _decryption_done = asyncio.Event()
+    _connectors_decryption_done: Dict[str, asyncio.Event] = {}
+    # The connectors with an encrypted config file, None until the files are listed
+    _encrypted_connectors: Optional[Set[str]] = None
+    _decryption_lock = threading.Lock()
+    # The event loop of the decryption waiters, decrypt_all runs on an executor thread after login
+    _ev_loop: Optional[asyncio.AbstractEventLoop] = None
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -52,18 +61,48 @@ class Security:
         if not validate_password(secrets_manager):
             return False
         cls.secrets_manager = secrets_manager
+        cls._ev_loop = asyncio.get_event_loop()
         coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
         safe_ensure_future(coro)
         return True
 
     @classmethod
     def decrypt_all(cls):
-        cls._secure_configs.clear()
-        cls._decryption_done.clear()
+        """
+        Decrypts the connector config files on a thread pool, the key derivation of each secret value releases the GIL.
+        The decryption of each connector is signalled as soon as its config is loaded.
+        """
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
-        cls._decryption_done.set()
+        with cls._decryption_lock:
+            cls._secure_configs.clear()
+            cls._decryption_done.clear()
+            cls._encrypted_connectors = {connector_name_from_file(file) for file in encrypted_files}
+            for connector_name, decryption_done in cls._connectors_decryption_done.items():
+                if connector_name in cls._encrypted_connectors:
+                    decryption_done.clear()
+                else:
+                    decryption_done.set()
+        if len(encrypted_files) > 0:
+            with ThreadPoolExecutor(max_workers=min(len(encrypted_files), os.cpu_count() or 1)) as executor:
+                futures = {executor.submit(cls.decrypt_connector_config, file): file for file in encrypted_files}
+                for future in as_completed(futures):
+                    connector_name = connector_name_from_file(futures[future])
+                    if future.exception() is not None:
+                        cls.logger().error(f"Error decrypting the {connector_name} config.", exc_info=future.exception())
+                    with cls._decryption_lock:
+                        cls._set_decryption_done(cls._connector_decryption_done(connector_name))
+        with cls._decryption_lock:
+            cls._set_decryption_done(cls._decryption_done)
+            for decryption_done in cls._connectors_decryption_done.values():
+                cls._set_decryption_done(decryption_done)
+
+    @classmethod
+    def _set_decryption_done(cls, decryption_done: asyncio.Event):
+        # asyncio events are not thread safe, the ones set off the main thread are set on the loop of their waiters
+        if threading.current_thread() != threading.main_thread() and cls._ev_loop is not None:
+            cls._ev_loop.call_soon_threadsafe(decryption_done.set)
+        else:
+            decryption_done.set()
 
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
@@ -101,6 +140,33 @@ class Security:
     async def wait_til_decryption_done(cls):
         await cls._decryption_done.wait()
 
+    @classmethod
+    def is_connector_decryption_done(cls, connector_name: str) -> bool:
+        """
+        Whether the config of the connector is decrypted, or the connector has no encrypted config.
+        """
+        with cls._decryption_lock:
+            return cls._connector_decryption_done(connector_name).is_set()
+
+    @classmethod
+    async def wait_til_connector_decryption_done(cls, connector_name: str):
+        with cls._decryption_lock:
+            decryption_done = cls._connector_decryption_done(connector_name)
+        await decryption_done.wait()
+
+    @classmethod
+    def _connector_decryption_done(cls, connector_name: str) -> asyncio.Event:
+        # Called with the decryption lock held
+        decryption_done = cls._connectors_decryption_done.get(connector_name)
+        if decryption_done is None:
+            decryption_done = asyncio.Event()
+            if (cls._decryption_done.is_set()
+                    or connector_name in cls._secure_configs
+                    or (cls._encrypted_connectors is not None and connector_name not in cls._encrypted_connectors)):
+                decryption_done.set()
+            cls._connectors_decryption_done[connector_name] = decryption_done
+        return decryption_done
+
     @classmethod
     def api_keys(cls, connector_name: str) -> Dict[str, Optional[str]]:
         connector_config = cls.decrypted_value(connector_name)
@@ -1,16 +1,18 @@
+import hashlib
 import importlib
 import json
+import logging
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot import data_path, get_strategy_list, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
 if TYPE_CHECKING:
@@ -58,6 +60,11 @@ GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
 
+# Metadata of the connectors read from their utils modules, to skip importing them all at startup
+CONNECTOR_SETTINGS_CACHE_FILE_NAME = "connector_settings_cache.json"
+# Changes when the format of the cached connector settings changes
+CONNECTOR_SETTINGS_CACHE_FORMAT = 1
+
 
 class ConnectorType(Enum):
     """
@@ -358,6 +365,35 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class ConnectorConfigKeysReference(NamedTuple):
+    """
+    The location of the config keys of a connector in its utils module, KEYS or OTHER_DOMAINS_KEYS for a sub domain.
+    """
+    utils_module_path: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        util_module = importlib.import_module(self.utils_module_path)
+        if self.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+
+
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    A connector setting read from the connector settings cache. Its config keys hold a reference to their utils module,
+    which is imported only when they are used.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = tuple.__getitem__(self, ConnectorSetting._fields.index("config_keys"))
+        if isinstance(config_keys, ConnectorConfigKeysReference):
+            return config_keys.load()
+        return config_keys
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
@@ -366,32 +402,27 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+
+        The settings read from the connector utils modules are cached in the data directory. While the cache is valid
+        they are read from it, and the utils module of a connector is only imported when its config keys are used.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+        connector_dirs = cls._connector_dirs()
+        cache_key = cls._connector_settings_cache_key(connector_dirs)
+        cached_settings = cls._load_connector_settings_cache(cache_key)
+        if cached_settings is not None:
+            cls.all_connector_settings.update(cached_settings)
+        else:
+            config_keys_references: Dict[str, Optional[ConnectorConfigKeysReference]] = {}
+            all_utils_modules_imported = True
+            for type_name, connector_dir in connector_dirs:
                 try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
+                    util_module_path: str = f"hummingbot.connector.{type_name}." \
                                             f"{connector_dir.name}.{connector_dir.name}_utils"
                     util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
+                except ModuleNotFoundError as e:
+                    # A connector missing a dependency is not cached, it is added once the dependency is installed
+                    all_utils_modules_imported = all_utils_modules_imported and e.name == util_module_path
                     continue
                 trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
                 trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
@@ -399,7 +430,7 @@ class AllConnectorSettings:
                 )
                 cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
                     name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
+                    type=ConnectorType[type_name.capitalize()],
                     centralised=getattr(util_module, "CENTRALIZED", True),
                     example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
                     use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
@@ -410,6 +441,10 @@ class AllConnectorSettings:
                     domain_parameter=None,
                     use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
                 )
+                config_keys_references[connector_dir.name] = (
+                    ConnectorConfigKeysReference(util_module_path)
+                    if getattr(util_module, "KEYS", None) is not None else None
+                )
                 # Adds other domains of connector
                 other_domains = getattr(util_module, "OTHER_DOMAINS", [])
                 for domain in other_domains:
@@ -429,6 +464,12 @@ class AllConnectorSettings:
                         domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
                         use_eth_gas_lookup=parent.use_eth_gas_lookup,
                     )
+                    config_keys_references[domain] = (
+                        ConnectorConfigKeysReference(util_module_path, domain)
+                        if cls.all_connector_settings[domain].config_keys is not None else None
+                    )
+            if all_utils_modules_imported:
+                cls._save_connector_settings_cache(cache_key, config_keys_references)
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -459,18 +500,12 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # Replaced from the base settings to keep their config keys unloaded until they are used
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -548,6 +583,131 @@ class AllConnectorSettings:
     def get_example_assets(cls) -> Dict[str, str]:
         return {name: cs.example_pair.split("-")[0] for name, cs in cls.get_connector_settings().items()}
 
+    @classmethod
+    def connector_settings_cache_path(cls) -> str:
+        return join(data_path(), CONNECTOR_SETTINGS_CACHE_FILE_NAME)
+
+    @staticmethod
+    def _connector_dirs() -> List[Tuple[str, DirEntry]]:
+        """
+        The connector directories, with the name of their connector type directory.
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        connector_names: Set[str] = set()
+        connector_dirs: List[Tuple[str, DirEntry]] = []
+        for type_dir in type_dirs:
+            if type_dir.name == 'gateway':
+                continue
+            for connector_dir in scandir(type_dir.path):
+                if (not connector_dir.is_dir() or not exists(join(connector_dir.path, "__init__.py"))
+                        or connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions):
+                    continue
+                if connector_dir.name in connector_names:
+                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+                connector_names.add(connector_dir.name)
+                connector_dirs.append((type_dir.name, cast(DirEntry, connector_dir)))
+        return connector_dirs
+
+    @staticmethod
+    def _connector_settings_cache_key(connector_dirs: List[Tuple[str, DirEntry]]) -> str:
+        """
+        Changes with the Hummingbot version and whenever a Python file of a connector directory is modified, as the
+        utils modules read values from the other modules of their connector.
+        """
+        with open(root_path() / "hummingbot" / "VERSION") as version_file:
+            version = version_file.read().strip()
+        connector_files = sorted(
+            (f"{type_name}/{connector_dir.name}/{f.name}", f.stat().st_mtime)
+            for type_name, connector_dir in connector_dirs
+            for f in scandir(connector_dir.path)
+            if f.is_file() and f.name.endswith(".py")
+        )
+        key_data = json.dumps([CONNECTOR_SETTINGS_CACHE_FORMAT, version, connector_files])
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    @classmethod
+    def _load_connector_settings_cache(cls, cache_key: str) -> Optional[Dict[str, ConnectorSetting]]:
+        cache_path = cls.connector_settings_cache_path()
+        if not exists(cache_path):
+            return None
+        try:
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("key") != cache_key:
+                return None
+            return {
+                name: cls._connector_setting_from_json(setting_json)
+                for name, setting_json in cache["connectors"].items()
+            }
+        except Exception:
+            logging.getLogger(__name__).warning(
+                f"Invalid connector settings cache {cache_path}, the connector settings are created again.",
+                exc_info=True)
+            return None
+
+    @classmethod
+    def _save_connector_settings_cache(
+        cls, cache_key: str, config_keys_references: Dict[str, Optional[ConnectorConfigKeysReference]]
+    ):
+        cache_path = cls.connector_settings_cache_path()
+        try:
+            cache = {
+                "key": cache_key,
+                "connectors": {
+                    name: cls._connector_setting_to_json(setting, config_keys_references[name])
+                    for name, setting in cls.all_connector_settings.items()
+                },
+            }
+            with open(cache_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+        except Exception:
+            logging.getLogger(__name__).warning(f"Could not write the connector settings cache {cache_path}.",
+                                                exc_info=True)
+
+    @staticmethod
+    def _connector_setting_to_json(
+        setting: ConnectorSetting, config_keys_reference: Optional[ConnectorConfigKeysReference]
+    ) -> Dict[str, Any]:
+        setting_json = setting._asdict()
+        trade_fee_schema = setting.trade_fee_schema
+        setting_json.update({
+            "type": setting.type.name,
+            "trade_fee_schema": {
+                "percent_fee_token": trade_fee_schema.percent_fee_token,
+                "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+                "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+                "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+                "maker_fixed_fees": [token_amount.to_json() for token_amount in trade_fee_schema.maker_fixed_fees],
+                "taker_fixed_fees": [token_amount.to_json() for token_amount in trade_fee_schema.taker_fixed_fees],
+            },
+            "config_keys": config_keys_reference._asdict() if config_keys_reference is not None else None,
+        })
+        return setting_json
+
+    @staticmethod
+    def _connector_setting_from_json(setting_json: Dict[str, Any]) -> ConnectorSetting:
+        trade_fee_schema_json = setting_json["trade_fee_schema"]
+        config_keys_json = setting_json["config_keys"]
+        return LazyConnectorSetting(**{
+            **setting_json,
+            "type": ConnectorType[setting_json["type"]],
+            "trade_fee_schema": TradeFeeSchema(
+                percent_fee_token=trade_fee_schema_json["percent_fee_token"],
+                maker_percent_fee_decimal=Decimal(trade_fee_schema_json["maker_percent_fee_decimal"]),
+                taker_percent_fee_decimal=Decimal(trade_fee_schema_json["taker_percent_fee_decimal"]),
+                buy_percent_fee_deducted_from_returns=trade_fee_schema_json["buy_percent_fee_deducted_from_returns"],
+                maker_fixed_fees=[TokenAmount.from_json(fee) for fee in trade_fee_schema_json["maker_fixed_fees"]],
+                taker_fixed_fees=[TokenAmount.from_json(fee) for fee in trade_fee_schema_json["taker_fixed_fees"]],
+            ),
+            "config_keys": ConnectorConfigKeysReference(**config_keys_json) if config_keys_json is not None else None,
+        })
+
     @staticmethod
     def _validate_trade_fee_schema(
         exchange_name: str, trade_fee_schema: Optional[Union[TradeFeeSchema, List[float]]]
@@ -29,6 +29,7 @@ ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
+WS_MAX_STREAMS_PER_REQUEST = 200
 
 # Binance params
 
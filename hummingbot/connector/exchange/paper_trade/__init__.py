@@ -1,12 +1,21 @@
-from typing import List
+from typing import List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
-from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.market_data_service_data_source import (
+    MarketDataServiceOrderBookDataSource,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import LatencyModel, PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
-def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
+def get_order_book_tracker(connector_name: str,
+                           trading_pairs: List[str],
+                           market_data_socket: Optional[str] = None) -> OrderBookTracker:
+    if market_data_socket is not None:
+        return OrderBookTracker(
+            data_source=MarketDataServiceOrderBookDataSource(trading_pairs, connector_name, market_data_socket),
+            trading_pairs=trading_pairs)
     conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
     try:
         connector_instance = conn_setting.non_trading_connector_instance_with_default_configuration(
@@ -16,9 +25,24 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
         raise Exception(f"Connector {connector_name} OrderBookTracker class not found ({exception})")
 
 
+def get_latency_model(mean_ms: float, std_ms: float) -> Optional[LatencyModel]:
+    return LatencyModel(mean_ms / 1e3, std_ms / 1e3) if mean_ms > 0 else None
+
+
 def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
-    tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
-    return PaperTradeExchange(client_config_map,
-                              tracker,
-                              get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+    paper_trade_config = client_config_map.paper_trade
+    tracker = get_order_book_tracker(connector_name=exchange_name,
+                                     trading_pairs=trading_pairs,
+                                     market_data_socket=paper_trade_config.paper_trade_market_data_socket)
+    market = PaperTradeExchange(client_config_map,
+                                tracker,
+                                get_connector_class(exchange_name),
+                                exchange_name=exchange_name)
+    market.set_fill_simulation(
+        queue_position=paper_trade_config.paper_trade_queue_position_fills,
+        order_entry_latency=get_latency_model(paper_trade_config.paper_trade_order_entry_latency_ms,
+                                              paper_trade_config.paper_trade_order_entry_latency_std_ms),
+        cancel_latency=get_latency_model(paper_trade_config.paper_trade_cancel_latency_ms,
+                                         paper_trade_config.paper_trade_cancel_latency_std_ms),
+    )
+    return market
@@ -0,0 +1,191 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.exchange.paper_trade import get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.market_data_service_data_source import (
+    MARKET_DATA_SERVICE_MESSAGE_LIMIT,
+    MARKET_DATA_SERVICE_SOCKET_PATH,
+    encode_service_message,
+    order_book_message_to_json,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class PaperTradeMarketDataService:
+    """
+    Local service sharing the market data connections of the paper trade bots of a host.
+
+    The service keeps order book trackers per connector, for all the trading pairs its clients subscribed to, and
+    relays the order book messages the trackers receive to the clients subscribed to their trading pairs. The trading
+    pairs a client adds get their own tracker, so the order books the other clients follow are never rebuilt. Clients are
+    paper trade connectors using MarketDataServiceOrderBookDataSource, which connect through a unix socket, so the
+    exchange connections scale with the markets traded by the bots instead of with the number of bots. Each bot still
+    matches its own orders against its copy of the order books, as it keeps its own balances.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 socket_path: str = MARKET_DATA_SERVICE_SOCKET_PATH,
+                 order_book_tracker_factory: Callable[[str, List[str]], OrderBookTracker] = get_order_book_tracker,
+                 max_client_buffer_size: int = 2 ** 26):
+        self._socket_path = socket_path
+        self._order_book_tracker_factory = order_book_tracker_factory
+        self._max_client_buffer_size = max_client_buffer_size
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._order_book_trackers: Dict[str, List[OrderBookTracker]] = defaultdict(list)
+        self._trading_pair_trackers: Dict[Tuple[str, str], OrderBookTracker] = {}
+        self._subscribers: Dict[Tuple[str, str], Set[asyncio.StreamWriter]] = defaultdict(set)
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    @property
+    def order_book_trackers(self) -> Dict[str, List[OrderBookTracker]]:
+        return self._order_book_trackers
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # Left by a service that didn't stop cleanly
+            os.remove(self._socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_client,
+                                                       path=self._socket_path,
+                                                       limit=MARKET_DATA_SERVICE_MESSAGE_LIMIT)
+        self.logger().info(f"Paper trade market data service listening on {self._socket_path}.")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for writers in self._subscribers.values():
+            for writer in writers:
+                writer.close()
+        self._subscribers.clear()
+        for order_book_trackers in self._order_book_trackers.values():
+            for order_book_tracker in order_book_trackers:
+                order_book_tracker.stop()
+        self._order_book_trackers.clear()
+        self._trading_pair_trackers.clear()
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connector_name = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request = json.loads(line)
+                if request["type"] == "subscribe":
+                    connector_name = request["connector"]
+                    self._subscribe(writer, connector_name, request["trading_pairs"])
+                else:
+                    safe_ensure_future(self._respond(writer, connector_name, request))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error reading the requests of a paper trade market data client.",
+                                exc_info=True)
+        finally:
+            self._unsubscribe(writer)
+            writer.close()
+
+    def _subscribe(self, writer: asyncio.StreamWriter, connector_name: str, trading_pairs: List[str]):
+        new_trading_pairs = sorted({trading_pair for trading_pair in trading_pairs
+                                    if (connector_name, trading_pair) not in self._trading_pair_trackers})
+        if len(new_trading_pairs) > 0:
+            # Order book trackers have a fixed set of trading pairs. The new ones get their own tracker, restarting the
+            # tracker of the others would leave the order books of their subscribers out of sync.
+            order_book_tracker = self._order_book_tracker_factory(connector_name, new_trading_pairs)
+            order_book_tracker.add_message_listener(functools.partial(self._relay_message, connector_name))
+            order_book_tracker.start()
+            self._order_book_trackers[connector_name].append(order_book_tracker)
+            for trading_pair in new_trading_pairs:
+                self._trading_pair_trackers[(connector_name, trading_pair)] = order_book_tracker
+            self.logger().info(f"Tracking the {connector_name} order books of {', '.join(new_trading_pairs)}.")
+        for trading_pair in trading_pairs:
+            self._subscribers[(connector_name, trading_pair)].add(writer)
+
+    def _unsubscribe(self, writer: asyncio.StreamWriter):
+        for writers in self._subscribers.values():
+            writers.discard(writer)
+
+    def _relay_message(self, connector_name: str, message: OrderBookMessage):
+        writers = self._subscribers.get((connector_name, message.trading_pair))
+        if not writers:
+            return
+        data = encode_service_message(order_book_message_to_json(message))
+        for writer in list(writers):
+            self._write(writer, data)
+
+    def _write(self, writer: asyncio.StreamWriter, data: bytes):
+        if writer.is_closing():
+            return
+        if writer.transport.get_write_buffer_size() > self._max_client_buffer_size:
+            self.logger().warning("Disconnecting a paper trade market data client that is not reading its messages.")
+            self._unsubscribe(writer)
+            writer.close()
+            return
+        writer.write(data)
+
+    async def _respond(self, writer: asyncio.StreamWriter, connector_name: Optional[str], request: Dict[str, Any]):
+        response = {"type": "response", "request_id": request["request_id"]}
+        try:
+            if connector_name is None:
+                raise ValueError("The client has to subscribe to a connector before sending requests.")
+            if request["type"] == "snapshot":
+                order_book = await self._wait_order_book(connector_name, request["trading_pair"])
+                response["result"] = order_book_message_to_json(self._snapshot(order_book, request["trading_pair"]))
+            elif request["type"] == "last_traded_prices":
+                order_books = {trading_pair: self._order_book(connector_name, trading_pair)
+                               for trading_pair in request["trading_pairs"]}
+                response["result"] = {trading_pair: order_book.last_trade_price
+                                      for trading_pair, order_book in order_books.items()
+                                      if order_book is not None}
+            else:
+                raise ValueError(f"Unknown request type {request['type']}.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            response["error"] = str(exception)
+        self._write(writer, encode_service_message(response))
+
+    def _order_book(self, connector_name: str, trading_pair: str) -> Optional[OrderBook]:
+        order_book_tracker = self._trading_pair_trackers.get((connector_name, trading_pair))
+        return order_book_tracker.order_books.get(trading_pair) if order_book_tracker is not None else None
+
+    async def _wait_order_book(self, connector_name: str, trading_pair: str) -> OrderBook:
+        if (connector_name, trading_pair) not in self._trading_pair_trackers:
+            raise ValueError(f"The client is not subscribed to {trading_pair}.")
+        # The order book is added once the tracker got its snapshot from the exchange
+        while True:
+            order_book = self._order_book(connector_name, trading_pair)
+            if order_book is not None:
+                return order_book
+            await asyncio.sleep(0.5)
+
+    @staticmethod
+    def _snapshot(order_book: OrderBook, trading_pair: str) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+            "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+            "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+        }, timestamp=time.time())
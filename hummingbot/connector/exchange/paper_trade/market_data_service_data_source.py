@@ -0,0 +1,150 @@
+import asyncio
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+MARKET_DATA_SERVICE_SOCKET_PATH = os.path.join(data_path(), "paper_trade_market_data.sock")
+# Size limit of a message, which has to fit the snapshots of deep order books
+MARKET_DATA_SERVICE_MESSAGE_LIMIT = 2 ** 24
+
+
+def encode_service_message(data: Dict[str, Any]) -> bytes:
+    """
+    Encodes a message of the market data service protocol, a JSON object per line.
+    """
+    return (json.dumps(data, default=str) + "\n").encode("utf8")
+
+
+def order_book_message_to_json(message: OrderBookMessage) -> Dict[str, Any]:
+    return {
+        "type": "message",
+        "message_type": message.type.value,
+        "content": message.content,
+        "timestamp": message.timestamp,
+    }
+
+
+def order_book_message_from_json(data: Dict[str, Any]) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType(data["message_type"]), data["content"], data["timestamp"])
+
+
+class MarketDataServiceOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source of a paper trade connector that reads the market data from a PaperTradeMarketDataService
+    instead of connecting to the exchange.
+
+    The service relays the order book messages it receives from the exchange, which are applied to the order books by
+    the order book tracker as usual, and answers the order book snapshot and last traded prices requests from its own
+    order books.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 connector_name: str,
+                 socket_path: str = MARKET_DATA_SERVICE_SOCKET_PATH):
+        super().__init__(trading_pairs)
+        self._connector_name = connector_name
+        self._socket_path = socket_path
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = asyncio.Event()
+        self._pending_requests: Dict[int, asyncio.Future] = {}
+        self._last_request_id = 0
+
+    @property
+    def connector_name(self) -> str:
+        return self._connector_name
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return await self._request("last_traded_prices", trading_pairs=trading_pairs)
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the market data service, subscribes to the trading pairs and routes the messages it sends to their
+        queues. Reconnects when the service is restarted.
+        """
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_unix_connection(self._socket_path,
+                                                                          limit=MARKET_DATA_SERVICE_MESSAGE_LIMIT)
+                self._writer.write(encode_service_message({
+                    "type": "subscribe",
+                    "connector": self._connector_name,
+                    "trading_pairs": self._trading_pairs,
+                }))
+                self._connected.set()
+                await self._process_service_messages(reader)
+            except asyncio.CancelledError:
+                raise
+            except OSError as exception:
+                self.logger().warning(f"The connection to the paper trade market data service at {self._socket_path} "
+                                      f"failed ({exception}). Retrying in 5 seconds...")
+            except Exception:
+                self.logger().exception("Unexpected error reading from the paper trade market data service. "
+                                        "Retrying in 5 seconds...")
+            finally:
+                self._disconnect()
+            await self._sleep(5.0)
+
+    async def _process_service_messages(self, reader: asyncio.StreamReader):
+        queue_keys = {
+            OrderBookMessageType.SNAPSHOT: self._snapshot_messages_queue_key,
+            OrderBookMessageType.DIFF: self._diff_messages_queue_key,
+            OrderBookMessageType.TRADE: self._trade_messages_queue_key,
+        }
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("The market data service closed the connection.")
+            data = json.loads(line)
+            if data["type"] == "response":
+                self._resolve_request(data)
+            else:
+                message = order_book_message_from_json(data)
+                self._message_queue[queue_keys[message.type]].put_nowait(message)
+
+    async def _request(self, request_type: str, **params) -> Any:
+        await self._connected.wait()
+        self._last_request_id += 1
+        request_id = self._last_request_id
+        future = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = future
+        try:
+            self._writer.write(encode_service_message({"type": request_type, "request_id": request_id, **params}))
+            return await future
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+    def _resolve_request(self, response: Dict[str, Any]):
+        future = self._pending_requests.get(response["request_id"])
+        if future is None or future.done():
+            return
+        if "error" in response:
+            future.set_exception(IOError(f"The market data service request failed ({response['error']})."))
+        else:
+            future.set_result(response["result"])
+
+    def _disconnect(self):
+        self._connected.clear()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for future in self._pending_requests.values():
+            if not future.done():
+                future.set_exception(ConnectionError("The connection to the market data service was lost."))
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return order_book_message_from_json(await self._request("snapshot", trading_pair=trading_pair))
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        # The messages are parsed by the data source of the service
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
@@ -0,0 +1,184 @@
+import json
+import os
+from typing import IO, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+# Columns of the order book file, one row per price level of a snapshot or diff message. The last three columns are
+# the [price, amount, update_id] layout expected by OrderBook.apply_numpy_snapshot and apply_numpy_diffs.
+BOOK_TIMESTAMP, BOOK_KIND, BOOK_SIDE, BOOK_PRICE, BOOK_AMOUNT, BOOK_UPDATE_ID = range(6)
+BOOK_COLUMNS = 6
+# Columns of the trades file, one row per trade
+TRADE_TIMESTAMP, TRADE_PRICE, TRADE_AMOUNT, TRADE_SIDE = range(4)
+TRADE_COLUMNS = 4
+
+SNAPSHOT, DIFF = 0, 1
+BID, ASK = 0, 1
+BUY, SELL = 0, 1
+
+
+class OrderBookRecording:
+    """
+    Recorded order book messages and trades of a trading pair, stored as binary files of float64 rows sorted by
+    timestamp.
+
+    The files are memory mapped, so only the pages of the time range being replayed are read from disk and recordings
+    of several days of tick data can be replayed without loading them in memory. A message is a run of consecutive
+    order book rows with the same timestamp, kind (snapshot or diff) and update id.
+    """
+
+    def __init__(self, path: str, trading_pair: str):
+        self._path = path
+        self._trading_pair = trading_pair
+        self._book = self._memmap(self.book_file(path, trading_pair), BOOK_COLUMNS)
+        self._trades = self._memmap(self.trades_file(path, trading_pair), TRADE_COLUMNS)
+
+    @staticmethod
+    def book_file(path: str, trading_pair: str) -> str:
+        return os.path.join(path, f"{trading_pair}_order_book.bin")
+
+    @staticmethod
+    def trades_file(path: str, trading_pair: str) -> str:
+        return os.path.join(path, f"{trading_pair}_trades.bin")
+
+    @staticmethod
+    def _memmap(file_path: str, n_columns: int) -> np.ndarray:
+        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            return np.empty((0, n_columns))
+        return np.memmap(file_path, dtype=np.float64, mode="r").reshape(-1, n_columns)
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def book(self) -> np.ndarray:
+        return self._book
+
+    @property
+    def trades(self) -> np.ndarray:
+        return self._trades
+
+    @property
+    def start_time(self) -> float:
+        timestamps = [data[0, 0] for data in (self._book, self._trades) if len(data) > 0]
+        return min(timestamps) if len(timestamps) > 0 else np.nan
+
+    @property
+    def end_time(self) -> float:
+        timestamps = [data[-1, 0] for data in (self._book, self._trades) if len(data) > 0]
+        return max(timestamps) if len(timestamps) > 0 else np.nan
+
+    def book_index_after(self, timestamp: float) -> int:
+        """
+        Returns the index of the first order book row after the timestamp.
+        """
+        return int(np.searchsorted(self._book[:, BOOK_TIMESTAMP], timestamp, side="right"))
+
+    def trades_index_after(self, timestamp: float) -> int:
+        """
+        Returns the index of the first trade after the timestamp.
+        """
+        return int(np.searchsorted(self._trades[:, TRADE_TIMESTAMP], timestamp, side="right"))
+
+    def message_starts(self, start: int, end: int) -> np.ndarray:
+        """
+        Returns the index of the first row of each order book message in the range of rows.
+        """
+        rows = self._book[start:end]
+        if len(rows) == 0:
+            return np.empty(0, dtype=int)
+        keys = rows[:, [BOOK_TIMESTAMP, BOOK_KIND, BOOK_UPDATE_ID]]
+        return start + np.flatnonzero(np.r_[True, np.any(keys[1:] != keys[:-1], axis=1)])
+
+
+class OrderBookRecordingWriter:
+    """
+    Appends order book messages and trades of a trading pair to a recording. Rows are buffered and flushed to the end
+    of the files, so a recording can be written while streaming through days of data.
+    """
+
+    def __init__(self, path: str, trading_pair: str, buffer_size: int = 100000):
+        os.makedirs(path, exist_ok=True)
+        self._buffer_size = buffer_size
+        self._book_file: IO = open(OrderBookRecording.book_file(path, trading_pair), "ab")
+        self._trades_file: IO = open(OrderBookRecording.trades_file(path, trading_pair), "ab")
+        self._book_rows: List[np.ndarray] = []
+        self._book_buffered_rows = 0
+        self._trade_rows: List[Sequence[float]] = []
+
+    def __enter__(self) -> "OrderBookRecordingWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add_snapshot(self, timestamp: float, bids: Sequence[Sequence[float]], asks: Sequence[Sequence[float]],
+                     update_id: int):
+        self._add_book_message(timestamp, SNAPSHOT, bids, asks, update_id)
+
+    def add_diff(self, timestamp: float, bids: Sequence[Sequence[float]], asks: Sequence[Sequence[float]],
+                 update_id: int):
+        self._add_book_message(timestamp, DIFF, bids, asks, update_id)
+
+    def add_trade(self, timestamp: float, price: float, amount: float, is_buy: bool):
+        self._trade_rows.append((timestamp, price, amount, BUY if is_buy else SELL))
+        if len(self._trade_rows) >= self._buffer_size:
+            self.flush()
+
+    def _add_book_message(self, timestamp: float, kind: int, bids: Sequence[Sequence[float]],
+                          asks: Sequence[Sequence[float]], update_id: int):
+        levels = [np.asarray(levels, dtype=np.float64).reshape(-1, 2) for levels in (bids, asks)]
+        rows = np.empty((len(levels[0]) + len(levels[1]), BOOK_COLUMNS))
+        rows[:, BOOK_TIMESTAMP] = timestamp
+        rows[:, BOOK_KIND] = kind
+        rows[:len(levels[0]), BOOK_SIDE] = BID
+        rows[len(levels[0]):, BOOK_SIDE] = ASK
+        rows[:, BOOK_PRICE:BOOK_AMOUNT + 1] = np.vstack(levels)
+        rows[:, BOOK_UPDATE_ID] = update_id
+        self._book_rows.append(rows)
+        self._book_buffered_rows += len(rows)
+        if self._book_buffered_rows >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        if len(self._book_rows) > 0:
+            self._book_file.write(np.vstack(self._book_rows).tobytes())
+            self._book_rows = []
+            self._book_buffered_rows = 0
+        if len(self._trade_rows) > 0:
+            self._trades_file.write(np.asarray(self._trade_rows, dtype=np.float64).tobytes())
+            self._trade_rows = []
+        self._book_file.flush()
+        self._trades_file.flush()
+
+    def close(self):
+        self.flush()
+        self._book_file.close()
+        self._trades_file.close()
+
+
+def convert_downloaded_order_book_and_trades(order_book_file_path: str,
+                                             trades_file_path: Optional[str],
+                                             path: str,
+                                             trading_pair: str) -> OrderBookRecording:
+    """
+    Converts the JSON lines files written by the download_order_book_and_trades script to a recording. The files are
+    read line by line, so their size is not limited by the available memory.
+    """
+    with OrderBookRecordingWriter(path, trading_pair) as writer:
+        with open(order_book_file_path, "r") as file:
+            for update_id, snapshot in enumerate(_iter_json_lines(file), start=1):
+                writer.add_snapshot(snapshot["ts"], snapshot["bids"], snapshot["asks"], update_id)
+        if trades_file_path is not None:
+            with open(trades_file_path, "r") as file:
+                for trade in _iter_json_lines(file):
+                    writer.add_trade(trade["ts"], trade["price"], trade["q_base"], trade["side"] == "buy")
+    return OrderBookRecording(path, trading_pair)
+
+
+def _iter_json_lines(file: IO) -> Iterator[Dict]:
+    for line in file:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
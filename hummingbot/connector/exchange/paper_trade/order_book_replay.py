@@ -0,0 +1,224 @@
+import math
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.order_book_recording import (
+    BID,
+    BOOK_AMOUNT,
+    BOOK_KIND,
+    BOOK_PRICE,
+    BOOK_SIDE,
+    BOOK_TIMESTAMP,
+    BOOK_UPDATE_ID,
+    BUY,
+    SNAPSHOT,
+    TRADE_AMOUNT,
+    TRADE_PRICE,
+    TRADE_SIDE,
+    TRADE_TIMESTAMP,
+    OrderBookRecording,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+# Number of rows read at a time when looking backwards for the last snapshot before the start of the replay
+SNAPSHOT_SEARCH_WINDOW = 65536
+
+
+class OrderBookReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of the replayed order books. The messages are applied by OrderBookReplay, so nothing is listened.
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        raise NotImplementedError("Replayed order books are created from the recording.")
+
+    async def listen_for_subscriptions(self):
+        pass
+
+
+class OrderBookReplayTracker(OrderBookTracker):
+    """
+    Order book tracker of the replayed order books, always ready and without network tasks.
+    """
+
+    def __init__(self, order_books: Dict[str, OrderBook]):
+        super().__init__(data_source=OrderBookReplayDataSource(list(order_books.keys())),
+                         trading_pairs=list(order_books.keys()))
+        self._order_books.update(order_books)
+        self._order_books_initialized.set()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class OrderBookReplay(PyTimeIterator):
+    """
+    Replays recorded order book messages and trades into OrderBook instances under a backtesting clock.
+
+    On every tick the messages and trades recorded up to the tick timestamp are applied in timestamp order. Trades are
+    applied to the order books, so the limit orders of a paper trade exchange using them (see OrderBookReplayExchange)
+    are filled by the recorded trades that cross them. The replay has to be added to the clock before the exchange and
+    the strategy, so both see the market of the current tick.
+
+    The recordings are memory mapped and read one tick at a time. When the replay starts in the middle of a recording,
+    the order books are rebuilt from the last snapshot before the start instead of replaying the previous diffs.
+    """
+
+    def __init__(self, recordings: List[OrderBookRecording]):
+        super().__init__()
+        self._recordings: Dict[str, OrderBookRecording] = {recording.trading_pair: recording
+                                                           for recording in recordings}
+        self._order_books: Dict[str, CompositeOrderBook] = {trading_pair: CompositeOrderBook()
+                                                            for trading_pair in self._recordings}
+        self._book_positions: Dict[str, Optional[int]] = {trading_pair: None for trading_pair in self._recordings}
+        self._trade_positions: Dict[str, Optional[int]] = {trading_pair: None for trading_pair in self._recordings}
+        self._order_book_tracker = OrderBookReplayTracker(self._order_books)
+
+    @property
+    def order_books(self) -> Dict[str, CompositeOrderBook]:
+        return self._order_books
+
+    @property
+    def order_book_tracker(self) -> OrderBookReplayTracker:
+        return self._order_book_tracker
+
+    @property
+    def recordings(self) -> Dict[str, OrderBookRecording]:
+        return self._recordings
+
+    def tick(self, timestamp: float):
+        for trading_pair in self._recordings:
+            self.replay_until(trading_pair, timestamp)
+
+    def next_event_time(self, timestamp: float) -> float:
+        """
+        Returns the time of the next recorded order book message or trade, so a clock skipping idle ticks jumps to it.
+        """
+        next_event_time = math.inf
+        for trading_pair, recording in self._recordings.items():
+            book_position = self._book_positions[trading_pair]
+            trade_position = self._trade_positions[trading_pair]
+            if book_position is None:
+                return timestamp
+            if book_position < len(recording.book):
+                next_event_time = min(next_event_time, recording.book[book_position, BOOK_TIMESTAMP])
+            if trade_position < len(recording.trades):
+                next_event_time = min(next_event_time, recording.trades[trade_position, TRADE_TIMESTAMP])
+        return float(next_event_time)
+
+    def replay_until(self, trading_pair: str, timestamp: float):
+        """
+        Applies the order book messages and trades of the trading pair recorded up to the timestamp.
+        """
+        recording = self._recordings[trading_pair]
+        order_book = self._order_books[trading_pair]
+        book_end = recording.book_index_after(timestamp)
+        trades_end = recording.trades_index_after(timestamp)
+        if self._book_positions[trading_pair] is None:
+            self._book_positions[trading_pair] = self._last_snapshot_start(recording, book_end)
+            # Trades before the start of the replay can't fill any order
+            self._trade_positions[trading_pair] = recording.trades_index_after(recording.book[
+                self._book_positions[trading_pair], BOOK_TIMESTAMP]) if book_end > 0 else trades_end
+
+        message_starts = recording.message_starts(self._book_positions[trading_pair], book_end)
+        message_ends = np.r_[message_starts[1:], book_end]
+        trades = recording.trades[self._trade_positions[trading_pair]:trades_end]
+        trade_index = 0
+        for message_start, message_end in zip(message_starts, message_ends):
+            message_timestamp = recording.book[message_start, BOOK_TIMESTAMP]
+            while trade_index < len(trades) and trades[trade_index, TRADE_TIMESTAMP] < message_timestamp:
+                self._apply_trade(order_book, trading_pair, trades[trade_index])
+                trade_index += 1
+            self._apply_message(order_book, recording.book[message_start:message_end])
+        for trade in trades[trade_index:]:
+            self._apply_trade(order_book, trading_pair, trade)
+        self._book_positions[trading_pair] = book_end
+        self._trade_positions[trading_pair] = trades_end
+
+    @staticmethod
+    def _last_snapshot_start(recording: OrderBookRecording, end: int) -> int:
+        """
+        Returns the index of the first row of the last snapshot message before the end row, or 0 if there is none.
+        """
+        window_end = end
+        while window_end > 0:
+            window_start = max(0, window_end - SNAPSHOT_SEARCH_WINDOW)
+            snapshot_rows = np.flatnonzero(recording.book[window_start:window_end, BOOK_KIND] == SNAPSHOT)
+            if len(snapshot_rows) > 0:
+                last_snapshot_row = window_start + snapshot_rows[-1]
+                starts = recording.message_starts(max(0, last_snapshot_row - SNAPSHOT_SEARCH_WINDOW),
+                                                  last_snapshot_row + 1)
+                return int(starts[-1])
+            window_end = window_start
+        return 0
+
+    @staticmethod
+    def _apply_message(order_book: OrderBook, rows: np.ndarray):
+        is_bid = rows[:, BOOK_SIDE] == BID
+        columns = [BOOK_PRICE, BOOK_AMOUNT, BOOK_UPDATE_ID]
+        bids = np.ascontiguousarray(rows[is_bid][:, columns])
+        asks = np.ascontiguousarray(rows[~is_bid][:, columns])
+        if rows[0, BOOK_KIND] == SNAPSHOT:
+            order_book.apply_numpy_snapshot(bids, asks)
+        else:
+            order_book.apply_numpy_diffs(bids, asks)
+
+    @staticmethod
+    def _apply_trade(order_book: OrderBook, trading_pair: str, trade: np.ndarray):
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=trading_pair,
+            timestamp=float(trade[TRADE_TIMESTAMP]),
+            type=TradeType.BUY if trade[TRADE_SIDE] == BUY else TradeType.SELL,
+            price=float(trade[TRADE_PRICE]),
+            amount=float(trade[TRADE_AMOUNT]),
+        ))
+
+
+class OrderBookReplayExchange(PaperTradeExchange):
+    """
+    Paper trade exchange that matches the orders of a strategy against replayed order books and trades.
+
+    The exchange name is used to get the trading fees, so it should be the name of the exchange where the data was
+    recorded. Trading pairs are in the Hummingbot format in the recordings.
+    """
+
+    def __init__(self, client_config_map: "ClientConfigAdapter", exchange_name: str, replay: OrderBookReplay):
+        super().__init__(client_config_map, replay.order_book_tracker, OrderBookReplayExchange, exchange_name)
+        self._replay = replay
+        # The replayed order books exist from the start, so the trading pairs are set up when checking if it's ready
+        if not self.ready:
+            raise ValueError("The replay has no recordings to trade on.")
+
+    @property
+    def replay(self) -> OrderBookReplay:
+        return self._replay
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> str:
+        return exchange_trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
+        return hb_trading_pair
+
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
@@ -40,6 +40,13 @@ cdef class PaperTradeExchange(ExchangeBase):
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
         str _exchange_name
+        double _last_limit_order_timestamp
+        dict _on_hold_balances
+        bint _fill_simulation
+        bint _queue_position_fills
+        object _order_entry_latency
+        object _cancel_latency
+        dict _limit_order_queue_states
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -57,6 +64,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                               LimitOrders *limit_orders_map_ptr,
                               LimitOrdersIterator *map_it_ptr,
                               const SingleTradingPairLimitOrdersIterator orders_it)
+    cdef c_update_on_hold_balance(self,
+                                  bint is_buy,
+                                  str base_asset,
+                                  str quote_asset,
+                                  object price,
+                                  object quantity,
+                                  bint release)
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
@@ -75,6 +89,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef bint c_is_limit_order_active(self, const CPPLimitOrder *cpp_limit_order_ptr)
+    cdef bint c_consume_queue_ahead(self, const CPPLimitOrder *cpp_limit_order_ptr, double trade_amount)
+    cdef c_update_queue_positions(self)
+    cdef c_process_pending_cancels(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
@@ -110,6 +110,107 @@ cdef class QueuedOrder:
                 f"{self.amount})")
 
 
+cdef class LatencyModel:
+    """
+    Distribution of the time an exchange takes to act on a request, in seconds. Latencies are sampled from a lognormal
+    distribution with the given mean and standard deviation, or are constant when the standard deviation is 0.
+    """
+    cdef:
+        double _mean
+        double _std
+        double _mu
+        double _sigma
+        object _random
+
+    def __init__(self, mean: float, std: float = 0.0, seed: Optional[int] = None):
+        if mean < 0 or std < 0:
+            raise ValueError("The mean and standard deviation of a latency can't be negative.")
+        self._mean = mean
+        self._std = std
+        self._random = random.Random(seed)
+        if mean > 0 and std > 0:
+            self._sigma = math.sqrt(math.log(1 + (std / mean) ** 2))
+            self._mu = math.log(mean) - self._sigma ** 2 / 2
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def std(self) -> float:
+        return self._std
+
+    cdef double c_sample(self):
+        if self._mean == 0 or self._std == 0:
+            return self._mean
+        return self._random.lognormvariate(self._mu, self._sigma)
+
+    def sample(self) -> float:
+        return self.c_sample()
+
+    def __repr__(self) -> str:
+        return f"LatencyModel({self._mean}, {self._std})"
+
+
+cdef class LimitOrderQueueState:
+    """
+    Simulated state of a paper limit order on the exchange: when it reaches the order book, the amount queued ahead of
+    it at its price level, the amount traded at its price once it's at the front of the queue, and when its pending
+    cancellation is processed.
+    """
+    cdef:
+        str _trading_pair
+        bint _is_buy
+        double _price
+        double _quantity
+        double _active_timestamp
+        double _cancel_timestamp
+        double _queue_ahead
+        double _traded_volume
+
+    def __init__(self, trading_pair: str, is_buy: bool, price: float, quantity: float, active_timestamp: float):
+        self._trading_pair = trading_pair
+        self._is_buy = is_buy
+        self._price = price
+        self._quantity = quantity
+        self._active_timestamp = active_timestamp
+        self._cancel_timestamp = math.nan
+        self._queue_ahead = math.nan
+        self._traded_volume = 0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def is_buy(self) -> bint:
+        return self._is_buy
+
+    @property
+    def active_timestamp(self) -> float:
+        return self._active_timestamp
+
+    @property
+    def cancel_timestamp(self) -> float:
+        return self._cancel_timestamp
+
+    @property
+    def queue_ahead(self) -> float:
+        return self._queue_ahead
+
+    @property
+    def traded_volume(self) -> float:
+        return self._traded_volume
+
+    def __repr__(self) -> str:
+        return (f"LimitOrderQueueState('{self._trading_pair}', {self._is_buy}, {self._price}, {self._quantity}, "
+                f"{self._active_timestamp}, {self._cancel_timestamp}, {self._queue_ahead}, {self._traded_volume})")
+
+
+cdef double sample_latency(object latency_model):
+    return (<LatencyModel>latency_model).c_sample() if latency_model is not None else 0
+
+
 cdef class OrderBookTradeListener(EventListener):
     cdef:
         ExchangeBase _market
@@ -165,9 +266,16 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._exchange_name = exchange_name
         self._account_balances = {}
         self._account_available_balances = {}
+        self._on_hold_balances = {}
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._queued_orders = deque()
+        self._last_limit_order_timestamp = math.nan
+        self._fill_simulation = False
+        self._queue_position_fills = False
+        self._order_entry_latency = None
+        self._cancel_latency = None
+        self._limit_order_queue_states = {}
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
@@ -199,6 +307,27 @@ cdef class PaperTradeExchange(ExchangeBase):
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
 
+    def set_fill_simulation(self,
+                            queue_position: bool,
+                            order_entry_latency: Optional[LatencyModel] = None,
+                            cancel_latency: Optional[LatencyModel] = None):
+        """
+        Configures how realistically the limit orders placed from now on are filled.
+
+        With queue_position, a limit order joins the end of the queue of its price level in the order book. The amount
+        ahead of it is taken from the order book depth, shrinks as the level does, and is consumed by the trades at
+        its price. The order is filled once the trades at its price after the queue ahead is consumed add up to its
+        amount. Orders are always filled when a trade goes through their price or the opposite side of the order book
+        reaches it.
+
+        The latencies delay when new limit orders reach the order book and when cancellations take effect. An order
+        can be filled until its cancellation takes effect.
+        """
+        self._queue_position_fills = queue_position
+        self._order_entry_latency = order_entry_latency
+        self._cancel_latency = cancel_latency
+        self._fill_simulation = queue_position or order_entry_latency is not None or cancel_latency is not None
+
     #  <editor-fold desc="Property">
     @property
     def trading_pair(self) -> Dict[str, TradingPair]:
@@ -242,6 +371,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def limit_order_queue_states(self) -> Dict[str, LimitOrderQueueState]:
+        return self._limit_order_queue_states
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         cdef:
@@ -276,20 +409,12 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
-        _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
-        return _available_balances
+        return {currency: balance - self._on_hold_balances.get(currency, s_decimal_0)
+                for currency, balance in self._account_balances.items()}
 
     # </editor-fold>
 
@@ -318,7 +443,30 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        if self._fill_simulation:
+            self.c_process_pending_cancels()
         self.c_process_crossed_limit_orders()
+        if self._queue_position_fills:
+            self.c_update_queue_positions()
+
+    cdef double c_next_event_time(self, double timestamp):
+        # Market orders are executed after a delay, and new limit orders are matched against the order book in the
+        # next tick. Resting limit orders only change when the order books do, which their data sources report, or
+        # when their simulated entry or cancel latencies elapse.
+        cdef:
+            double next_event_time = math.inf
+            LimitOrderQueueState queue_state
+
+        if self._last_limit_order_timestamp >= timestamp:
+            return timestamp
+        if len(self._queued_orders) > 0:
+            next_event_time = (<QueuedOrder>self._queued_orders[0]).create_timestamp + self.TRADE_EXECUTION_DELAY
+        for queue_state in self._limit_order_queue_states.values():
+            if queue_state._active_timestamp > timestamp:
+                next_event_time = min(next_event_time, queue_state._active_timestamp)
+            if queue_state._cancel_timestamp > timestamp:
+                next_event_time = min(next_event_time, queue_state._cancel_timestamp)
+        return next_event_time
 
     cdef str c_buy(self,
                    str trading_pair_str,
@@ -349,6 +497,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
+            self._last_limit_order_timestamp = self._current_timestamp
 
             map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
 
@@ -370,6 +519,19 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self.c_update_on_hold_balance(True,
+                                          self._trading_pairs[trading_pair_str].base_asset,
+                                          quote_asset,
+                                          quantized_price,
+                                          quantized_amount,
+                                          False)
+            if self._fill_simulation:
+                self._limit_order_queue_states[order_id] = LimitOrderQueueState(
+                    trading_pair_str,
+                    True,
+                    float(quantized_price),
+                    float(quantized_amount),
+                    self._current_timestamp + sample_latency(self._order_entry_latency))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -410,6 +572,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
+            self._last_limit_order_timestamp = self._current_timestamp
             map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
 
             if map_it == self._ask_limit_orders.end():
@@ -430,6 +593,19 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self.c_update_on_hold_balance(False,
+                                          base_asset,
+                                          self._trading_pairs[trading_pair_str].quote_asset,
+                                          quantized_price,
+                                          quantized_amount,
+                                          False)
+            if self._fill_simulation:
+                self._limit_order_queue_states[order_id] = LimitOrderQueueState(
+                    trading_pair_str,
+                    False,
+                    float(quantized_price),
+                    float(quantized_amount),
+                    self._current_timestamp + sample_latency(self._order_entry_latency))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -628,7 +804,16 @@ cdef class PaperTradeExchange(ExchangeBase):
                               const SingleTradingPairLimitOrdersIterator orders_it):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
         try:
+            self.c_update_on_hold_balance(cpp_limit_order_ptr.getIsBuy(),
+                                          cpp_limit_order_ptr.getBaseCurrency().decode("utf8"),
+                                          cpp_limit_order_ptr.getQuoteCurrency().decode("utf8"),
+                                          <object>cpp_limit_order_ptr.getPrice(),
+                                          <object>cpp_limit_order_ptr.getQuantity(),
+                                          True)
+            if len(self._limit_order_queue_states) > 0:
+                self._limit_order_queue_states.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -637,6 +822,27 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_update_on_hold_balance(self,
+                                  bint is_buy,
+                                  str base_asset,
+                                  str quote_asset,
+                                  object price,
+                                  object quantity,
+                                  bint release):
+        """
+        Puts on hold, or releases, the balance a limit order takes from the available balance while it's open.
+        """
+        cdef:
+            str currency = quote_asset if is_buy else base_asset
+            object amount = quantity * price if is_buy else quantity
+            object on_hold_balance = self._on_hold_balances.get(currency, s_decimal_0)
+
+        on_hold_balance = on_hold_balance - amount if release else on_hold_balance + amount
+        if on_hold_balance == s_decimal_0:
+            self._on_hold_balances.pop(currency, None)
+        else:
+            self._on_hold_balances[currency] = on_hold_balance
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
@@ -858,20 +1064,84 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+                if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
+    cdef bint c_is_limit_order_active(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        """
+        Returns whether the limit order has reached the order book, after the simulated order entry latency.
+        """
+        cdef:
+            LimitOrderQueueState queue_state
+        if not self._fill_simulation:
+            return True
+        queue_state = self._limit_order_queue_states.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"))
+        return queue_state is None or queue_state._active_timestamp <= self._current_timestamp
+
+    cdef bint c_consume_queue_ahead(self, const CPPLimitOrder *cpp_limit_order_ptr, double trade_amount):
+        """
+        Consumes the queue ahead of the limit order with a trade at its price, and returns whether the trades at its
+        price after the queue ahead was consumed add up to the order amount.
+        """
+        cdef:
+            LimitOrderQueueState queue_state = self._limit_order_queue_states.get(
+                cpp_limit_order_ptr.getClientOrderID().decode("utf8"))
+            double executed_amount
+        if queue_state is None:
+            return False
+        if math.isnan(queue_state._queue_ahead):
+            # The order reached the order book after the last tick
+            queue_state._queue_ahead = self.c_get_order_book(queue_state._trading_pair).c_get_amount_at_price(
+                queue_state._is_buy, queue_state._price)
+        executed_amount = trade_amount - queue_state._queue_ahead
+        queue_state._queue_ahead = max(0.0, queue_state._queue_ahead - trade_amount)
+        if executed_amount > 0:
+            queue_state._traded_volume += executed_amount
+        return queue_state._traded_volume >= queue_state._quantity
+
+    cdef c_update_queue_positions(self):
+        """
+        Sets the queue ahead of the limit orders that reached the order book to the amount at their price level, and
+        shrinks the queue ahead of the resting ones when their price level gets smaller than it.
+        """
+        cdef:
+            LimitOrderQueueState queue_state
+            double level_amount
+        for queue_state in self._limit_order_queue_states.values():
+            if queue_state._active_timestamp > self._current_timestamp:
+                continue
+            level_amount = self.c_get_order_book(queue_state._trading_pair).c_get_amount_at_price(
+                queue_state._is_buy, queue_state._price)
+            if math.isnan(queue_state._queue_ahead) or level_amount < queue_state._queue_ahead:
+                queue_state._queue_ahead = level_amount
+
+    cdef c_process_pending_cancels(self):
+        cdef:
+            LimitOrderQueueState queue_state
+            list cancelled_order_ids = [order_id
+                                        for order_id, queue_state in self._limit_order_queue_states.items()
+                                        if queue_state._cancel_timestamp <= self._current_timestamp]
+        for order_id in cancelled_order_ids:
+            queue_state = self._limit_order_queue_states[order_id]
+            self.c_cancel_order_from_orders_map(
+                address(self._bid_limit_orders) if queue_state._is_buy else address(self._ask_limit_orders),
+                queue_state._trading_pair,
+                False,
+                order_id)
+
     cdef c_process_crossed_limit_orders(self):
         cdef:
             LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
@@ -893,7 +1163,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
-        Trigger limit orders when incoming market orders have crossed the limit order's price.
+        Trigger limit orders when incoming market orders have crossed the limit order's price. When simulating queue
+        positions, the trades at the limit order's price consume the queue ahead of it and then fill it.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -901,7 +1172,9 @@ cdef class PaperTradeExchange(ExchangeBase):
             string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
             object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            double trade_quantity = order_book_trade_event.amount
+            bint at_price_fills = self._queue_position_fills
+            object limit_order_price
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -920,18 +1193,26 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                limit_order_price = <object>cpp_limit_order_ptr.getPrice()
+                if limit_order_price < trade_price or (limit_order_price == trade_price and not at_price_fills):
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if self.c_is_limit_order_active(cpp_limit_order_ptr) and (
+                        limit_order_price != trade_price
+                        or self.c_consume_queue_ahead(cpp_limit_order_ptr, trade_quantity)):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                limit_order_price = <object>cpp_limit_order_ptr.getPrice()
+                if limit_order_price > trade_price or (limit_order_price == trade_price and not at_price_fills):
                     break
-                process_order_its.push_back(orders_it)
+                if self.c_is_limit_order_active(cpp_limit_order_ptr) and (
+                        limit_order_price != trade_price
+                        or self.c_consume_queue_ahead(cpp_limit_order_ptr, trade_quantity)):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
@@ -940,7 +1221,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._on_hold_balances.get(currency, s_decimal_0)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cdef:
@@ -1007,6 +1291,13 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
+            LimitOrderQueueState queue_state = self._limit_order_queue_states.get(client_order_id)
+            double cancel_latency = sample_latency(self._cancel_latency) if queue_state is not None else 0
+        if queue_state is not None and cancel_latency > 0:
+            # The order is cancelled in the first tick after the cancel latency, and can be filled until then
+            if math.isnan(queue_state._cancel_timestamp):
+                queue_state._cancel_timestamp = self._current_timestamp + cancel_latency
+            return
         self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
 
     cdef object c_get_fee(self,
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -22,6 +22,8 @@ class TimeSynchronizer:
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        # Computed when a sample is added, since the offset is read for every signed request
+        self._cached_time_offset_ms: Optional[float] = None
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -32,20 +34,19 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
-            offset = (self._time() - self._current_seconds_counter()) * 1e3
-        else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
-
-        return offset
+        if self._cached_time_offset_ms is None:
+            return (self._time() - self._current_seconds_counter()) * 1e3
+        return self._cached_time_offset_ms
 
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        self._cached_time_offset_ms = float(numpy.mean([median, weighted_average]))
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._cached_time_offset_ms = None
 
     def time(self) -> float:
         """
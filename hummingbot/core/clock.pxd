@@ -10,3 +10,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _skip_idle_ticks
+        dict _tick_intervals
+        dict _next_ticks
+        dict _tick_stats
+        long _tick_overruns
+
+    cdef double c_next_backtest_tick(self, double timestamp)
+    cdef bint c_is_tick_due(self, object iterator)
+    cdef c_record_tick_duration(self, object iterator, double duration)
@@ -2,17 +2,42 @@
 
 import asyncio
 import logging
+import math
 import time
-from typing import List
+from typing import List, Optional, Tuple
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.pubsub import deliver_batched_events
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+class IteratorTickStats:
+    """
+    Durations of the ticks of a clock iterator, in seconds, and the number of ticks that took longer than the clock
+    tick size.
+    """
+    __slots__ = ("ticks", "total_duration", "max_duration", "last_duration", "overruns")
+
+    def __init__(self):
+        self.ticks = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration = 0.0
+        self.overruns = 0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.ticks if self.ticks > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"IteratorTickStats(ticks={self.ticks}, average_duration={self.average_duration:.6f}, "
+                f"max_duration={self.max_duration:.6f}, overruns={self.overruns})")
+
+
 cdef class Clock:
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -21,12 +46,19 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 skip_idle_ticks: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param skip_idle_ticks: (back testing mode only) jump to the next tick at or after the earliest next event time
+        reported by the child iterators, instead of ticking them every tick_size
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +68,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._skip_idle_ticks = skip_idle_ticks
+        # Keyed by the id of the iterators, which are kept referenced by the clock
+        self._tick_intervals = {}
+        self._next_ticks = {}
+        self._tick_stats = {}
+        self._tick_overruns = 0
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -49,6 +87,10 @@ cdef class Clock:
     def tick_size(self) -> float:
         return self._tick_size
 
+    @property
+    def skip_idle_ticks(self) -> bool:
+        return self._skip_idle_ticks
+
     @property
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
@@ -57,6 +99,25 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_overruns(self) -> int:
+        """
+        (real time mode only) Number of ticks for which ticking all the iterators took longer than tick_size.
+        """
+        return self._tick_overruns
+
+    @property
+    def tick_stats(self) -> List[Tuple[TimeIterator, IteratorTickStats]]:
+        """
+        (real time mode only) Tick durations of the child iterators, to find the ones making the clock miss ticks.
+        """
+        return [(iterator, self._tick_stats[id(iterator)])
+                for iterator in self._child_iterators
+                if id(iterator) in self._tick_stats]
+
+    def get_tick_interval(self, iterator: TimeIterator) -> Optional[float]:
+        return self._tick_intervals.get(id(iterator))
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,7 +130,14 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_interval: Optional[float] = None):
+        """
+        :param iterator: the iterator to tick
+        :param tick_interval: ticks the iterator only once every tick_interval seconds, at the first tick at or after
+        each multiple of the interval, for the iterators that don't need to run as often as the clock ticks
+        """
+        if tick_interval is not None and tick_interval > self._tick_size:
+            self._tick_intervals[id(iterator)] = tick_interval
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
@@ -81,6 +149,9 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_intervals.pop(id(iterator), None)
+        self._next_ticks.pop(id(iterator), None)
+        self._tick_stats.pop(id(iterator), None)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +161,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            double iterator_tick_start
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -113,8 +186,12 @@ cdef class Clock:
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
+                tick_start = time.perf_counter()
                 for ci in self._current_context:
                     child_iterator = ci
+                    if len(self._tick_intervals) > 0 and not self.c_is_tick_due(child_iterator):
+                        continue
+                    iterator_tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,6 +199,10 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    self.c_record_tick_duration(child_iterator, time.perf_counter() - iterator_tick_start)
+                deliver_batched_events()
+                if time.perf_counter() - tick_start > self._tick_size:
+                    self._tick_overruns += 1
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -138,15 +219,21 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if self._skip_idle_ticks:
+                    self._current_tick = self.c_next_backtest_tick(timestamp)
+                else:
+                    self._current_tick += self._tick_size
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if len(self._tick_intervals) > 0 and not self.c_is_tick_due(child_iterator):
+                        continue
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                deliver_batched_events()
         except StopIteration:
             return
         finally:
@@ -154,5 +241,58 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef double c_next_backtest_tick(self, double timestamp):
+        """
+        Returns the first tick at or after the earliest next event time of the child iterators, without going past the
+        first tick at or after the timestamp. Ticks are kept on the same grid as when ticking every tick_size.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double next_tick = self._current_tick + self._tick_size
+            double next_event_time = math.inf
+            double iterator_event_time
+            double ticks_to_skip
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            iterator_event_time = child_iterator.c_next_event_time(self._current_tick)
+            if id(child_iterator) in self._next_ticks:
+                iterator_event_time = max(iterator_event_time, self._next_ticks[id(child_iterator)])
+            next_event_time = min(next_event_time, iterator_event_time)
+            if next_event_time <= next_tick:
+                return next_tick
+        if not math.isnan(timestamp):
+            next_event_time = min(next_event_time, timestamp)
+        elif math.isinf(next_event_time):
+            # None of the iterators has anything left to do and there is no end to go to
+            raise StopIteration
+        ticks_to_skip = math.ceil((next_event_time - self._current_tick) / self._tick_size)
+        return self._current_tick + ticks_to_skip * self._tick_size
+
+    cdef bint c_is_tick_due(self, object iterator):
+        cdef:
+            object tick_interval = self._tick_intervals.get(id(iterator))
+            double interval
+        if tick_interval is None:
+            return True
+        if self._current_tick < self._next_ticks.get(id(iterator), -math.inf):
+            return False
+        interval = tick_interval
+        self._next_ticks[id(iterator)] = (self._current_tick // interval + 1) * interval
+        return True
+
+    cdef c_record_tick_duration(self, object iterator, double duration):
+        stats = self._tick_stats.get(id(iterator))
+        if stats is None:
+            stats = IteratorTickStats()
+            self._tick_stats[id(iterator)] = stats
+        stats.ticks += 1
+        stats.total_duration += duration
+        stats.last_duration = duration
+        if duration > stats.max_duration:
+            stats.max_duration = duration
+        if duration > self._tick_size:
+            stats.overruns += 1
+
     def backtest(self):
         self.backtest_til(self._end_time)
@@ -457,6 +457,17 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef double c_get_amount_at_price(self, bint is_bid, double price):
+        """
+        Returns the amount resting at the price level of the bid or ask side, or 0 if there is no such level.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -475,6 +486,9 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_amount_at_price(self, is_bid: bool, price: float) -> float:
+        return self.c_get_amount_at_price(is_bid, price)
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
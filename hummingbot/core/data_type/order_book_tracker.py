@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -45,6 +45,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._message_listeners: List[Callable[[OrderBookMessage], None]] = []
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -75,6 +76,20 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def add_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        """
+        Adds a function called with every diff, snapshot and trade message received from the data source, when the
+        message is routed to its order book.
+        """
+        self._message_listeners.append(listener)
+
+    def _notify_message_listeners(self, message: OrderBookMessage):
+        for listener in self._message_listeners:
+            try:
+                listener(message)
+            except Exception:
+                self.logger().error("Unexpected error notifying an order book message listener.", exc_info=True)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -198,6 +213,8 @@ class OrderBookTracker:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                if len(self._message_listeners) > 0:
+                    self._notify_message_listeners(ob_message)
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
@@ -243,6 +260,8 @@ class OrderBookTracker:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                if len(self._message_listeners) > 0:
+                    self._notify_message_listeners(ob_message)
                 if trading_pair not in self._tracking_message_queues:
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
@@ -304,6 +323,8 @@ class OrderBookTracker:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
                 trading_pair: str = trade_message.trading_pair
+                if len(self._message_listeners) > 0:
+                    self._notify_message_listeners(trade_message)
 
                 if trading_pair not in self._order_books:
                     messages_rejected += 1
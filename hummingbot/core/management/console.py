@@ -46,8 +46,13 @@ class MergedNamespace(MutableMappingABC):
 
 
 def add_diagnosis_tools(local_vars: MutableMapping):
-    from .diagnosis import active_tasks
+    from .diagnosis import active_tasks, task_census
+    from .loop_monitor import EventLoopMonitor
+    loop_monitor = EventLoopMonitor.get_instance()
+    loop_monitor.start()
     local_vars["active_tasks"] = active_tasks
+    local_vars["task_census"] = task_census
+    local_vars["loop_monitor"] = loop_monitor
 
 
 def ensure_key():
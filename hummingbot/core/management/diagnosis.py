@@ -21,14 +21,15 @@ def get_coro_name(coro: Union[Coroutine, Generator]) -> str:
 
 
 def get_wrapped_coroutine(t: asyncio.Task) -> Union[Coroutine, Generator]:
-    if "safe_wrapper" in str(t):
-        return t.get_coro().cr_frame.f_locals["c"]
+    coro = t.get_coro()
+    if "safe_wrapper" in str(t) and getattr(coro, "cr_frame", None) is not None:
+        return coro.cr_frame.f_locals["c"]
     else:
-        return t.get_coro()
+        return coro
 
 
 def active_tasks() -> pd.DataFrame:
-    tasks: List[asyncio.Task] = [t for t in asyncio.Task.all_tasks() if not t.done()]
+    tasks: List[asyncio.Task] = [t for t in asyncio.all_tasks() if not t.done()]
     coroutines: List[Union[Coroutine, Generator]] = [get_wrapped_coroutine(t) for t in tasks]
     func_names: List[str] = [get_coro_name(c) for c in coroutines]
     retval: pd.DataFrame = pd.DataFrame([{"func_name": f, "coroutine": c, "task": t}
@@ -36,3 +37,14 @@ def active_tasks() -> pd.DataFrame:
                                         columns=["func_name", "coroutine", "task"]).set_index("func_name")
     retval.sort_index(inplace=True)
     return retval
+
+
+def task_census() -> pd.DataFrame:
+    """
+    Counts the active tasks by coroutine name, the most frequent first.
+    """
+    func_names: List[str] = [get_coro_name(get_wrapped_coroutine(t)) for t in asyncio.all_tasks() if not t.done()]
+    retval: pd.DataFrame = pd.DataFrame({"func_name": func_names, "count": 1},
+                                        columns=["func_name", "count"]).groupby("func_name").count()
+    retval.sort_values("count", ascending=False, inplace=True, kind="stable")
+    return retval
@@ -0,0 +1,179 @@
+import asyncio
+import bisect
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.management.diagnosis import task_census
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Upper bounds, in milliseconds, of the buckets of the loop lag histogram
+LOOP_LAG_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1000, 5000, float("inf"))
+
+
+class SlowCallbackHandler(logging.Handler):
+    """
+    Collects the slow callbacks reported by the asyncio logger when the event loop runs in debug mode.
+    """
+
+    def __init__(self, max_records: int):
+        super().__init__(level=logging.WARNING)
+        self.slow_callbacks: Deque[Tuple[float, str, float]] = deque(maxlen=max_records)
+
+    def emit(self, record: logging.LogRecord):
+        # asyncio reports them as "Executing %s took %.3f seconds"
+        if (isinstance(record.msg, str) and record.msg.startswith("Executing")
+                and isinstance(record.args, tuple) and len(record.args) == 2):
+            self.slow_callbacks.append((record.created, str(record.args[0]), float(record.args[1])))
+
+
+class EventLoopMonitor:
+    """
+    Samples the lag of the event loop, the delay between the time a sleeping coroutine is scheduled to wake up and
+    the time it actually runs, which grows when callbacks block the loop. The lags of the last samples are kept in a
+    rolling histogram.
+
+    The monitor can also report the slow callbacks detected by asyncio debug mode, which names the callbacks blocking
+    the loop, at the cost of the debug mode overhead.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["EventLoopMonitor"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "EventLoopMonitor":
+        if cls._shared_instance is None:
+            cls._shared_instance = EventLoopMonitor()
+        return cls._shared_instance
+
+    def __init__(self, sampling_interval: float = 0.5, window_size: int = 7200):
+        """
+        :param sampling_interval: seconds between two lag samples
+        :param window_size: number of samples kept in the rolling histogram, an hour by default
+        """
+        self._sampling_interval = sampling_interval
+        self._lags: Deque[float] = deque(maxlen=window_size)
+        self._histogram: List[int] = [0] * len(LOOP_LAG_BUCKETS_MS)
+        self._max_lag = 0.0
+        self._sampling_task: Optional[asyncio.Task] = None
+        self._slow_callback_handler: Optional[SlowCallbackHandler] = None
+
+    @property
+    def started(self) -> bool:
+        return self._sampling_task is not None
+
+    @property
+    def last_lag(self) -> float:
+        return self._lags[-1] if len(self._lags) > 0 else 0.0
+
+    @property
+    def max_lag(self) -> float:
+        """
+        The largest lag since the monitor started, in seconds.
+        """
+        return self._max_lag
+
+    @property
+    def slow_callbacks_reported(self) -> bool:
+        return self._slow_callback_handler is not None
+
+    def start(self):
+        if self._sampling_task is None:
+            self._sampling_task = safe_ensure_future(self._sampling_loop())
+
+    def stop(self):
+        if self._sampling_task is not None:
+            self._sampling_task.cancel()
+            self._sampling_task = None
+        self.disable_slow_callback_report()
+
+    def record_lag(self, lag: float):
+        if len(self._lags) == self._lags.maxlen:
+            self._histogram[self._bucket(self._lags[0])] -= 1
+        self._lags.append(lag)
+        self._histogram[self._bucket(lag)] += 1
+        self._max_lag = max(self._max_lag, lag)
+
+    def lag_histogram(self) -> Dict[str, int]:
+        """
+        Counts the samples of the rolling window by lag bucket, labelled by their upper bound in milliseconds.
+        """
+        return {(f"<={bound:g}ms" if bound != float("inf") else "inf"): count
+                for bound, count in zip(LOOP_LAG_BUCKETS_MS, self._histogram)}
+
+    def lag_percentile(self, percentile: float) -> float:
+        if len(self._lags) == 0:
+            return 0.0
+        lags = sorted(self._lags)
+        return lags[min(len(lags) - 1, int(len(lags) * percentile / 100))]
+
+    def enable_slow_callback_report(self, slow_callback_duration: float = 0.1, max_records: int = 100):
+        """
+        Turns on asyncio debug mode, which logs the callbacks running longer than slow_callback_duration seconds, and
+        keeps the last ones reported.
+        """
+        loop = asyncio.get_event_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = slow_callback_duration
+        if self._slow_callback_handler is None:
+            self._slow_callback_handler = SlowCallbackHandler(max_records)
+            logging.getLogger("asyncio").addHandler(self._slow_callback_handler)
+
+    def disable_slow_callback_report(self):
+        if self._slow_callback_handler is not None:
+            logging.getLogger("asyncio").removeHandler(self._slow_callback_handler)
+            self._slow_callback_handler = None
+            asyncio.get_event_loop().set_debug(False)
+
+    def slow_callbacks(self) -> List[Tuple[float, str, float]]:
+        """
+        The last slow callbacks reported, as (timestamp, callback, duration in seconds), the most recent last.
+        """
+        if self._slow_callback_handler is None:
+            return []
+        return list(self._slow_callback_handler.slow_callbacks)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Summary of the loop lag, in milliseconds, and of the running tasks, as published in the MQTT status updates.
+        """
+        census = task_census()
+        metrics = {
+            "loop_lag_ms": {
+                "last": self.last_lag * 1e3,
+                "p50": self.lag_percentile(50) * 1e3,
+                "p99": self.lag_percentile(99) * 1e3,
+                "max": self._max_lag * 1e3,
+                "histogram": self.lag_histogram(),
+            },
+            "tasks": {
+                "total": int(census["count"].sum()),
+                "top": dict(zip(census.index[:10], (int(count) for count in census["count"][:10]))),
+            },
+        }
+        if self._slow_callback_handler is not None:
+            metrics["slow_callbacks"] = len(self._slow_callback_handler.slow_callbacks)
+        return metrics
+
+    async def _sampling_loop(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                scheduled_time = loop.time() + self._sampling_interval
+                await asyncio.sleep(self._sampling_interval)
+                self.record_lag(max(0.0, loop.time() - scheduled_time))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error sampling the event loop lag.", exc_info=True)
+                await asyncio.sleep(self._sampling_interval)
+
+    @staticmethod
+    def _bucket(lag: float) -> int:
+        return bisect.bisect_left(LOOP_LAG_BUCKETS_MS, lag * 1e3)
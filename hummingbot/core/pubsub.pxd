@@ -7,21 +7,32 @@ from libcpp.utility cimport pair
 from hummingbot.core.PyRef cimport PyRef
 from hummingbot.core.event.event_listener cimport EventListener
 
-ctypedef unordered_set[PyRef] EventListenersCollection
-ctypedef unordered_set[PyRef].iterator EventListenersIterator
-ctypedef unordered_map[int64_t, EventListenersCollection] Events
-ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
-ctypedef pair[int64_t, EventListenersCollection] EventsPair
+ctypedef unordered_map[int64_t, PyRef] EventListenerTuples
+ctypedef unordered_map[int64_t, PyRef].iterator EventListenerTuplesIterator
+ctypedef pair[int64_t, PyRef] EventListenerTuplesPair
 
 
 cdef class PubSub:
     cdef:
-        Events _events
+        dict _events
+        EventListenerTuples _listener_tuples
+        dict _batch_events
+        dict _batch_listener_tuples
+        unordered_set[int64_t] _batched_event_tags
+        dict _pending_batches
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
-    cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_add_batch_listener(self, int64_t event_tag, EventListener listener)
+    cdef c_remove_batch_listener(self, int64_t event_tag, EventListener listener)
+    cdef c_remove_collected_listener(self, int64_t event_tag, bint batch, object listener_weakref)
+    cdef c_update_listener_tuple(self, int64_t event_tag)
+    cdef c_update_batch_listener_tuple(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
+    cdef c_get_batch_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_add_to_batch(self, int64_t event_tag, object arg)
+    cdef c_deliver_batches(self)
+    cdef c_call_listeners(self, int64_t event_tag, tuple listener_weakrefs, object arg)
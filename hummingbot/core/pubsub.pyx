@@ -6,15 +6,11 @@ from cpython cimport(
     PyWeakref_NewRef,
     PyWeakref_GetObject
 )
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
+from cython.operator cimport dereference as deref
+import asyncio
 from enum import Enum
+import functools
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -22,28 +18,91 @@ from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
 
 class_logger = None
+# PubSubs with event batches to deliver, and whether their delivery is scheduled on the event loop
+cdef list _pubsubs_with_pending_batches = []
+cdef bint _batches_delivery_scheduled = False
+
+
+def _remove_collected_listener(object pubsub_weakref, int64_t event_tag, bint batch, object listener_weakref):
+    pubsub = pubsub_weakref()
+    if pubsub is not None:
+        (<PubSub>pubsub).c_remove_collected_listener(event_tag, batch, listener_weakref)
+
+
+cdef bint _insert_listener(PubSub pubsub, dict events, int64_t event_tag, EventListener listener, bint batch):
+    cdef:
+        dict listeners = events.get(event_tag)
+        object finalizer
+    if listeners is None:
+        listeners = {}
+        events[event_tag] = listeners
+    elif PyWeakref_NewRef(listener, None) in listeners:
+        return False
+    finalizer = functools.partial(_remove_collected_listener, PyWeakref_NewRef(pubsub, None), event_tag, batch)
+    listeners[PyWeakref_NewRef(listener, finalizer)] = None
+    return True
+
+
+cdef bint _discard_listener(dict events, int64_t event_tag, object listener_weakref):
+    cdef:
+        dict listeners = events.get(event_tag)
+    # Dead weak references are only equal to themselves, so this also removes collected listeners
+    if listeners is None or listener_weakref not in listeners:
+        return False
+    del listeners[listener_weakref]
+    if len(listeners) < 1:
+        del events[event_tag]
+    return True
+
+
+cdef list _alive_listeners(tuple listener_weakrefs):
+    cdef:
+        object listener
+    retval = []
+    for listener_weakref in listener_weakrefs:
+        listener = <object>PyWeakref_GetObject(listener_weakref)
+        if listener is not None:
+            retval.append(listener)
+    return retval
+
+
+def deliver_batched_events():
+    """
+    Delivers the events batched since the last delivery to the batch listeners of all the PubSubs. It is scheduled on
+    the event loop when an event is batched, and called by the clock after each tick, so batches hold the events of an
+    event loop iteration or of a clock tick.
+    """
+    global _pubsubs_with_pending_batches, _batches_delivery_scheduled
+    cdef:
+        list pubsubs = _pubsubs_with_pending_batches
+    _batches_delivery_scheduled = False
+    if len(pubsubs) == 0:
+        return
+    # Events triggered by the batch listeners are batched for the next delivery
+    _pubsubs_with_pending_batches = []
+    for pubsub in pubsubs:
+        (<PubSub>pubsub).c_deliver_batches()
 
 
 cdef class PubSub:
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    PubSub with weak references. This avoids the lapsed listener problem by removing the listeners once they are
+    garbage collected.
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    The listeners of each event tag are kept in the order they were added, and in an immutable tuple of weak references
+    that c_trigger_event() iterates over. The tuple is rebuilt only when the listeners change:
 
-    Here's how the dead listener GC is performed:
+    1. c_add_listener() and c_remove_listener():
+       Every time, in O(n). Both are called much less often than c_trigger_event().
+    2. When a listener is garbage collected:
+       The callback of its weak reference removes it, so dead listeners don't have to be looked for.
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
-    """
+    Triggering an event is then a plain iteration, which doesn't allocate or scan for dead listeners. A listener
+    adding or removing listeners from its callback doesn't affect the iteration, which keeps the previous tuple.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    Batch listeners, added with c_add_batch_listener(), are called with the list of the events of their tag triggered
+    since the last delivery instead of once per event. See deliver_batched_events().
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,8 +111,12 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self):
+        # Subclasses don't always call __init__()
+        self._events = {}
+        self._batch_events = {}
+        self._batch_listener_tuples = {}
+        self._pending_batches = {}
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -64,6 +127,20 @@ cdef class PubSub:
     def get_listeners(self, event_tag: Enum) -> List[EventListener]:
         return self.c_get_listeners(event_tag.value)
 
+    def add_batch_listener(self, event_tag: Enum, listener: EventListener):
+        """
+        Adds a listener called with the list of the events of the tag triggered during an event loop iteration or a
+        clock tick, for consumers that can process the events in bulk. The list must not be modified, as it is shared
+        by all the batch listeners of the tag.
+        """
+        self.c_add_batch_listener(event_tag.value, listener)
+
+    def remove_batch_listener(self, event_tag: Enum, listener: EventListener):
+        self.c_remove_batch_listener(event_tag.value, listener)
+
+    def get_batch_listeners(self, event_tag: Enum) -> List[EventListener]:
+        return self.c_get_batch_listeners(event_tag.value)
+
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
@@ -71,95 +148,113 @@ cdef class PubSub:
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
-        cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        if _insert_listener(self, self._events, event_tag, listener, False):
+            self.c_update_listener_tuple(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
+        if _discard_listener(self._events, event_tag, PyWeakref_NewRef(listener, None)):
+            self.c_update_listener_tuple(event_tag)
+
+    cdef c_add_batch_listener(self, int64_t event_tag, EventListener listener):
+        if _insert_listener(self, self._batch_events, event_tag, listener, True):
+            self.c_update_batch_listener_tuple(event_tag)
+
+    cdef c_remove_batch_listener(self, int64_t event_tag, EventListener listener):
+        if _discard_listener(self._batch_events, event_tag, PyWeakref_NewRef(listener, None)):
+            self.c_update_batch_listener_tuple(event_tag)
+
+    cdef c_remove_collected_listener(self, int64_t event_tag, bint batch, object listener_weakref):
+        if batch:
+            if _discard_listener(self._batch_events, event_tag, listener_weakref):
+                self.c_update_batch_listener_tuple(event_tag)
+        elif _discard_listener(self._events, event_tag, listener_weakref):
+            self.c_update_listener_tuple(event_tag)
+
+    cdef c_update_listener_tuple(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+            EventListenerTuplesIterator it = self._listener_tuples.find(event_tag)
+            dict listeners = self._events.get(event_tag)
+            tuple listener_weakrefs
+        if it != self._listener_tuples.end():
+            self._listener_tuples.erase(it)
+        if listeners is not None:
+            listener_weakrefs = tuple(listeners)
+            self._listener_tuples.insert(EventListenerTuplesPair(event_tag, PyRef(<PyObject *>listener_weakrefs)))
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_update_batch_listener_tuple(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
-            return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+            dict listeners = self._batch_events.get(event_tag)
+        if listeners is not None:
+            self._batch_listener_tuples[event_tag] = tuple(listeners)
+            self._batched_event_tags.insert(event_tag)
+        else:
+            self._batch_listener_tuples.pop(event_tag, None)
+            self._pending_batches.pop(event_tag, None)
+            self._batched_event_tags.erase(event_tag)
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
+            EventListenerTuplesIterator it = self._listener_tuples.find(event_tag)
+            tuple listener_weakrefs
+        if it == self._listener_tuples.end():
             return []
+        listener_weakrefs = <tuple>deref(it).second.get()
+        return _alive_listeners(listener_weakrefs)
 
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
-        return retval
+    cdef c_get_batch_listeners(self, int64_t event_tag):
+        return _alive_listeners(self._batch_listener_tuples.get(event_tag, ()))
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+        cdef:
+            EventListenerTuplesIterator it
+            tuple listener_weakrefs
+        if self._batched_event_tags.size() > 0 and self._batched_event_tags.count(event_tag) > 0:
+            self.c_add_to_batch(event_tag, arg)
+        it = self._listener_tuples.find(event_tag)
+        if it == self._listener_tuples.end():
+            return
+        # Listeners are allowed to call c_add_listener() or c_remove_listener(), which replace the tuple of the event
+        # tag instead of changing it, so the tuple is kept referenced until all its listeners are called.
+        listener_weakrefs = <tuple>deref(it).second.get()
+        self.c_call_listeners(event_tag, listener_weakrefs, arg)
 
+    cdef c_add_to_batch(self, int64_t event_tag, object arg):
+        global _batches_delivery_scheduled
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
-            EventListener typed_listener
-        if it == self._events.end():
+            list batch = self._pending_batches.get(event_tag)
+        if batch is not None:
+            batch.append(arg)
             return
+        if len(self._pending_batches) == 0:
+            _pubsubs_with_pending_batches.append(self)
+        self._pending_batches[event_tag] = [arg]
+        if not _batches_delivery_scheduled:
+            try:
+                asyncio.get_running_loop().call_soon(deliver_batched_events)
+                _batches_delivery_scheduled = True
+            except RuntimeError:
+                # Without a running event loop, as in backtests, batches are delivered after the clock ticks
+                pass
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+    cdef c_deliver_batches(self):
+        cdef:
+            dict batches = self._pending_batches
+            tuple listener_weakrefs
+        self._pending_batches = {}
+        for event_tag, events in batches.items():
+            listener_weakrefs = self._batch_listener_tuples.get(event_tag)
+            if listener_weakrefs is not None:
+                self.c_call_listeners(event_tag, listener_weakrefs, events)
+
+    cdef c_call_listeners(self, int64_t event_tag, tuple listener_weakrefs, object arg):
+        cdef:
+            object listener
+            EventListener typed_listener
+        for listener_weakref in listener_weakrefs:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                continue
+            typed_listener = <EventListener>listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
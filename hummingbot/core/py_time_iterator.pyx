@@ -5,6 +5,12 @@ cdef class PyTimeIterator(TimeIterator):
     def tick(self, double timestamp):
         raise NotImplementedError
 
+    def next_event_time(self, double timestamp) -> float:
+        return timestamp
+
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.tick(timestamp)
+
+    cdef double c_next_event_time(self, double timestamp):
+        return self.next_event_time(timestamp)
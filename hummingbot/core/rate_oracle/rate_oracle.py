@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, List, Optional, Set
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -19,7 +20,7 @@ from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSo
 from hummingbot.core.rate_oracle.sources.hyperliquid_rate_source import HyperliquidRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -37,12 +38,24 @@ RATE_ORACLE_SOURCES = {
     "hyperliquid": HyperliquidRateSource,
 }
 
+# Age, in seconds, under which a streamed price is not replaced by the polled price of the same pair
+STREAMED_PRICE_MAX_AGE = 10.0
+# Interval, in seconds, of the price polls while all the pairs of the requested rates are streamed
+STREAMED_PRICES_POLL_INTERVAL = 60.0
+# Time, in seconds, after which a rate that isn't requested again stops being streamed
+REQUESTED_PAIR_EXPIRY = 300.0
+
 
 class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are looked up through
+    a conversion graph, rebuilt when new pairs are priced, which keeps the conversion paths to the quote token.
+
+    When the source can stream prices, the oracle subscribes to the pairs of the conversion paths of the rates requested
+    through get_pair_rate, and only polls the source once in a while for the other pairs as long as the streams are
+    up to date.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -63,9 +76,17 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._conversion_graph: Optional[RateConversionGraph] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
+        # Requested pair -> timestamp of its last request
+        self._requested_pairs: Dict[str, float] = {}
+        self._streamed_pairs: FrozenSet[str] = frozenset()
+        self._streamed_price_timestamps: Dict[str, float] = {}
+        self._price_stream_source: Optional[RateSourceBase] = None
+        self._price_stream_task: Optional[asyncio.Task] = None
+        self._last_poll_timestamp = 0.0
 
     def __str__(self):
         return f"{self._source.name} rate oracle"
@@ -104,6 +125,8 @@ class RateOracle(NetworkBase):
         if new_token != self._quote_token:
             self._quote_token = new_token
             self._prices = {}
+            self._conversion_graph = None
+            self._streamed_price_timestamps = {}
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -120,6 +143,7 @@ class RateOracle(NetworkBase):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
+        self._stop_price_stream()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -163,7 +187,8 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        self._requested_pairs[pair] = self._time()
+        return self._get_conversion_graph().find_rate(self._prices, pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -195,15 +220,28 @@ class RateOracle(NetworkBase):
         """
         Update keys in self._prices with new prices
         """
+        if pair not in self._prices:
+            self._conversion_graph = None
         self._prices[pair] = price
 
+    def _get_conversion_graph(self) -> RateConversionGraph:
+        # Prices are only added, so the graph covers the current pairs as long as it has as many pairs
+        if self._conversion_graph is None or len(self._conversion_graph) != len(self._prices):
+            self._conversion_graph = RateConversionGraph(self._prices, quote_tokens=[self._quote_token])
+        return self._conversion_graph
+
     async def _fetch_price_loop(self):
         while True:
             try:
-                new_prices = await self._source.get_prices(quote_token=self._quote_token)
-                self._prices.update(new_prices)
+                self._update_price_stream()
+                if self._is_poll_due():
+                    new_prices = await self._source.get_prices(quote_token=self._quote_token)
+                    self._last_poll_timestamp = self._time()
+                    self._prices.update({pair: price for pair, price in new_prices.items()
+                                         if not self._has_fresh_streamed_price(pair)})
 
                 if self._prices:
+                    self._get_conversion_graph()
                     self._ready_event.set()
             except asyncio.CancelledError:
                 raise
@@ -211,3 +249,71 @@ class RateOracle(NetworkBase):
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
             await asyncio.sleep(1)
+
+    def _is_poll_due(self) -> bool:
+        if (len(self._prices) == 0
+                or len(self._streamed_pairs) == 0
+                or not all(self._has_fresh_streamed_price(pair) for pair in self._streamed_pairs)):
+            return True
+        return self._time() - self._last_poll_timestamp >= STREAMED_PRICES_POLL_INTERVAL
+
+    def _has_fresh_streamed_price(self, pair: str) -> bool:
+        timestamp = self._streamed_price_timestamps.get(pair)
+        return timestamp is not None and self._time() - timestamp <= STREAMED_PRICE_MAX_AGE
+
+    def _pairs_to_stream(self) -> Set[str]:
+        """
+        The priced pairs of the conversion paths of the rates requested recently. One-off requests, like the ones of
+        the balance and status displays, expire after REQUESTED_PAIR_EXPIRY.
+        """
+        min_request_timestamp = self._time() - REQUESTED_PAIR_EXPIRY
+        self._requested_pairs = {pair: timestamp for pair, timestamp in self._requested_pairs.items()
+                                 if timestamp >= min_request_timestamp}
+        conversion_graph = self._get_conversion_graph()
+        pairs = set()
+        for requested_pair in self._requested_pairs:
+            conversion_pairs = conversion_graph.conversion_pairs(requested_pair)
+            if conversion_pairs is not None:
+                pairs.update(conversion_pairs)
+        return pairs
+
+    def _update_price_stream(self):
+        """
+        Subscribes to the prices of the pairs of the requested rates, when they change or when the source changes.
+        """
+        pairs = frozenset(self._pairs_to_stream()) if self._source.supports_price_stream else frozenset()
+        if (pairs == self._streamed_pairs
+                and self._source is self._price_stream_source
+                and self._price_stream_task is not None
+                and not self._price_stream_task.done()):
+            return
+        self._stop_price_stream()
+        if len(pairs) > 0:
+            self._streamed_pairs = pairs
+            self._price_stream_source = self._source
+            self._price_stream_task = safe_ensure_future(self._listen_for_prices(self._source, sorted(pairs)))
+
+    def _stop_price_stream(self):
+        if self._price_stream_task is not None:
+            self._price_stream_task.cancel()
+            self._price_stream_task = None
+        self._streamed_pairs = frozenset()
+        self._price_stream_source = None
+
+    async def _listen_for_prices(self, source: RateSourceBase, pairs: List[str]):
+        try:
+            await source.listen_for_prices(pairs, self._on_streamed_price)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Error streaming prices from {source.name}.", exc_info=True,
+                                  app_warning_msg=f"The price stream of {source.name} failed. Retrying in 5 seconds.")
+            await asyncio.sleep(5)
+
+    def _on_streamed_price(self, pair: str, price: Decimal):
+        self.set_price(pair, price)
+        self._streamed_price_timestamps[pair] = self._time()
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
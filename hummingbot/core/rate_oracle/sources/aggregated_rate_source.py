@@ -0,0 +1,130 @@
+import asyncio
+import functools
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.core.utils.async_utils import safe_gather
+
+
+@dataclass
+class WeightedRateSource:
+    """
+    A rate source of an AggregatedRateSource, with the weight of its prices and the age, in seconds, after which they
+    are left out of the aggregated prices.
+    """
+    source: RateSourceBase
+    weight: Decimal = Decimal("1")
+    max_age: float = 60.0
+
+
+class AggregatedRateSource(RateSourceBase):
+    """
+    Combines the prices of several rate sources into their weighted average, so a rate doesn't depend on a single
+    exchange. The prices of a source older than its max age are left out, and the pairs priced by a single source get
+    its price.
+
+    The prices streamed by the sources supporting it are kept until they get stale, the polled prices of the same
+    source don't replace them.
+    """
+
+    def __init__(self, sources: List[WeightedRateSource]):
+        super().__init__()
+        self._sources = sources
+        # source name -> trading pair -> (price, timestamp, whether the price was streamed)
+        self._source_prices: Dict[str, Dict[str, Tuple[Decimal, float, bool]]] = {
+            weighted_source.source.name: {} for weighted_source in sources
+        }
+
+    @property
+    def name(self) -> str:
+        return "aggregated"
+
+    @property
+    def sources(self) -> List[WeightedRateSource]:
+        return self._sources
+
+    @property
+    def supports_price_stream(self) -> bool:
+        return any(weighted_source.source.supports_price_stream for weighted_source in self._sources)
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        results = await safe_gather(
+            *[weighted_source.source.get_prices(quote_token=quote_token) for weighted_source in self._sources],
+            return_exceptions=True)
+        timestamp = self._time()
+        for weighted_source, result in zip(self._sources, results):
+            if isinstance(result, Exception):
+                self.logger().error(
+                    f"Unexpected error while retrieving rates from {weighted_source.source.name}.", exc_info=result)
+                continue
+            for trading_pair, price in result.items():
+                self._record_price(weighted_source, trading_pair, price, timestamp, streamed=False)
+        return self.aggregated_prices()
+
+    async def listen_for_prices(self, trading_pairs: List[str], price_callback: Callable[[str, Decimal], None]):
+        streaming_sources = [weighted_source for weighted_source in self._sources
+                             if weighted_source.source.supports_price_stream]
+        stream_tasks = [
+            asyncio.ensure_future(weighted_source.source.listen_for_prices(
+                trading_pairs, functools.partial(self._on_streamed_price, weighted_source, price_callback)))
+            for weighted_source in streaming_sources
+        ]
+        if len(stream_tasks) == 0:
+            return
+        try:
+            done, _ = await asyncio.wait(stream_tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for stream_task in done:
+                stream_task.result()
+        finally:
+            # The streams of the other sources are stopped when one fails or when the aggregated stream is cancelled
+            for stream_task in stream_tasks:
+                stream_task.cancel()
+
+    def aggregated_prices(self) -> Dict[str, Decimal]:
+        """
+        The weighted average price of each trading pair over the sources whose price is not stale.
+        """
+        trading_pairs = set().union(*(source_prices.keys() for source_prices in self._source_prices.values()))
+        prices = {trading_pair: self.aggregated_price(trading_pair) for trading_pair in trading_pairs}
+        return {trading_pair: price for trading_pair, price in prices.items() if price is not None}
+
+    def aggregated_price(self, trading_pair: str) -> Optional[Decimal]:
+        timestamp = self._time()
+        weighted_sum = Decimal("0")
+        total_weight = Decimal("0")
+        for weighted_source in self._sources:
+            source_price = self._source_prices[weighted_source.source.name].get(trading_pair)
+            if source_price is not None and timestamp - source_price[1] <= weighted_source.max_age:
+                weighted_sum += source_price[0] * weighted_source.weight
+                total_weight += weighted_source.weight
+        return weighted_sum / total_weight if total_weight > 0 else None
+
+    def _on_streamed_price(self,
+                           weighted_source: WeightedRateSource,
+                           price_callback: Callable[[str, Decimal], None],
+                           trading_pair: str,
+                           price: Decimal):
+        self._record_price(weighted_source, trading_pair, price, self._time(), streamed=True)
+        aggregated_price = self.aggregated_price(trading_pair)
+        if aggregated_price is not None:
+            price_callback(trading_pair, aggregated_price)
+
+    def _record_price(self,
+                      weighted_source: WeightedRateSource,
+                      trading_pair: str,
+                      price: Decimal,
+                      timestamp: float,
+                      streamed: bool):
+        source_prices = self._source_prices[weighted_source.source.name]
+        if not streamed:
+            current_price = source_prices.get(trading_pair)
+            if current_price is not None and current_price[2] and timestamp - current_price[1] <= weighted_source.max_age:
+                return
+        source_prices[trading_pair] = (price, timestamp, streamed)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
@@ -1,10 +1,13 @@
+import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
@@ -19,6 +22,10 @@ class BinanceRateSource(RateSourceBase):
     def name(self) -> str:
         return "binance"
 
+    @property
+    def supports_price_stream(self) -> bool:
+        return True
+
     @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         self._ensure_exchanges()
@@ -38,6 +45,11 @@ class BinanceRateSource(RateSourceBase):
                 results.update(task_result)
         return results
 
+    async def listen_for_prices(self, trading_pairs: List[str], price_callback: Callable[[str, Decimal], None]):
+        self._ensure_exchanges()
+        await self._listen_for_binance_prices(
+            exchange=self._binance_exchange, domain="com", trading_pairs=trading_pairs, price_callback=price_callback)
+
     def _ensure_exchanges(self):
         if self._binance_exchange is None:
             self._binance_exchange = self._build_binance_connector_without_private_keys(domain="com")
@@ -69,6 +81,54 @@ class BinanceRateSource(RateSourceBase):
 
         return results
 
+    @staticmethod
+    async def _listen_for_binance_prices(exchange: 'BinanceExchange',
+                                         domain: str,
+                                         trading_pairs: List[str],
+                                         price_callback: Callable[[str, Decimal], None]):
+        """
+        Streams the mid prices of the trading pairs from the book ticker channel of the exchange.
+
+        :param exchange: The exchange instance used to map the trading pairs to the exchange symbols
+        :param domain: The domain of the exchange websocket
+        :param trading_pairs: The trading pairs to subscribe to, the ones not listed by the exchange are skipped
+        :param price_callback: Called with the trading pair and its new price
+        """
+        trading_pairs_by_symbol = {}
+        for trading_pair in trading_pairs:
+            try:
+                symbol = await exchange.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            except KeyError:
+                continue
+            trading_pairs_by_symbol[symbol] = trading_pair
+        if len(trading_pairs_by_symbol) == 0:
+            # Nothing to stream, the prices are polled
+            await asyncio.Event().wait()
+
+        api_factory = web_utils.build_api_factory_without_time_synchronizer_pre_processor(
+            throttler=web_utils.create_throttler())
+        ws = await api_factory.get_ws_assistant()
+        try:
+            await ws.connect(ws_url=CONSTANTS.WSS_URL.format(domain), ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+            streams = [f"{symbol.lower()}@bookTicker" for symbol in trading_pairs_by_symbol]
+            for request_id, i in enumerate(range(0, len(streams), CONSTANTS.WS_MAX_STREAMS_PER_REQUEST), start=1):
+                await ws.send(WSJSONRequest(payload={
+                    "method": "SUBSCRIBE",
+                    "params": streams[i:i + CONSTANTS.WS_MAX_STREAMS_PER_REQUEST],
+                    "id": request_id,
+                }))
+            async for ws_response in ws.iter_messages():
+                data = ws_response.data
+                trading_pair = trading_pairs_by_symbol.get(data.get("s")) if isinstance(data, dict) else None
+                if trading_pair is None:
+                    continue  # subscription responses
+                bid_price = Decimal(data["b"])
+                ask_price = Decimal(data["a"])
+                if 0 < bid_price <= ask_price:
+                    price_callback(trading_pair, (bid_price + ask_price) / Decimal("2"))
+        finally:
+            await ws.disconnect()
+
     @staticmethod
     def _build_binance_connector_without_private_keys(domain: str) -> 'BinanceExchange':
         from hummingbot.client.hummingbot_application import HummingbotApplication
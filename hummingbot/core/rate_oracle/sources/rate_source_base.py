@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 from hummingbot.logger import HummingbotLogger
 
@@ -14,6 +14,13 @@ class RateSourceBase(ABC):
     def name(self) -> str:
         ...
 
+    @property
+    def supports_price_stream(self) -> bool:
+        """
+        Whether the source can stream the prices of a set of trading pairs, through listen_for_prices.
+        """
+        return False
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -23,3 +30,13 @@ class RateSourceBase(ABC):
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    async def listen_for_prices(self, trading_pairs: List[str], price_callback: Callable[[str, Decimal], None]):
+        """
+        Streams the prices of the trading pairs, calling price_callback with each new price, until cancelled. Trading
+        pairs the source doesn't list are ignored.
+
+        :param trading_pairs: The trading pairs to subscribe to
+        :param price_callback: Called with the trading pair and its new price
+        """
+        raise NotImplementedError
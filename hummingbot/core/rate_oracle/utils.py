@@ -1,11 +1,100 @@
+from collections import defaultdict, deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
 
-def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
+class RateConversionGraph:
+    """
+    Graph of the tokens linked by a set of priced trading pairs, used to find the rate of any pair of connected tokens.
+
+    The conversion paths to a quote token, the shortest chains of priced pairs linking each token to it, are computed
+    once per quote token, so finding a rate takes a couple of hash lookups and an operation per hop. Paths only depend
+    on which pairs are priced, so a graph stays valid while the prices of its pairs change.
+    """
+
+    def __init__(self, pairs: Iterable[str], quote_tokens: Iterable[str] = ()):
+        """
+        :param pairs: The priced trading pairs
+        :param quote_tokens: Quote tokens for which the conversion paths are computed up front
+        """
+        self._pairs_count = 0
+        # token -> (linked token, pair, whether the linked token is converted by dividing by the pair price)
+        self._links: Dict[str, List[Tuple[str, str, bool]]] = defaultdict(list)
+        self._conversion_paths: Dict[str, Dict[str, Tuple[Tuple[str, bool], ...]]] = {}
+        for pair in pairs:
+            self._pairs_count += 1
+            tokens = pair.split("-")
+            if len(tokens) != 2 or tokens[0] == tokens[1]:
+                continue
+            base, quote = tokens
+            self._links[quote].append((base, pair, False))
+            self._links[base].append((quote, pair, True))
+        for quote_token in quote_tokens:
+            self.conversion_paths(quote_token)
+
+    def __len__(self) -> int:
+        return self._pairs_count
+
+    def conversion_paths(self, quote_token: str) -> Dict[str, Tuple[Tuple[str, bool], ...]]:
+        """
+        Finds the shortest conversion path of every token connected to the quote token, as the sequence of pairs whose
+        prices multiply (or divide, when the flag is set) a token amount to convert it to the quote token.
+
+        :param quote_token: The token to convert to
+        :return A dictionary of conversion paths by token
+        """
+        paths = self._conversion_paths.get(quote_token)
+        if paths is None:
+            paths = {quote_token: ()}
+            pending_tokens = deque([quote_token])
+            while pending_tokens:
+                token = pending_tokens.popleft()
+                for linked_token, pair, divide in self._links.get(token, ()):
+                    if linked_token not in paths:
+                        paths[linked_token] = ((pair, divide),) + paths[token]
+                        pending_tokens.append(linked_token)
+            self._conversion_paths[quote_token] = paths
+        return paths
+
+    def conversion_pairs(self, pair: str) -> Optional[Tuple[str, ...]]:
+        """
+        Finds the pairs whose prices give the rate of a trading pair.
+
+        :param pair: The trading pair
+        :return The pairs of the conversion path, or None if the tokens are not connected
+        """
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        path = self.conversion_paths(unwrap_token_symbol(quote)).get(unwrap_token_symbol(base))
+        return tuple(link_pair for link_pair, _ in path) if path is not None else None
+
+    def find_rate(self, prices: Dict[str, Decimal], pair: str) -> Optional[Decimal]:
+        """
+        Finds the exchange rate of a trading pair from the prices of the pairs of the graph.
+
+        :param prices: The dictionary of trading pairs and their prices, including all the pairs of the graph
+        :param pair: The trading pair
+        :return The rate, or None if the tokens are not connected
+        """
+        if pair in prices:
+            return prices[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        path = self.conversion_paths(quote).get(base)
+        if path is None:
+            return None
+        rate = Decimal("1")
+        for link_pair, divide in path:
+            rate = rate / prices[link_pair] if divide else rate * prices[link_pair]
+        return rate
+
+
+def find_rate(prices: Dict[str, Decimal], pair: str) -> Optional[Decimal]:
     '''
     Finds exchange rate for a given trading pair from a dictionary of prices
     For example, given prices of {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
@@ -13,6 +102,8 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Rates needing more links are found through the shortest chain of prices. Callers looking up many rates from the
+    same prices should keep a RateConversionGraph instead, which computes the chains only once.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
@@ -26,12 +117,4 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
     if reverse_pair in prices:
         return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateConversionGraph(prices).find_rate(prices, pair)
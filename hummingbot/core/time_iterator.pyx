@@ -22,9 +22,19 @@ cdef class TimeIterator(PubSub):
     cdef c_tick(self, double timestamp):
         self._current_timestamp = timestamp
 
+    cdef double c_next_event_time(self, double timestamp):
+        """
+        Returns the earliest time after the timestamp at which the iterator has to be ticked, used by backtesting clocks
+        skipping idle ticks. Any time up to the next tick, like the timestamp itself, asks for the next tick.
+        """
+        return timestamp
+
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def next_event_time(self, timestamp: float) -> float:
+        return self.c_next_event_time(timestamp)
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.logger import HummingbotLogger
+
+# Longer intervals (3d, 1w, 1M) are not aligned to multiples of their length since the epoch by the exchanges
+MAX_AGGREGATED_INTERVAL_IN_SECONDS = 86400
+
+
+class AggregatedCandles:
+    """
+    Candles of a higher interval built locally from the candles of a base feed of the same exchange and trading pair.
+
+    Closed candles are only aggregated once, when the base feed opens a candle of the next interval, and the forming
+    candle is rebuilt from the base candles of the current interval when they change. The history older than the base
+    feed window is fetched once from the exchange at the aggregated interval, so the feed has no websocket connection
+    of its own.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @staticmethod
+    def can_aggregate(base_feed: CandlesBase, interval: str) -> bool:
+        """
+        Returns True if the candles of the interval can be built from the candles of the base feed.
+        """
+        if interval not in base_feed.interval_to_seconds or interval not in base_feed.intervals:
+            return False
+        interval_in_seconds = base_feed.get_seconds_from_interval(interval)
+        return (base_feed.interval_in_seconds < interval_in_seconds <= MAX_AGGREGATED_INTERVAL_IN_SECONDS and
+                interval_in_seconds % base_feed.interval_in_seconds == 0)
+
+    def __init__(self, base_feed: CandlesBase, interval: str, max_records: int = 150):
+        if not self.can_aggregate(base_feed, interval):
+            raise ValueError(f"Interval {interval} can't be aggregated from {base_feed.interval} candles.")
+        self._base_feed = base_feed
+        self.interval = interval
+        self.max_records = max_records
+        self.columns = base_feed.columns
+        self._interval_in_seconds = base_feed.get_seconds_from_interval(interval)
+        self._history_feed = type(base_feed)(base_feed._trading_pair, interval, max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._forming_candle: Optional[np.ndarray] = None
+        self._base_version: int = -1
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_cache_key = None
+        self._fill_historical_candles_task: Optional[asyncio.Task] = None
+
+    @property
+    def name(self) -> str:
+        return self._base_feed.name
+
+    @property
+    def base_feed(self) -> CandlesBase:
+        return self._base_feed
+
+    @property
+    def interval_in_seconds(self) -> int:
+        return self._interval_in_seconds
+
+    @property
+    def ready(self) -> bool:
+        self._update_candles()
+        return len(self._candles) == self._candles.maxlen
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        Returns the closed candles followed by the forming candle, at most max_records rows.
+        """
+        self._update_candles()
+        candles = self._candles.view()
+        if self._forming_candle is not None:
+            candles = np.vstack([candles, self._forming_candle])[-self.max_records:]
+        return candles
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        candles = self.candles_array
+        cache_key = (self._candles.version, self._base_version)
+        if self._candles_df_cache_key != cache_key:
+            self._candles_df_cache = pd.DataFrame(candles, columns=self.columns, copy=False)
+            self._candles_df_cache_key = cache_key
+        return self._candles_df_cache.copy(deep=False)
+
+    def set_candles_store(self, candles_store):
+        self._history_feed.set_candles_store(candles_store)
+
+    def start(self):
+        self.stop()
+        self._fill_historical_candles_task = safe_ensure_future(self.fill_historical_candles())
+
+    def stop(self):
+        if self._fill_historical_candles_task is not None:
+            self._fill_historical_candles_task.cancel()
+            self._fill_historical_candles_task = None
+
+    def _update_candles(self):
+        """
+        Aggregates the base candles received since the last update.
+        """
+        if self._base_feed._candles.version == self._base_version:
+            return
+        self._base_version = self._base_feed._candles.version
+        base_candles = self._base_feed.candles_array
+        if len(base_candles) == 0:
+            self._forming_candle = None
+            return
+        buckets = base_candles[:, 0] - base_candles[:, 0] % self._interval_in_seconds
+        forming_bucket = buckets[-1]
+        last_closed_bucket = self._candles[-1][0] if len(self._candles) > 0 else -np.inf
+        closed_mask = (buckets > last_closed_bucket) & (buckets < forming_bucket)
+        if buckets[0] != base_candles[0, 0]:
+            # The first interval of the base window is incomplete
+            closed_mask &= buckets != buckets[0]
+        if np.any(closed_mask):
+            self._candles.extend(self._aggregate(base_candles[closed_mask], buckets[closed_mask]))
+        forming_mask = buckets == forming_bucket
+        if forming_bucket > last_closed_bucket and (buckets[0] != forming_bucket or buckets[0] == base_candles[0, 0]):
+            self._forming_candle = self._aggregate(base_candles[forming_mask], buckets[forming_mask])[0]
+        else:
+            self._forming_candle = None
+
+    @staticmethod
+    def _aggregate(candles: np.ndarray, buckets: np.ndarray) -> np.ndarray:
+        """
+        Aggregates candles sorted by timestamp into one candle per bucket.
+        """
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(candles)] - 1
+        aggregated = np.empty((len(starts), candles.shape[1]))
+        aggregated[:, 0] = buckets[starts]
+        aggregated[:, 1] = candles[starts, 1]
+        aggregated[:, 2] = np.maximum.reduceat(candles[:, 2], starts)
+        aggregated[:, 3] = np.minimum.reduceat(candles[:, 3], starts)
+        aggregated[:, 4] = candles[ends, 4]
+        aggregated[:, 5:] = np.add.reduceat(candles[:, 5:], starts, axis=0)
+        return aggregated
+
+    async def fill_historical_candles(self):
+        """
+        Fetches the closed candles older than the ones built from the base feed until reaching max_records.
+        """
+        await self._history_feed.initialize_exchange_data()
+        while not self.ready:
+            if len(self._candles) == 0 and self._forming_candle is None:
+                await self._sleep(1.0)
+                continue
+            try:
+                end_time = self._candles[0][0] if len(self._candles) > 0 else self._forming_candle[0]
+                missing_records = self._candles.maxlen - len(self._candles)
+                candles = await self._history_feed.fetch_candles(end_time=int(end_time), limit=missing_records)
+                candles = candles[candles[:, 0] < end_time]
+                if len(self._candles) > 0 and self._candles[0][0] != end_time:
+                    # Candles were aggregated while fetching, retry from the new first candle
+                    continue
+                records_to_add = min(missing_records, len(candles))
+                self._candles.extendleft(candles[-records_to_add:][::-1])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+
+    @staticmethod
+    async def _sleep(delay):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
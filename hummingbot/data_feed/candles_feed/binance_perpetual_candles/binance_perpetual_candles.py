@@ -107,6 +107,29 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    @property
+    def ws_stream_key(self) -> Optional[str]:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
+    def ws_message_stream_key(self, data: dict) -> Optional[str]:
+        if data is not None and data.get("e") == "kline":
+            return f"{data['s'].lower()}@kline_{data['k']['i']}"
+
+    def ws_streams_subscription_payload(self, feeds: List[CandlesBase], subscribe: bool = True) -> dict:
+        return {
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": [feed.ws_stream_key for feed in feeds],
+            "id": 1
+        }
+
+    @property
+    def ws_max_streams_per_connection(self) -> int:
+        return CONSTANTS.WS_MAX_STREAMS_PER_CONNECTION
+
+    @property
+    def ws_max_streams_per_request(self) -> int:
+        return CONSTANTS.WS_MAX_STREAMS_PER_REQUEST
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
@@ -117,6 +117,20 @@ class BybitPerpetualCandles(CandlesBase):
         }
         return payload
 
+    @property
+    def ws_stream_key(self) -> Optional[str]:
+        return self.ws_subscription_payload()["args"][0]
+
+    def ws_message_stream_key(self, data: dict) -> Optional[str]:
+        if data is not None and data.get("data") is not None:
+            return data.get("topic")
+
+    def ws_streams_subscription_payload(self, feeds: List[CandlesBase], subscribe: bool = True) -> dict:
+        return {
+            "op": "subscribe" if subscribe else "unsubscribe",
+            "args": [feed.ws_stream_key for feed in feeds],
+        }
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("data") is not None:
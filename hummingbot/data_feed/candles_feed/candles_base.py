@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,13 +14,16 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.candles_stream_manager import CandlesStreamManager
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a preallocated ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,8 +53,12 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_cache_version: int = -1
+        self._candles_store: Optional[CandlesStore] = None
         self._listen_candles_task: Optional[asyncio.Task] = None
+        self._stream_manager: Optional[CandlesStreamManager] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
@@ -67,18 +73,29 @@ class CandlesBase(NetworkBase):
     async def start_network(self):
         """
         This method starts the network and starts a task for listen_for_subscriptions.
+
+        Feeds of exchanges that support several candle streams per connection join the shared stream manager of the
+        exchange instead of opening their own websocket connection.
         """
         await self.stop_network()
         await self.initialize_exchange_data()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self.ws_stream_key is not None:
+            self._stream_manager = CandlesStreamManager.get_instance(self.wss_url)
+            self._stream_manager.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task or leaving the shared stream.
         """
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._stream_manager is not None:
+            self._stream_manager.unsubscribe(self)
+            self._stream_manager = None
+            await self._on_order_stream_interruption()
 
     async def initialize_exchange_data(self):
         """
@@ -91,7 +108,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +158,23 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+
+        The DataFrame wraps a read-only view of the buffer and is cached until a candle is appended or updated. Each
+        call returns a shallow copy, so columns added by the caller are not shared with other consumers.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_cache_version != self._candles.version:
+            self._candles_df_cache = pd.DataFrame(self._candles.view(), columns=self.columns, copy=False)
+            self._candles_df_cache_version = self._candles.version
+        return self._candles_df_cache.copy(deep=False)
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read-only numpy view of the stored candles, with the columns in the same order as
+        the columns attribute. No data is copied.
+        """
+        return self._candles.view()
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -161,26 +192,25 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
+    def set_candles_store(self, candles_store: Optional[CandlesStore]):
+        """
+        Sets the local store used to persist historical candles. When set, historical candles and the warm-up of the
+        feed are served from the store and only the missing time ranges are requested to the exchange.
+        :param candles_store: the candles store, or None to always fetch from the exchange
+        """
+        self._candles_store = candles_store
+
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+            start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+            end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+            if self._candles_store is None:
+                candles = await self._fetch_candles_ranges([(start_time, end_time)])
+            else:
+                candles = await self._get_candles_from_store(start_time, end_time)
+            self.check_candles_sorted_and_equidistant(candles)
+            candles_df = pd.DataFrame(candles, columns=self.columns)
             candles_df = candles_df[
                 (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
@@ -191,19 +221,111 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _get_candles_from_store(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Returns the candles between start_time and end_time, fetching from the exchange only the ranges missing in the
+        local store. Only closed candles are persisted, the forming candle is always fetched from the exchange.
+        """
+        last_closed_time = self._round_timestamp_to_interval_multiple(self._time()) - self.interval_in_seconds
+        closed_end_time = min(end_time, last_closed_time)
+        missing_ranges = []
+        if closed_end_time >= start_time:
+            missing_ranges = self._candles_store.missing_ranges(self.name, self.interval, self.interval_in_seconds,
+                                                                start_time, closed_end_time)
+        ranges_to_fetch = list(missing_ranges)
+        if end_time > closed_end_time:
+            ranges_to_fetch.append((max(start_time, closed_end_time), end_time))
+        fetched_candles = await self._fetch_candles_ranges(ranges_to_fetch)
+        closed_candles = fetched_candles[fetched_candles[:, 0] <= closed_end_time]
+        fetched_ranges = self._fetched_ranges(closed_candles, missing_ranges)
+        if len(fetched_ranges) > 0:
+            # Only the parts of the missing ranges returned by the exchange are covered, the rest is requested again
+            self._candles_store.save(self.name, self.interval, self.interval_in_seconds, closed_candles,
+                                     fetched_ranges)
+        stored_candles = self._candles_store.load(self.name, self.interval, start_time, closed_end_time)
+        return np.concatenate([stored_candles.reshape(-1, len(self.columns)),
+                               fetched_candles[fetched_candles[:, 0] > closed_end_time]])
+
+    async def _fetch_candles_ranges(self, ranges: List[Tuple[int, int]]) -> np.ndarray:
+        """
+        Fetches the candles of the given time ranges. Each range is split in chunks of the maximum number of candles per
+        REST request that are fetched concurrently, the throttler keeps the requests within the rate limits. If several
+        chunks fail, the error of the oldest one is raised.
+        :return: candles sorted by timestamp without duplicates
+        """
+        chunk_size = self.candles_max_result_per_rest_request * self.interval_in_seconds
+        chunks = []
+        for start_time, end_time in ranges:
+            chunk_end_time = end_time
+            while chunk_end_time >= start_time:
+                chunk_start_time = max(start_time, chunk_end_time - chunk_size + self.interval_in_seconds)
+                chunks.append((chunk_start_time, chunk_end_time))
+                chunk_end_time = chunk_start_time - self.interval_in_seconds
+        chunks.sort()
+        pages = await asyncio.gather(*[self._fetch_candles_range(start_time, end_time)
+                                       for start_time, end_time in chunks], return_exceptions=True)
+        for page in pages:
+            if isinstance(page, BaseException):
+                raise page
+        pages = [page for page in pages if len(page) > 0]
+        if len(pages) == 0:
+            return np.empty((0, len(self.columns)))
+        candles = np.concatenate(pages)
+        _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+        return candles[unique_indexes]
+
+    async def _fetch_candles_range(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Fetches the candles between start_time and end_time (inclusive) paging backwards from the end time, until the
+        start time is reached or the exchange returns no more candles.
+        """
+        pages = []
+        current_end_time = end_time
+        while current_end_time >= start_time:
+            missing_records = min(int((current_end_time - start_time) / self.interval_in_seconds) + 1,
+                                  self.candles_max_result_per_rest_request)
+            candles = await self.fetch_candles(start_time=start_time,
+                                               end_time=current_end_time,
+                                               limit=missing_records)
+            if len(candles) == 0:
+                break
+            candles = candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= current_end_time)]
+            if len(candles) == 0:
+                break
+            pages.append(candles)
+            current_end_time = self.ensure_timestamp_in_seconds(candles[0][0]) - self.interval_in_seconds
+        if len(pages) == 0:
+            return np.empty((0, len(self.columns)))
+        return np.concatenate(pages[::-1])
+
+    def _fetched_ranges(self, candles: np.ndarray, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Returns the parts of the ranges with consecutive candles, the time ranges the exchange returned data for.
+        """
+        fetched_ranges = []
+        for start_time, end_time in ranges:
+            timestamps = candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time), 0]
+            if len(timestamps) == 0:
+                continue
+            gap_indexes = np.nonzero(np.diff(timestamps) > self.interval_in_seconds)[0]
+            run_starts = np.concatenate([[0], gap_indexes + 1])
+            run_ends = np.concatenate([gap_indexes, [len(timestamps) - 1]])
+            fetched_ranges.extend((int(timestamps[run_start]), int(timestamps[run_end]))
+                                  for run_start, run_end in zip(run_starts, run_ends))
+        return fetched_ranges
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
         :param candles: numpy array with the candles
         """
-        timestamps = [candle[0] for candle in candles]
         if len(self._candles) <= 1:
             return
-        if not np.all(np.diff(timestamps) >= 0):
+        timestamp_steps = np.diff(np.asarray(candles, dtype=float)[:, 0])
+        if not np.all(timestamp_steps >= 0):
             self.logger().warning("Candles are not sorted by timestamp in ascending order.")
             self._reset_candles()
             return
-        timestamp_steps = np.unique(np.diff(timestamps))
         interval_in_seconds = self.get_seconds_from_interval(self.interval)
         if not np.all(timestamp_steps == interval_in_seconds):
             self.logger().warning("Candles are malformed. Restarting...")
@@ -320,14 +442,19 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
             try:
                 end_time = self._round_timestamp_to_interval_multiple(self._candles[0][0])
                 missing_records = self._candles.maxlen - len(self._candles)
-                candles: np.ndarray = await self.fetch_candles(end_time=end_time, limit=missing_records)
+                if self._candles_store is not None:
+                    candles: np.ndarray = await self._get_candles_from_store(
+                        start_time=end_time - missing_records * self.interval_in_seconds,
+                        end_time=end_time - self.interval_in_seconds)
+                else:
+                    candles: np.ndarray = await self.fetch_candles(end_time=end_time, limit=missing_records)
                 candles = candles[candles[:, 0] < end_time]
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
@@ -398,6 +525,39 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def ws_stream_key(self) -> Optional[str]:
+        """
+        Identifier of the candles stream of the feed (trading pair and interval) in the exchange websocket.
+
+        Exchanges that can subscribe several candle streams over one connection return a key, and must also implement
+        ws_message_stream_key and ws_streams_subscription_payload. None means the feed uses its own connection.
+        """
+        return None
+
+    def ws_message_stream_key(self, data: dict) -> Optional[str]:
+        """
+        This method returns the stream key a websocket message belongs to, or None if it is not a candles message.
+        :param data: the websocket message data
+        """
+        return None
+
+    def ws_streams_subscription_payload(self, feeds: List["CandlesBase"], subscribe: bool = True) -> dict:
+        """
+        This method returns the payload to subscribe (or unsubscribe) the streams of several feeds in one request.
+        :param feeds: the feeds to subscribe, all of them from the same exchange
+        :param subscribe: True to subscribe, False to unsubscribe
+        """
+        raise NotImplementedError
+
+    @property
+    def ws_max_streams_per_connection(self) -> int:
+        return 100
+
+    @property
+    def ws_max_streams_per_request(self) -> int:
+        return 10
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
@@ -407,27 +567,34 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._process_candle_message(parsed_message)
+
+    def _process_candle_message(self, parsed_message: dict):
+        """
+        Appends the candle parsed from a websocket message, or updates the last candle if it is the forming one.
+        :param parsed_message: candle dictionary returned by _parse_websocket_message
+        """
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
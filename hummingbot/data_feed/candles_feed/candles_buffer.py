@@ -0,0 +1,139 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Preallocated columnar ring buffer for candles with a deque-like interface (append, extend, extendleft, indexing).
+
+    Rows are kept contiguous inside an array of twice the max length, so the stored candles can be exposed as a
+    zero-copy read-only numpy view. Views handed out stay valid: any write to a row that has been exposed in a view
+    reallocates the backing array first (copy on write), which only happens when the forming candle is updated or the
+    window has to be compacted. Appending a new candle never copies the stored data.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen = maxlen
+        self._n_columns = n_columns
+        self._capacity = 2 * max(maxlen, 1)
+        self._data = np.empty((self._capacity, n_columns), dtype=float)
+        self._start = self._capacity // 2
+        self._size = 0
+        # Physical rows exposed through views since the last reallocation
+        self._exported_low = self._capacity
+        self._exported_high = 0
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented on every modification, used to invalidate data derived from the buffer.
+        """
+        return self._version
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.view())
+
+    def __array__(self, dtype=None):
+        view = self.view()
+        return view if dtype is None else view.astype(dtype)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.view()[index]
+
+    def __setitem__(self, index: int, row: Iterable[float]):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("CandlesBuffer index out of range")
+        position = self._start + index
+        self._prepare_write(position, position + 1)
+        self._data[position] = row
+        self._version += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Returns a read-only view of the stored candles, oldest first. No data is copied.
+        """
+        low, high = self._start, self._start + self._size
+        if low < high:
+            self._exported_low = min(self._exported_low, low)
+            self._exported_high = max(self._exported_high, high)
+        view = self._data[low:high]
+        view.flags.writeable = False
+        return view
+
+    def append(self, row: Iterable[float]):
+        self.extend([row])
+
+    def extend(self, rows: Iterable[Iterable[float]]):
+        rows = self._as_rows(rows)[-self._maxlen:]
+        n_rows = len(rows)
+        if n_rows == 0:
+            return
+        if self._start + self._size + n_rows > self._capacity:
+            self._reallocate(start=0)
+        position = self._start + self._size
+        self._prepare_write(position, position + n_rows)
+        self._data[position:position + n_rows] = rows
+        self._size += n_rows
+        if self._size > self._maxlen:
+            self._start += self._size - self._maxlen
+            self._size = self._maxlen
+        self._version += 1
+
+    def extendleft(self, rows: Iterable[Iterable[float]]):
+        """
+        Same semantics as deque.extendleft: rows are added one by one to the left, so the input ends up reversed.
+        When the buffer is full the newest candles are discarded.
+        """
+        rows = self._as_rows(rows)[::-1][:self._maxlen]
+        n_rows = len(rows)
+        if n_rows == 0:
+            return
+        if self._start < n_rows:
+            self._reallocate(start=max(n_rows, (self._capacity - self._size) // 2))
+        position = self._start - n_rows
+        self._prepare_write(position, self._start)
+        self._data[position:self._start] = rows
+        self._start = position
+        self._size = min(self._size + n_rows, self._maxlen)
+        self._version += 1
+
+    def clear(self):
+        self._start = self._capacity // 2
+        self._size = 0
+        self._version += 1
+
+    def _as_rows(self, rows: Iterable[Iterable[float]]) -> np.ndarray:
+        rows = np.asarray(rows if isinstance(rows, np.ndarray) else list(rows), dtype=float)
+        if rows.size == 0:
+            return np.empty((0, self._n_columns), dtype=float)
+        if rows.ndim != 2 or rows.shape[1] != self._n_columns:
+            raise ValueError(f"Candles must be rows of {self._n_columns} values.")
+        return rows
+
+    def _prepare_write(self, low: int, high: int):
+        if low < self._exported_high and high > self._exported_low:
+            self._reallocate(start=self._start)
+
+    def _reallocate(self, start: int):
+        """
+        Moves the stored candles to a new backing array starting at the given physical row. The previous array is left
+        untouched since it may still be referenced by views.
+        """
+        start = max(0, min(start, self._capacity - self._size))
+        data = np.empty((self._capacity, self._n_columns), dtype=float)
+        data[start:start + self._size] = self._data[self._start:self._start + self._size]
+        self._data = data
+        self._start = start
+        self._exported_low = self._capacity
+        self._exported_high = 0
@@ -0,0 +1,125 @@
+import json
+import logging
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+
+class CandlesStore:
+    """
+    Persistent local store of historical candles.
+
+    Candles of each feed (exchange and trading pair, see CandlesBase.name) and interval are kept in a numpy file in
+    column-major order, so every column is contiguous on disk and the file can be memory mapped to read a time range
+    without loading the whole history. A JSON file next to it keeps the time ranges already fetched from the exchange,
+    which allows requesting only the missing ranges, including periods where the exchange had no candles.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, root_path: Optional[str] = None):
+        self._root_path = root_path or os.path.join(data_path(), "candles")
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path
+
+    def _base_path(self, name: str, interval: str) -> str:
+        return os.path.join(self._root_path, name, interval)
+
+    def _candles_file(self, name: str, interval: str) -> str:
+        return f"{self._base_path(name, interval)}.npy"
+
+    def _metadata_file(self, name: str, interval: str) -> str:
+        return f"{self._base_path(name, interval)}.json"
+
+    def covered_ranges(self, name: str, interval: str) -> List[Tuple[int, int]]:
+        """
+        Returns the time ranges (inclusive, in seconds) already fetched for the feed and interval.
+        """
+        metadata_file = self._metadata_file(name, interval)
+        if not os.path.exists(metadata_file):
+            return []
+        try:
+            with open(metadata_file, "r") as file:
+                return [(int(start), int(end)) for start, end in json.load(file)["covered"]]
+        except (ValueError, KeyError, TypeError):
+            self.logger().warning(f"Invalid candles store metadata in {metadata_file}. Ignoring stored candles.")
+            return []
+
+    def missing_ranges(self, name: str, interval: str, interval_in_seconds: int,
+                       start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Returns the parts of [start_time, end_time] (inclusive, aligned to the interval) not fetched yet.
+        """
+        missing = []
+        current_start = start_time
+        for covered_start, covered_end in self.covered_ranges(name, interval):
+            if covered_end < current_start:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > current_start:
+                missing.append((current_start, covered_start - interval_in_seconds))
+            current_start = max(current_start, covered_end + interval_in_seconds)
+        if current_start <= end_time:
+            missing.append((current_start, end_time))
+        return missing
+
+    def load(self, name: str, interval: str, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Returns the stored candles with timestamp in [start_time, end_time], sorted by timestamp. Only the requested
+        rows are read from disk.
+        """
+        candles_file = self._candles_file(name, interval)
+        if not os.path.exists(candles_file):
+            return np.empty((0, 0))
+        candles = np.load(candles_file, mmap_mode="r")
+        timestamps = candles[:, 0]
+        start_index = np.searchsorted(timestamps, start_time, side="left")
+        end_index = np.searchsorted(timestamps, end_time, side="right")
+        return np.array(candles[start_index:end_index])
+
+    def save(self, name: str, interval: str, interval_in_seconds: int, candles: np.ndarray,
+             covered_ranges: List[Tuple[int, int]]):
+        """
+        Merges the candles and the ranges they cover into the store. Files are replaced atomically, so readers that
+        memory mapped the previous version are not affected.
+        """
+        os.makedirs(os.path.dirname(self._base_path(name, interval)), exist_ok=True)
+        candles_file = self._candles_file(name, interval)
+        if os.path.exists(candles_file):
+            stored = np.load(candles_file)
+            candles = np.concatenate([stored, candles]) if len(candles) > 0 else stored
+        if len(candles) > 0:
+            # Keep the last version of each candle, the newly fetched one
+            timestamps = candles[::-1, 0]
+            _, unique_indexes = np.unique(timestamps, return_index=True)
+            candles = candles[::-1][unique_indexes]
+            self._atomic_write(candles_file, lambda file: np.save(file, np.asfortranarray(candles)))
+
+        ranges = sorted(self.covered_ranges(name, interval) + [(int(s), int(e)) for s, e in covered_ranges])
+        merged_ranges: List[List[int]] = []
+        for start, end in ranges:
+            if merged_ranges and start <= merged_ranges[-1][1] + interval_in_seconds:
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], end)
+            else:
+                merged_ranges.append([start, end])
+        self._atomic_write(self._metadata_file(name, interval),
+                           lambda file: file.write(json.dumps({"covered": merged_ranges}).encode()))
+
+    @staticmethod
+    def _atomic_write(path: str, write_function):
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            write_function(file)
+        os.replace(temporary_path, path)
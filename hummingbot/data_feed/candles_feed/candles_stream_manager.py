@@ -0,0 +1,215 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesStreamConnection:
+    """
+    A websocket connection shared by several candle feeds of the same exchange.
+
+    Each feed is identified by its stream key (see CandlesBase.ws_stream_key). Subscriptions are sent in batches when
+    feeds join or leave while the connection is open, and all the streams are subscribed again after a reconnection.
+    Messages are routed to the feeds of the stream they belong to.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, wss_url: str):
+        self._wss_url = wss_url
+        self._feeds_by_stream: Dict[str, List["CandlesBase"]] = {}
+        self._pending_subscriptions: Dict[str, "CandlesBase"] = {}
+        self._pending_unsubscriptions: Dict[str, "CandlesBase"] = {}
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._update_subscriptions_task: Optional[asyncio.Task] = None
+
+    @property
+    def feeds(self) -> List["CandlesBase"]:
+        return [feed for feeds in self._feeds_by_stream.values() for feed in feeds]
+
+    @property
+    def streams_count(self) -> int:
+        return len(self._feeds_by_stream)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws is not None
+
+    def add_feed(self, feed: "CandlesBase"):
+        stream_key = feed.ws_stream_key
+        feeds = self._feeds_by_stream.setdefault(stream_key, [])
+        if feed in feeds:
+            return
+        feeds.append(feed)
+        if len(feeds) == 1:
+            if self._pending_unsubscriptions.pop(stream_key, None) is None:
+                self._pending_subscriptions[stream_key] = feed
+            self._schedule_subscriptions_update()
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self.listen_for_subscriptions())
+
+    def remove_feed(self, feed: "CandlesBase"):
+        stream_key = feed.ws_stream_key
+        feeds = self._feeds_by_stream.get(stream_key, [])
+        if feed not in feeds:
+            return
+        feeds.remove(feed)
+        if len(feeds) == 0:
+            del self._feeds_by_stream[stream_key]
+            if self._pending_subscriptions.pop(stream_key, None) is None:
+                self._pending_unsubscriptions[stream_key] = feed
+            self._schedule_subscriptions_update()
+        if len(self._feeds_by_stream) == 0:
+            self.stop()
+
+    def stop(self):
+        if self._update_subscriptions_task is not None:
+            self._update_subscriptions_task.cancel()
+            self._update_subscriptions_task = None
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the candlestick websocket endpoint, subscribes to the streams of all the feeds and routes the
+        messages sent by the exchange. Reconnects when the connection is lost.
+        """
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                ws = await self.feeds[0]._connected_websocket_assistant()
+                self._ws = ws
+                self._pending_unsubscriptions.clear()
+                self._pending_subscriptions = {stream_key: feeds[0]
+                                               for stream_key, feeds in self._feeds_by_stream.items()}
+                await self._update_subscriptions()
+                await self._process_websocket_messages(websocket_assistant=ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                self._ws = None
+                ws and await ws.disconnect()
+                for feed in self.feeds:
+                    await feed._on_order_stream_interruption()
+
+    def _schedule_subscriptions_update(self):
+        if self._ws is not None and (self._update_subscriptions_task is None or self._update_subscriptions_task.done()):
+            self._update_subscriptions_task = safe_ensure_future(self._update_subscriptions())
+
+    async def _update_subscriptions(self):
+        """
+        Sends the pending subscriptions and unsubscriptions, grouped in as few requests as the exchange allows.
+        """
+        while self._ws is not None and (len(self._pending_unsubscriptions) > 0 or len(self._pending_subscriptions) > 0):
+            for pending, subscribe in ((self._pending_unsubscriptions, False), (self._pending_subscriptions, True)):
+                if len(pending) == 0:
+                    continue
+                feeds = list(pending.values())
+                pending.clear()
+                batch_size = feeds[0].ws_max_streams_per_request
+                for i in range(0, len(feeds), batch_size):
+                    batch = feeds[i:i + batch_size]
+                    payload = batch[0].ws_streams_subscription_payload(batch, subscribe=subscribe)
+                    await self._ws.send(WSJSONRequest(payload=payload))
+                self.logger().info(f"{'Subscribed to' if subscribe else 'Unsubscribed from'} {len(feeds)} "
+                                   f"public klines streams...")
+
+    async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            data = ws_response.data
+            feeds = self.feeds
+            if len(feeds) == 0:
+                continue
+            stream_feeds = self._feeds_by_stream.get(feeds[0].ws_message_stream_key(data))
+            if stream_feeds is None:
+                # messages not related to a stream may be ping or pong messages
+                parsed_message = feeds[0]._parse_websocket_message(data)
+                if isinstance(parsed_message, WSJSONRequest):
+                    await websocket_assistant.send(request=parsed_message)
+                continue
+            for feed in stream_feeds:
+                parsed_message = feed._parse_websocket_message(data)
+                if isinstance(parsed_message, dict):
+                    feed._process_candle_message(parsed_message)
+
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        while True:
+            ping_timeout = self.feeds[0]._ping_timeout if len(self.feeds) > 0 else None
+            try:
+                await asyncio.wait_for(self._process_websocket_messages_task(websocket_assistant=websocket_assistant),
+                                       timeout=ping_timeout)
+            except asyncio.TimeoutError:
+                if ping_timeout is not None:
+                    ping_request = WSJSONRequest(payload=self.feeds[0]._ping_payload)
+                    await websocket_assistant.send(request=ping_request)
+
+    @staticmethod
+    async def _sleep(delay):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
+
+
+class CandlesStreamManager:
+    """
+    Multiplexes the candle feeds of an exchange over as few websocket connections as possible.
+
+    There is one manager per websocket URL. Feeds join when they start and leave when they stop; a new connection is
+    only opened when the existing ones reached the maximum number of streams per connection of the exchange.
+    """
+    _instances: Dict[str, "CandlesStreamManager"] = {}
+
+    @classmethod
+    def get_instance(cls, wss_url: str) -> "CandlesStreamManager":
+        if wss_url not in cls._instances:
+            cls._instances[wss_url] = CandlesStreamManager(wss_url)
+        return cls._instances[wss_url]
+
+    def __init__(self, wss_url: str):
+        self._wss_url = wss_url
+        self._connections: List[CandlesStreamConnection] = []
+
+    @property
+    def connections(self) -> List[CandlesStreamConnection]:
+        return self._connections
+
+    def subscribe(self, feed: "CandlesBase"):
+        if any(feed in connection.feeds for connection in self._connections):
+            return
+        connection = next((connection for connection in self._connections
+                           if feed.ws_stream_key in connection._feeds_by_stream
+                           or connection.streams_count < feed.ws_max_streams_per_connection), None)
+        if connection is None:
+            connection = CandlesStreamConnection(self._wss_url)
+            self._connections.append(connection)
+        connection.add_feed(feed)
+
+    def unsubscribe(self, feed: "CandlesBase"):
+        for connection in self._connections:
+            if feed in connection.feeds:
+                connection.remove_feed(feed)
+        self._connections = [connection for connection in self._connections if connection.streams_count > 0]
+        if len(self._connections) == 0 and self._instances.get(self._wss_url) is self:
+            del self._instances[self._wss_url]
@@ -2,8 +2,6 @@ import logging
 import time
 from typing import List, Optional
 
-import pandas as pd
-
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
@@ -68,11 +66,6 @@ class KucoinSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
-        return df.sort_values(by="timestamp", ascending=True)
-
     @property
     def _ping_payload(self):
         return {
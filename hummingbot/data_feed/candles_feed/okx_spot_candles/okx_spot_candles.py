@@ -102,6 +102,20 @@ class OKXSpotCandles(CandlesBase):
             "args": candle_args
         }
 
+    @property
+    def ws_stream_key(self) -> Optional[str]:
+        return f"candle{CONSTANTS.INTERVALS[self.interval]}:{self._ex_trading_pair}"
+
+    def ws_message_stream_key(self, data: dict) -> Optional[str]:
+        if data is not None and "data" in data and "arg" in data:
+            return f"{data['arg']['channel']}:{data['arg']['instId']}"
+
+    def ws_streams_subscription_payload(self, feeds: List[CandlesBase], subscribe: bool = True) -> dict:
+        return {
+            "op": "subscribe" if subscribe else "unsubscribe",
+            "args": [feed.ws_subscription_payload()["args"][0] for feed in feeds]
+        }
+
     def _parse_websocket_message(self, data: dict):
         candles_row_dict = {}
         if data is not None and "data" in data:  # data will be None when the websocket is disconnected
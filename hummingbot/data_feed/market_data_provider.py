@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import math
 import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
@@ -11,11 +12,15 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_con
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.data_feed.candles_feed.aggregated_candles import AggregatedCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -30,11 +35,17 @@ class MarketDataProvider:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, connectors: Dict[str, ConnectorBase], rates_update_interval: int = 60):
+    def __init__(self, connectors: Dict[str, ConnectorBase], rates_update_interval: int = 60,
+                 candles_store: Optional[CandlesStore] = None, aggregate_candles: bool = True,
+                 order_book_rates_update_interval: float = 1.0):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.candles_store = candles_store  # Local store used to warm up the candle feeds
+        self.aggregate_candles = aggregate_candles  # Build higher intervals from an existing feed of the same pair
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
+        self._order_book_rates_update_task = None
+        self._order_book_rates_update_interval = order_book_rates_update_interval
         self._rates = {}
         self._rate_sources = {}
         self._rates_required = {}
@@ -47,6 +58,9 @@ class MarketDataProvider:
         if self._rates_update_task:
             self._rates_update_task.cancel()
             self._rates_update_task = None
+        if self._order_book_rates_update_task:
+            self._order_book_rates_update_task.cancel()
+            self._order_book_rates_update_task = None
         self.candles_feeds.clear()
 
     @property
@@ -78,38 +92,106 @@ class MarketDataProvider:
                     connector_pair.connector_name)
         if not self._rates_update_task:
             self._rates_update_task = safe_ensure_future(self.update_rates_task())
+        if not self._order_book_rates_update_task:
+            self._order_book_rates_update_task = safe_ensure_future(self.update_order_book_rates_task())
 
     async def update_rates_task(self):
         """
         Updates the rates for all rate sources.
+
+        The prices of the trading pairs with live order books in the trading connectors are set from their mid prices
+        by the order book rates task, the others are fetched from all the rate sources concurrently, so a slow source
+        doesn't delay the updates of the other ones.
         """
         while True:
-            rate_oracle = RateOracle.get_instance()
-            for connector, connector_pairs in self._rates_required.items():
-                if connector == "gateway":
-                    tasks = []
-                    for connector_pair in connector_pairs:
-                        connector, chain, network = connector_pair.connector_name.split("_")
-                        base, quote = connector_pair.trading_pair.split("-")
-                        tasks.append(
-                            self.gateway_client.get_price(
-                                chain=chain, network=network, connector=connector,
-                                base_asset=base, quote_asset=quote, amount=Decimal("1"),
-                                side=TradeType.BUY))
-                    try:
-                        results = await asyncio.gather(*tasks)
-                        for connector_pair, rate in zip(connector_pairs, results):
-                            rate_oracle.set_price(connector_pair.trading_pair, Decimal(rate["price"]))
-                    except Exception as e:
-                        self.logger().error(f"Error fetching prices from {connector_pairs}: {e}", exc_info=True)
+            tasks = []
+            for connector_name, connector_pairs in self._rates_required.items():
+                if connector_name == "gateway":
+                    tasks.append(self._update_gateway_rates(connector_pairs))
                 else:
-                    connector = self._rate_sources[connector]
-                    prices = await self._safe_get_last_traded_prices(connector,
-                                                                     [pair.trading_pair for pair in connector_pairs])
-                    for pair, rate in prices.items():
-                        rate_oracle.set_price(pair, rate)
+                    mid_prices = self._order_book_mid_prices(connector_name, connector_pairs)
+                    trading_pairs = [pair.trading_pair for pair in connector_pairs if pair.trading_pair not in mid_prices]
+                    if len(trading_pairs) > 0:
+                        tasks.append(self._update_connector_rates(connector_name, trading_pairs))
+            await safe_gather(*tasks, return_exceptions=True)
             await asyncio.sleep(self._rates_update_interval)
 
+    async def update_order_book_rates_task(self):
+        """
+        Updates the rates of the trading pairs with live order books in the trading connectors from their mid prices,
+        at a higher frequency than the rates fetched from the rate sources since no request is sent.
+        """
+        while True:
+            try:
+                rate_oracle = RateOracle.get_instance()
+                for connector_name, connector_pairs in self._rates_required.items():
+                    if connector_name == "gateway":
+                        continue
+                    for trading_pair, mid_price in self._order_book_mid_prices(connector_name, connector_pairs).items():
+                        rate_oracle.set_price(trading_pair, mid_price)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error updating the rates from the order books.", exc_info=True)
+            await asyncio.sleep(self._order_book_rates_update_interval)
+
+    async def _update_gateway_rates(self, connector_pairs: List[ConnectorPair]):
+        tasks = []
+        for connector_pair in connector_pairs:
+            connector, chain, network = connector_pair.connector_name.split("_")
+            base, quote = connector_pair.trading_pair.split("-")
+            tasks.append(
+                self.gateway_client.get_price(
+                    chain=chain, network=network, connector=connector,
+                    base_asset=base, quote_asset=quote, amount=Decimal("1"),
+                    side=TradeType.BUY))
+        try:
+            results = await safe_gather(*tasks)
+            rate_oracle = RateOracle.get_instance()
+            for connector_pair, rate in zip(connector_pairs, results):
+                rate_oracle.set_price(connector_pair.trading_pair, Decimal(rate["price"]))
+        except Exception as e:
+            self.logger().error(f"Error fetching prices from {connector_pairs}: {e}", exc_info=True)
+
+    async def _update_connector_rates(self, connector_name: str, trading_pairs: List[str]):
+        prices = await self._safe_get_last_traded_prices(self._rate_sources[connector_name], trading_pairs)
+        rate_oracle = RateOracle.get_instance()
+        for pair, rate in prices.items():
+            rate_oracle.set_price(pair, rate)
+
+    def _order_book_mid_prices(self, connector_name: str, connector_pairs: List[ConnectorPair]) -> Dict[str, Decimal]:
+        """
+        The mid prices of the trading pairs for which the trading connector of the given name has live order books.
+        """
+        connector = self.connectors.get(connector_name)
+        if connector is None:
+            return {}
+        try:
+            order_books = connector.order_books
+        except (AttributeError, NotImplementedError):
+            return {}
+        if not isinstance(order_books, dict):
+            return {}
+        mid_prices = {}
+        for connector_pair in connector_pairs:
+            order_book = order_books.get(connector_pair.trading_pair)
+            mid_price = self._order_book_mid_price(order_book) if order_book is not None else None
+            if mid_price is not None:
+                mid_prices[connector_pair.trading_pair] = mid_price
+        return mid_prices
+
+    @staticmethod
+    def _order_book_mid_price(order_book: OrderBook) -> Optional[Decimal]:
+        try:
+            best_bid = order_book.get_price(False)
+            best_ask = order_book.get_price(True)
+        except EnvironmentError:
+            # The order book is empty until its first snapshot is received
+            return None
+        if math.isnan(best_bid) or math.isnan(best_ask):
+            return None
+        return (Decimal(str(best_bid)) + Decimal(str(best_ask))) / Decimal("2")
+
     def initialize_candles_feed(self, config: CandlesConfig):
         """
         Initializes a candle feed based on the given configuration.
@@ -140,12 +222,29 @@ class MarketDataProvider:
             return existing_feed
         else:
             # Create a new feed or restart the existing one with updated max_records
-            candle_feed = CandlesFactory.get_candle(config)
+            base_feed = self._get_base_candles_feed(config) if self.aggregate_candles else None
+            if base_feed is not None:
+                candle_feed = AggregatedCandles(base_feed, config.interval, config.max_records)
+            else:
+                candle_feed = CandlesFactory.get_candle(config)
+            candle_feed.set_candles_store(self.candles_store)
             self.candles_feeds[key] = candle_feed
             if hasattr(candle_feed, 'start'):
                 candle_feed.start()
             return candle_feed
 
+    def _get_base_candles_feed(self, config: CandlesConfig) -> Optional[CandlesBase]:
+        """
+        Returns the running feed of the same connector and trading pair with the longest interval the candles of the
+        given configuration can be aggregated from, if any.
+        :param config: CandlesConfig
+        """
+        key_prefix = f"{config.connector}_{config.trading_pair}_"
+        base_feeds = [feed for key, feed in self.candles_feeds.items()
+                      if key.startswith(key_prefix) and isinstance(feed, CandlesBase) and
+                      AggregatedCandles.can_aggregate(feed, config.interval)]
+        return max(base_feeds, key=lambda feed: feed.interval_in_seconds, default=None)
+
     @staticmethod
     def _generate_candle_feed_key(config: CandlesConfig) -> str:
         """
@@ -163,8 +262,14 @@ class MarketDataProvider:
         key = self._generate_candle_feed_key(config)
         candle_feed = self.candles_feeds.get(key)
         if candle_feed and hasattr(candle_feed, 'stop'):
-            candle_feed.stop()
             del self.candles_feeds[key]
+            if isinstance(candle_feed, AggregatedCandles):
+                candle_feed.stop()
+                candle_feed = candle_feed.base_feed
+            # Base feeds keep running while there are feeds aggregated from them
+            if not any(feed is candle_feed or (isinstance(feed, AggregatedCandles) and feed.base_feed is candle_feed)
+                       for feed in self.candles_feeds.values()):
+                candle_feed.stop()
 
     def get_connector(self, connector_name: str) -> ConnectorBase:
         """
@@ -232,7 +337,8 @@ class MarketDataProvider:
             interval=interval,
             max_records=max_records,
         ))
-        return candles.candles_df.iloc[-max_records:]
+        candles_df = candles.candles_df
+        return candles_df if len(candles_df) <= max_records else candles_df.iloc[-max_records:]
 
     def get_trading_pairs(self, connector_name: str):
         """
@@ -354,7 +460,8 @@ class MarketDataProvider:
 
     async def _safe_get_last_traded_prices(self, connector, trading_pairs, timeout=5):
         try:
-            last_traded = await connector.get_last_traded_prices(trading_pairs=trading_pairs)
+            last_traded = await asyncio.wait_for(connector.get_last_traded_prices(trading_pairs=trading_pairs),
+                                                 timeout=timeout)
             return {pair: Decimal(rate) for pair, rate in last_traded.items()}
         except Exception as e:
             logging.error(
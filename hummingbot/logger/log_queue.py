@@ -0,0 +1,185 @@
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional, Tuple
+
+# Records waiting for the logging thread, beyond which new records are dropped
+LOG_QUEUE_SIZE = 10000
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Puts the records of a logger in the log queue, to be passed to the handlers of the logger on the logging thread.
+    The records are dropped, and counted, when the queue is full, so logging never blocks the calling thread.
+    """
+
+    def __init__(self, log_queue: "LogQueue", handlers: Iterable[logging.Handler]):
+        super().__init__(log_queue.queue)
+        self._log_queue = log_queue
+        self.target_handlers: Tuple[logging.Handler, ...] = ()
+        self.set_target_handlers(handlers)
+
+    def set_target_handlers(self, handlers: Iterable[logging.Handler]):
+        # Replaced, not modified, as the logging thread iterates over them
+        self.target_handlers = tuple(handlers)
+        self.setLevel(min((handler.level for handler in self.target_handlers), default=logging.NOTSET))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The message is merged with its arguments right away since they can change before the record is handled. The
+        # formatting, including the exception, is left to the handlers on the logging thread.
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            # The handlers are the ones of the logger when the record is logged
+            self.queue.put_nowait((self.target_handlers, record))
+        except queue.Full:
+            self._log_queue.count_dropped_record()
+
+
+class LogQueueListener(QueueListener):
+    """
+    Passes the records of the log queue to the handlers of their logger, on its own thread.
+    """
+
+    def __init__(self, log_queue: "LogQueue"):
+        super().__init__(log_queue.queue)
+        self._log_queue = log_queue
+
+    def enqueue_sentinel(self):
+        # Waits for room in the queue, the records queued before stopping are handled
+        self.queue.put(self._sentinel)
+
+    def handle(self, item: Tuple[Tuple[logging.Handler, ...], logging.LogRecord]):
+        handlers, record = item
+        self._call_handlers(handlers, record)
+        if self.queue.empty():
+            self._report_dropped_records(handlers)
+
+    def _report_dropped_records(self, handlers: Tuple[logging.Handler, ...]):
+        dropped_records = self._log_queue.unreported_dropped_records()
+        if dropped_records > 0:
+            record = logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": logging.getLevelName(logging.WARNING),
+                "msg": f"{dropped_records} log records were dropped because the log queue was full.",
+            })
+            root_queue_handler = self._log_queue.queue_handler(logging.getLogger())
+            self._call_handlers(root_queue_handler.target_handlers if root_queue_handler is not None else handlers,
+                                record)
+
+    @staticmethod
+    def _call_handlers(handlers: Tuple[logging.Handler, ...], record: logging.LogRecord):
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    # Keeps the logging thread alive
+                    handler.handleError(record)
+
+
+class LogQueue:
+    """
+    Moves the work of the log handlers, the formatting of the records and their I/O, off the event loop thread.
+
+    The handlers of the routed loggers are replaced by a LogQueueHandler putting the records in a bounded queue, and a
+    listener thread passes them to the original handlers. When the queue is full, the records are dropped instead of
+    blocking the caller, and the number of dropped records is logged once the queue is drained.
+    """
+    _shared_instance: Optional["LogQueue"] = None
+
+    @classmethod
+    def get_instance(cls) -> "LogQueue":
+        if cls._shared_instance is None:
+            cls._shared_instance = LogQueue()
+        return cls._shared_instance
+
+    def __init__(self, queue_size: int = LOG_QUEUE_SIZE):
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._listener = LogQueueListener(self)
+        self._started = False
+        self._dropped_records_lock = threading.Lock()
+        self._dropped_records = 0
+        self._reported_dropped_records = 0
+
+    @property
+    def queue(self) -> queue.Queue:
+        return self._queue
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    @property
+    def dropped_records(self) -> int:
+        """
+        The number of records dropped because the queue was full.
+        """
+        return self._dropped_records
+
+    def start(self, loggers: Iterable[logging.Logger]):
+        """
+        Routes the handlers of the loggers through the queue and starts the logging thread.
+        """
+        for logger in loggers:
+            self.route_logger(logger)
+        if not self._started:
+            self._listener.start()
+            self._started = True
+
+    def stop(self):
+        """
+        Stops the logging thread once the queued records are handled.
+        """
+        if self._started:
+            self._listener.stop()
+            self._started = False
+
+    def route_logger(self, logger: logging.Logger):
+        handlers = [handler for handler in logger.handlers if not isinstance(handler, LogQueueHandler)]
+        if len(handlers) == 0:
+            return
+        for handler in handlers:
+            logger.removeHandler(handler)
+        queue_handler = self.queue_handler(logger)
+        if queue_handler is None:
+            logger.addHandler(LogQueueHandler(self, handlers))
+        else:
+            queue_handler.set_target_handlers(queue_handler.target_handlers + tuple(handlers))
+
+    def queue_handler(self, logger: logging.Logger) -> Optional[LogQueueHandler]:
+        return next((handler for handler in logger.handlers if isinstance(handler, LogQueueHandler)), None)
+
+    def add_handler(self, logger: logging.Logger, handler: logging.Handler):
+        """
+        Adds a handler to a logger, behind the queue if the logger is routed through it.
+        """
+        queue_handler = self.queue_handler(logger)
+        if queue_handler is None:
+            logger.addHandler(handler)
+        elif handler not in queue_handler.target_handlers:
+            queue_handler.set_target_handlers(queue_handler.target_handlers + (handler,))
+
+    def remove_handler(self, logger: logging.Logger, handler: logging.Handler):
+        queue_handler = self.queue_handler(logger)
+        if queue_handler is not None:
+            queue_handler.set_target_handlers(h for h in queue_handler.target_handlers if h is not handler)
+        logger.removeHandler(handler)
+
+    def count_dropped_record(self):
+        with self._dropped_records_lock:
+            self._dropped_records += 1
+
+    def unreported_dropped_records(self) -> int:
+        with self._dropped_records_lock:
+            unreported_dropped_records = self._dropped_records - self._reported_dropped_records
+            self._reported_dropped_records = self._dropped_records
+        return unreported_dropped_records
@@ -2,6 +2,7 @@
 
 import asyncio
 import functools
+import json
 import logging
 import threading
 import time
@@ -27,8 +28,10 @@ from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParame
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
 from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.management.loop_monitor import EventLoopMonitor
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.logger.log_queue import LogQueue
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -578,6 +581,7 @@ class MQTTGateway(Node):
     _INTERVAL_HEALTH_CHECK = 1.0
     _INTERVAL_RESTART_SHORT = 5.0
     _INTERVAL_RESTART_LONG = 10.0
+    _INTERVAL_LOOP_METRICS = 10.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -598,6 +602,7 @@ class MQTTGateway(Node):
         self._initial_connection_succeeded = False
         self._restarting = False
         self._stop_event_async = asyncio.Event()
+        self._loop_metrics_task: Optional[asyncio.Task] = None
         self._notifier: MQTTNotifier = None
         self._status_updates: MQTTStatusUpdates = None
         self._market_events: MQTTMarketEventForwarder = None
@@ -688,10 +693,10 @@ class MQTTGateway(Node):
         return logging.getLogger()
 
     def remove_log_handler(self, logger: HummingbotLogger):
-        logger.removeHandler(self._logh)
+        LogQueue.get_instance().remove_handler(logger, self._logh)
 
     def add_log_handler(self, logger: HummingbotLogger):
-        logger.addHandler(self._logh)
+        LogQueue.get_instance().add_handler(logger, self._logh)
 
     def _init_notifier(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_notifier:
@@ -841,6 +846,30 @@ class MQTTGateway(Node):
     def _stop_health_monitoring_loop(self):
         self._stop_event_async.set()
 
+    def _start_loop_metrics_loop(self):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self._start_loop_metrics_loop)
+            return
+        if self._loop_metrics_task is None:
+            EventLoopMonitor.get_instance().start()
+            self._loop_metrics_task = safe_ensure_future(self._loop_metrics_loop(), loop=self._ev_loop)
+
+    def _stop_loop_metrics_loop(self):
+        if self._loop_metrics_task is not None:
+            self._loop_metrics_task.cancel()
+            self._loop_metrics_task = None
+
+    async def _loop_metrics_loop(self):
+        loop_monitor = EventLoopMonitor.get_instance()
+        while True:
+            await asyncio.sleep(self._INTERVAL_LOOP_METRICS)
+            try:
+                self.broadcast_status_update(json.dumps(loop_monitor.metrics()), msg_type="loop_metrics")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error publishing the event loop metrics.", exc_info=True)
+
     def start(self, with_health: bool = True) -> None:
         self._init_logger()
         self._init_notifier()
@@ -850,6 +879,8 @@ class MQTTGateway(Node):
 
         if with_health:
             self._start_health_monitoring_loop()
+            if self._hb_app.client_config_map.mqtt_bridge.mqtt_loop_metrics:
+                self._start_loop_metrics_loop()
 
         self.run()
         self.broadcast_status_update("online", msg_type="availability")
@@ -866,6 +897,7 @@ class MQTTGateway(Node):
 
         if with_health:
             self._stop_health_monitoring_loop()
+            self._stop_loop_metrics_loop()
 
     def __del__(self):
         self.stop()
@@ -881,7 +913,6 @@ class MQTTLogHandler(logging.Handler):
             )
         self._hb_app = hb_app
         self._node = node
-        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
 
         topic_prefix = TopicSpecs.PREFIX.format(
             namespace=self._node.namespace,
@@ -895,9 +926,8 @@ class MQTTLogHandler(logging.Handler):
                                                    msg_type=LogMessage)
 
     def emit(self, record: logging.LogRecord):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.emit, record)
-            return
+        # The log queue listener thread calls this, and the MQTT client publishes thread safely, so the record is
+        # formatted and published right away instead of on the event loop.
         msg_str = self.format(record)
         msg = LogMessage(
             timestamp=time.time(),
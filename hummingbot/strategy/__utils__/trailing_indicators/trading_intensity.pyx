@@ -22,7 +22,9 @@ cdef class TradesForwarder(EventListener):
         self._indicator = indicator
 
     cdef c_call(self, object arg):
-        self._indicator.c_register_trade(arg)
+        # Called with the trades of an event loop iteration or clock tick
+        for trade in arg:
+            self._indicator.c_register_trade(trade)
 
 
 cdef class TradingIntensityIndicator:
@@ -34,7 +36,7 @@ cdef class TradingIntensityIndicator:
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
-        self._order_book.c_add_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
+        self._order_book.c_add_batch_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import Any, Optional
+
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+
+class BacktestingCache:
+    """
+    Content addressed store of the intermediate results of the backtests.
+
+    Entries are grouped by stage (e.g. the features computed by a controller or the output of a simulation) and keyed
+    by a hash of everything the stage depends on: the fingerprints of the data it reads and the config fields it uses.
+    Running the same backtest again, or one that only changes the fields of a later stage, reuses the stored results of
+    the stages that didn't change. Entries are pickled to a file per key, written atomically, so the cache can be
+    shared by the processes of a parameter sweep.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, root_path: Optional[str] = None):
+        self._root_path = root_path or os.path.join(data_path(), "backtesting_cache")
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path
+
+    @staticmethod
+    def fingerprint(*parts: Any) -> str:
+        """
+        Returns a hash of the parts, which can be data frames, fingerprints or any JSON serializable value.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, pd.DataFrame):
+                digest.update(json.dumps(list(map(str, part.columns))).encode())
+                digest.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+            else:
+                digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _file(self, stage: str, key: str) -> str:
+        return os.path.join(self._root_path, stage, f"{key}.pkl")
+
+    def get(self, stage: str, key: str) -> Optional[Any]:
+        file_path = self._file(stage, key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "rb") as file:
+                return pickle.load(file)
+        except Exception:
+            self.logger().warning(f"Invalid backtesting cache entry {file_path}. Ignoring it.")
+            return None
+
+    def set(self, stage: str, key: str, value: Any):
+        file_path = self._file(stage, key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        try:
+            content = pickle.dumps(value)
+        except Exception:
+            self.logger().warning(f"The {stage} result can't be stored in the backtesting cache.", exc_info=True)
+            return
+        # The process id keeps concurrent writers of the same entry from sharing the temporary file
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(content)
+        os.replace(temporary_path, file_path)
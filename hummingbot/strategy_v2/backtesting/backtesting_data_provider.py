@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 
@@ -11,6 +11,7 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
@@ -26,13 +27,15 @@ class BacktestingDataProvider(MarketDataProvider):
                            "polkadex", "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
-        super().__init__(connectors)
+    def __init__(self, connectors: Dict[str, ConnectorBase], candles_store: Optional[CandlesStore] = None):
+        super().__init__(connectors, candles_store=candles_store or CandlesStore())
         self.start_time = None
         self.end_time = None
         self.prices = {}
         self._time = None
         self.trading_rules = {}
+        # Keys of the candles set with set_candles_feeds, which are never fetched again
+        self._fixed_candles_feed_keys = set()
         self.conn_settings = AllConnectorSettings.get_connector_settings()
         self.connectors = {name: self.get_connector(name) for name, settings in self.conn_settings.items()
                            if settings.type in self.CONNECTOR_TYPES and name not in self.EXCLUDED_CONNECTORS and
@@ -85,23 +88,37 @@ class BacktestingDataProvider(MarketDataProvider):
         self.end_time = end_time
         self._time = start_time
 
+    def set_candles_feeds(self, candles_feeds: Dict[str, pd.DataFrame]):
+        """
+        Sets candles that are used for every backtest instead of being fetched, like the ones a parameter sweep loads
+        once for all its workers.
+        :param candles_feeds: candles by feed key
+        """
+        self.candles_feeds.update(candles_feeds)
+        self._fixed_candles_feed_keys.update(candles_feeds.keys())
+
     async def get_candles_feed(self, config: CandlesConfig):
         """
         Retrieves or creates and starts a candle feed based on the given configuration.
-        If an existing feed has a higher or equal max_records, it is reused.
+        If an existing feed covers the backtesting time range, it is reused.
         :param config: CandlesConfig
         :return: Candle feed instance.
         """
         key = self._generate_candle_feed_key(config)
+        if key in self._fixed_candles_feed_keys:
+            return self.candles_feeds[key]
         existing_feed = self.candles_feeds.get(key, pd.DataFrame())
 
         if not existing_feed.empty:
             existing_feed_start_time = existing_feed["timestamp"].min()
             existing_feed_end_time = existing_feed["timestamp"].max()
-            if existing_feed_start_time <= self.start_time and existing_feed_end_time >= self.end_time:
+            # The last candle needed is the one open at the end time, which only matches it on interval boundaries
+            last_candle_time = self.end_time - CandlesBase.interval_to_seconds[config.interval]
+            if existing_feed_start_time <= self.start_time and existing_feed_end_time > last_candle_time:
                 return existing_feed
         # Create a new feed or restart the existing one with updated max_records
         candle_feed = CandlesFactory.get_candle(config)
+        candle_feed.set_candles_store(self.candles_store)
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
         candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
             connector_name=config.connector,
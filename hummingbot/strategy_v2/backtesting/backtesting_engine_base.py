@@ -1,8 +1,9 @@
+import hashlib
 import importlib
 import inspect
 import os
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -12,12 +13,14 @@ from hummingbot.client import settings
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
+from hummingbot.strategy_v2.backtesting.backtesting_cache import BacktestingCache
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
-from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation, SimulationCandles
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
 )
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
@@ -30,12 +33,19 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class BacktestingEngineBase:
-    def __init__(self):
+    FEATURES_STAGE = "features"
+    SIMULATION_STAGE = "simulation"
+    # Fields of the base controller configs that are used to compute the features, the rest only affect the executors
+    FEATURES_BASE_CONFIG_FIELDS = {"controller_name", "controller_type", "connector_name", "trading_pair",
+                                   "candles_config"}
+
+    def __init__(self, cache: Optional[BacktestingCache] = None):
         self.controller = None
         self.backtesting_resolution = None
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
+        self.cache = cache
 
     @classmethod
     def load_controller_config(cls,
@@ -90,15 +100,98 @@ class BacktestingEngineBase:
                                            actions_queue=None)
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
-        await self.controller.update_processed_data()
+        if self.cache is None:
+            await self.controller.update_processed_data()
+            return await self.run_simulation(trade_cost)
+
+        features_key = self.get_features_key(start, end)
+        simulation_key = self.get_simulation_key(features_key, trade_cost)
+        backtesting_result = self.cache.get(self.SIMULATION_STAGE, simulation_key)
+        if backtesting_result is not None:
+            # The cached simulation can come from a config with another id
+            backtesting_result["executors"] = self.with_controller_id(backtesting_result["executors"],
+                                                                      self.controller.config.id)
+            self.controller.processed_data = backtesting_result["processed_data"]
+            self.controller.executors_info = backtesting_result["executors"]
+            return backtesting_result
+
+        processed_data = self.cache.get(self.FEATURES_STAGE, features_key)
+        if processed_data is not None:
+            self.controller.processed_data.update(processed_data)
+        else:
+            await self.controller.update_processed_data()
+            self.cache.set(self.FEATURES_STAGE, features_key, self.controller.processed_data)
+        backtesting_result = await self.run_simulation(trade_cost)
+        self.cache.set(self.SIMULATION_STAGE, simulation_key, backtesting_result)
+        return backtesting_result
+
+    async def run_simulation(self, trade_cost: float) -> Dict[str, Any]:
         executors_info = await self.simulate_execution(trade_cost=trade_cost)
-        results = self.summarize_results(executors_info, controller_config.total_amount_quote)
+        results = self.summarize_results(executors_info, self.controller.config.total_amount_quote)
         return {
             "executors": executors_info,
             "results": results,
             "processed_data": self.controller.processed_data,
         }
 
+    def get_features_key(self, start: int, end: int) -> str:
+        """
+        Returns the cache key of the features computed by the controller: the data range, the candles the controller
+        reads, the config fields that can be used to compute the features and the code of the controller.
+        """
+        candles = [self.controller.market_data_provider.get_candles_df(candles_config.connector,
+                                                                       candles_config.trading_pair,
+                                                                       candles_config.interval)
+                   for candles_config in self.controller.config.candles_config]
+        return self.cache.fingerprint(start, end, self.get_features_config_data(self.controller.config),
+                                      self.get_controller_code_fingerprint(), *candles)
+
+    def get_simulation_key(self, features_key: str, trade_cost: float) -> str:
+        """
+        Returns the cache key of the simulation: the features, the backtesting candles and the whole config but its id,
+        which is generated for every config created without one.
+        """
+        backtesting_candles = self.controller.market_data_provider.get_candles_df(
+            self.controller.config.connector_name, self.controller.config.trading_pair, self.backtesting_resolution)
+        return self.cache.fingerprint(features_key, self.backtesting_resolution, trade_cost,
+                                      self.controller.config.dict(exclude={"id"}), backtesting_candles)
+
+    @staticmethod
+    def with_controller_id(executors_info: List[ExecutorInfo], controller_id: str) -> List[ExecutorInfo]:
+        """
+        Returns copies of the executors info and their configs with the given controller id.
+        """
+        return [executor_info.copy(update={
+            "config": executor_info.config.copy(update={"controller_id": controller_id}),
+            "controller_id": controller_id if executor_info.controller_id is not None else None,
+        }) for executor_info in executors_info]
+
+    @classmethod
+    def get_features_config_data(cls, controller_config: ControllerConfigBase) -> Dict[str, Any]:
+        """
+        Returns the config fields that can change the features: the ones added by the controller and the ones of the
+        base configs that identify the controller and its market data. Fields like the spreads or the triple barrier
+        only affect the executors, so changing them doesn't invalidate the cached features.
+        """
+        base_config_fields = (set(ControllerConfigBase.__fields__) |
+                              set(DirectionalTradingControllerConfigBase.__fields__) |
+                              set(MarketMakingControllerConfigBase.__fields__)) - cls.FEATURES_BASE_CONFIG_FIELDS
+        return {field: value for field, value in controller_config.dict().items() if field not in base_config_fields}
+
+    def get_controller_code_fingerprint(self) -> str:
+        return self.get_controller_class_code_fingerprint(type(self.controller))
+
+    @staticmethod
+    def get_controller_class_code_fingerprint(controller_class: type) -> str:
+        """
+        Returns a hash of the source file of the controller class, or an empty string if it can't be read.
+        """
+        try:
+            with open(inspect.getsourcefile(controller_class), "rb") as file:
+                return hashlib.sha256(file.read()).hexdigest()
+        except (OSError, TypeError):
+            return ""
+
     async def initialize_backtesting_data_provider(self):
         backtesting_config = CandlesConfig(
             connector=self.controller.config.connector_name,
@@ -113,6 +206,10 @@ class BacktestingEngineBase:
         """
         Simulates market making strategy over historical data, considering trading costs.
 
+        The controller is only evaluated at the rows where it can propose an action (see get_actionable_rows). The
+        executor simulations are precomputed when the executors are created, so the state of the active executors at
+        any timestamp is looked up instead of being stepped row by row.
+
         Args:
             trade_cost (float): The cost per trade.
 
@@ -121,12 +218,17 @@ class BacktestingEngineBase:
         """
         processed_features = self.prepare_market_data()
         self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.active_executors_start_timestamps = np.empty(0)
+        self.active_executors_close_timestamps = np.empty(0)
         self.stopped_executors_info: List[ExecutorInfo] = []
-        for i, row in processed_features.iterrows():
+        columns = [(column, processed_features[column].to_numpy()) for column in processed_features.columns]
+        candles = SimulationCandles.from_df(processed_features)
+        for i in np.flatnonzero(self.get_actionable_rows(processed_features)):
+            row = {column: values[i] for column, values in columns}
             await self.update_state(row)
             for action in self.controller.determine_executor_actions():
                 if isinstance(action, CreateExecutorAction):
-                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
+                    executor_simulation = self.simulate_executor(action.executor_config, candles, i, trade_cost)
                     if executor_simulation.close_type != CloseType.FAILED:
                         self.manage_active_executors(executor_simulation)
                 elif isinstance(action, StopExecutorAction):
@@ -134,24 +236,57 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
-    async def update_state(self, row):
+    def get_actionable_rows(self, processed_features: pd.DataFrame) -> np.ndarray:
+        """
+        Returns a boolean mask of the rows where the controller has to be evaluated.
+
+        Directional controllers that keep the default action logic only create executors when the signal is not 0 and
+        never stop them, so the rest of the rows can be skipped. Any other controller is evaluated at every row. The
+        last row is always evaluated to leave the controller in its final state.
+
+        Args:
+            processed_features (pd.DataFrame): The prepared market data.
+
+        Returns:
+            np.ndarray: Boolean mask with one value per row.
+        """
+        controller_class = type(self.controller)
+        is_signal_driven = isinstance(self.controller, DirectionalTradingControllerBase) and all(
+            getattr(controller_class, method) is getattr(DirectionalTradingControllerBase, method)
+            for method in ("determine_executor_actions", "create_actions_proposal", "stop_actions_proposal"))
+        if is_signal_driven and "signal" in processed_features:
+            actionable_rows = processed_features["signal"].to_numpy() != 0
+        else:
+            actionable_rows = np.ones(len(processed_features), dtype=bool)
+        if len(actionable_rows) > 0:
+            actionable_rows[-1] = True
+        return actionable_rows
+
+    async def update_state(self, row: Union[Dict, pd.Series]):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
         self.controller.market_data_provider._time = row["timestamp"]
-        self.controller.processed_data.update(row.to_dict())
+        self.controller.processed_data.update(row.to_dict() if isinstance(row, pd.Series) else row)
         self.update_executors_info(row["timestamp"])
 
     def update_executors_info(self, timestamp: float):
-        active_executors_info = []
-        simulations_to_remove = []
-        for executor in self.active_executor_simulations:
-            executor_info = executor.get_executor_info_at_timestamp(timestamp)
-            if executor_info.status == RunnableStatus.TERMINATED:
-                self.stopped_executors_info.append(executor_info)
-                simulations_to_remove.append(executor.config.id)
-            else:
-                active_executors_info.append(executor_info)
-        self.active_executor_simulations = [es for es in self.active_executor_simulations if es.config.id not in simulations_to_remove]
+        terminated = ((self.active_executors_start_timestamps > timestamp) |
+                      (self.active_executors_close_timestamps <= timestamp))
+        if terminated.any():
+            # Executors that finished since the last update are stopped in the order they finished
+            terminated_indexes = np.flatnonzero(terminated)
+            terminated_indexes = terminated_indexes[
+                np.argsort(self.active_executors_close_timestamps[terminated_indexes], kind="stable")]
+            for index in terminated_indexes:
+                self.stopped_executors_info.append(
+                    self.active_executor_simulations[index].get_executor_info_at_timestamp(timestamp))
+            self.active_executor_simulations = [simulation for simulation, is_terminated in
+                                                zip(self.active_executor_simulations, terminated)
+                                                if not is_terminated]
+            self.active_executors_start_timestamps = self.active_executors_start_timestamps[~terminated]
+            self.active_executors_close_timestamps = self.active_executors_close_timestamps[~terminated]
+        active_executors_info = [simulation.get_executor_info_at_timestamp(timestamp)
+                                 for simulation in self.active_executor_simulations]
         self.controller.executors_info = active_executors_info + self.stopped_executors_info
 
     async def update_processed_data(self, row: pd.Series):
@@ -194,23 +329,24 @@ class BacktestingEngineBase:
         self.controller.processed_data["features"] = backtesting_candles
         return backtesting_candles
 
-    def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
-                          trade_cost: float) -> Optional[ExecutorSimulation]:
+    def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], candles: SimulationCandles,
+                          start_index: int, trade_cost: float) -> Optional[ExecutorSimulation]:
         """
         Simulates the execution of a trading strategy given a configuration.
 
         Args:
             config (PositionExecutorConfig): The configuration of the executor.
-            df (pd.DataFrame): DataFrame containing the market data from the start time.
+            candles (SimulationCandles): The market data arrays shared by all the simulations.
+            start_index (int): The index of the candle where the executor is created.
             trade_cost (float): The cost per trade.
 
         Returns:
             ExecutorSimulation: The results of the simulation.
         """
         if isinstance(config, DCAExecutorConfig):
-            return self.dca_executor_simulator.simulate(df, config, trade_cost)
+            return self.dca_executor_simulator.simulate_from_index(candles, start_index, config, trade_cost)
         elif isinstance(config, PositionExecutorConfig):
-            return self.position_executor_simulator.simulate(df, config, trade_cost)
+            return self.position_executor_simulator.simulate_from_index(candles, start_index, config, trade_cost)
         return None
 
     def manage_active_executors(self, simulation: ExecutorSimulation):
@@ -219,10 +355,13 @@ class BacktestingEngineBase:
 
         Args:
             simulation (ExecutorSimulation): The simulation results of the current executor.
-            active_executors (list): The list of active executors.
         """
-        if not simulation.executor_simulation.empty:
+        if not simulation.is_empty:
             self.active_executor_simulations.append(simulation)
+            self.active_executors_start_timestamps = np.append(self.active_executors_start_timestamps,
+                                                               simulation.start_timestamp)
+            self.active_executors_close_timestamps = np.append(self.active_executors_close_timestamps,
+                                                               simulation.close_timestamp)
 
     def handle_stop_action(self, action: StopExecutorAction, timestamp: pd.Timestamp):
         """
@@ -230,18 +369,20 @@ class BacktestingEngineBase:
 
         Args:
             action (StopExecutorAction): The action indicating which executor to stop.
-            active_executors (list): The list of active executors.
             timestamp (pd.Timestamp): The current timestamp.
         """
-        for executor in self.active_executor_simulations:
-            executor_info = executor.get_executor_info_at_timestamp(timestamp)
-            if executor_info.config.id == action.executor_id:
+        for index, executor in enumerate(self.active_executor_simulations):
+            if executor.config.id == action.executor_id:
+                executor_info = executor.get_executor_info_at_timestamp(timestamp)
                 executor_info.status = RunnableStatus.TERMINATED
                 executor_info.close_type = CloseType.EARLY_STOP
                 executor_info.is_active = False
                 executor_info.close_timestamp = timestamp
                 self.stopped_executors_info.append(executor_info)
-                self.active_executor_simulations.remove(executor)
+                del self.active_executor_simulations[index]
+                self.active_executors_start_timestamps = np.delete(self.active_executors_start_timestamps, index)
+                self.active_executors_close_timestamps = np.delete(self.active_executors_close_timestamps, index)
+                break
 
     @staticmethod
     def summarize_results(executors_info: List, total_amount_quote: float = 1000):
@@ -1,9 +1,11 @@
 from decimal import Decimal
-from typing import Union
+from typing import Iterator, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr
 
+from hummingbot.core.data_type.common import TradeType
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -11,24 +13,130 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
+class SimulationCandles:
+    """
+    Read-only market data arrays shared by all the executor simulations of a backtest.
+    """
+
+    def __init__(self, timestamp: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.timestamp = self._read_only(timestamp)
+        self.high = self._read_only(high)
+        self.low = self._read_only(low)
+        self.close = self._read_only(close)
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "SimulationCandles":
+        return cls(timestamp=df["timestamp"].to_numpy(dtype=float), high=df["high"].to_numpy(dtype=float),
+                   low=df["low"].to_numpy(dtype=float), close=df["close"].to_numpy(dtype=float))
+
+    @staticmethod
+    def _read_only(values: np.ndarray) -> np.ndarray:
+        values = np.array(values, dtype=float)
+        values.flags.writeable = False
+        return values
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def index_after(self, timestamp: float) -> int:
+        """
+        Returns the index of the first candle after the timestamp.
+        """
+        return int(np.searchsorted(self.timestamp, timestamp, side="right"))
+
+    @staticmethod
+    def iter_windows(start: int, end: int, initial_size: int = 256) -> Iterator[Tuple[int, int]]:
+        """
+        Splits the range in windows of increasing size, so searches for a barrier hit that happens soon only look at
+        a few candles and the ones that don't happen scan the range in a few vectorized steps.
+        """
+        size = initial_size
+        while start < end:
+            stop = min(start + size, end)
+            yield start, stop
+            start = stop
+            size *= 2
+
+    @staticmethod
+    def first_index(mask: np.ndarray) -> Optional[int]:
+        if len(mask) == 0:
+            return None
+        index = int(np.argmax(mask))
+        return index if mask[index] else None
+
+    def first_index_at_price(self, start: int, end: int, price: float, side: TradeType) -> Optional[int]:
+        """
+        Returns the index of the first candle in the range that closed at or beyond the price, below it for buys and
+        above it for sells.
+        """
+        for window_start, window_end in self.iter_windows(start, end):
+            close = self.close[window_start:window_end]
+            index = self.first_index(close <= price if side == TradeType.BUY else close >= price)
+            if index is not None:
+                return window_start + index
+        return None
+
+
 class ExecutorSimulation(BaseModel):
+    """
+    Result of the simulation of an executor, from its creation (start_index) to its close (end_index - 1).
+
+    The state of the executor at each candle is derived when requested from the shared candles and the fills of the
+    position: the candle index, price, quote amount and resulting average price of each fill.
+    """
     config: Union[PositionExecutorConfig, DCAExecutorConfig]
-    executor_simulation: pd.DataFrame
     close_type: CloseType
+    candles: SimulationCandles
+    start_index: int
+    end_index: int
+    fill_indexes: np.ndarray
+    fill_prices: np.ndarray
+    fill_amounts_quote: np.ndarray
+    average_prices: np.ndarray
+    initial_average_price: float
+    trade_cost: float
+
+    _side_multiplier: int = PrivateAttr()
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
 
-    @validator('executor_simulation', pre=True, always=True)
-    def validate_dataframe(cls, v):
-        if not isinstance(v, pd.DataFrame):
-            raise ValueError("executor_simulation must be a pandas DataFrame")
-        return v
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._side_multiplier = 1 if self.config.side == TradeType.BUY else -1
+
+    @property
+    def is_empty(self) -> bool:
+        return self.end_index <= self.start_index
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.candles.timestamp[self.start_index:self.end_index]
+
+    @property
+    def start_timestamp(self) -> float:
+        return self.candles.timestamp[self.start_index] if not self.is_empty else np.nan
+
+    @property
+    def close_timestamp(self) -> float:
+        return self.candles.timestamp[self.end_index - 1] if not self.is_empty else np.nan
+
+    def _state_at_index(self, index: int) -> Tuple[float, float, float, float]:
+        """
+        Returns the net pnl pct, net pnl quote, filled amount quote and position average price at the candle index.
+        """
+        fills = int(np.searchsorted(self.fill_indexes, index, side="right"))
+        if fills == 0:
+            return 0.0, 0.0, 0.0, self.initial_average_price
+        returns = (self.candles.close[index] / self.fill_prices[:fills] - 1) * self._side_multiplier - self.trade_cost
+        net_pnl_quote = float(np.dot(returns, self.fill_amounts_quote[:fills]))
+        filled_amount_quote = float(self.fill_amounts_quote[:fills].sum())
+        return net_pnl_quote / filled_amount_quote, net_pnl_quote, filled_amount_quote, self.average_prices[fills - 1]
 
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
-        # Filter the DataFrame up to the specified timestamp
-        df_up_to_timestamp = self.executor_simulation[self.executor_simulation['timestamp'] <= timestamp]
-        if df_up_to_timestamp.empty:
+        # The simulation is sorted by timestamp, so the last entry up to the timestamp is found with a binary search
+        entries_up_to_timestamp = np.searchsorted(self.timestamps, timestamp, side="right")
+        if entries_up_to_timestamp == 0:
             return ExecutorInfo(
                 id=self.config.id,
                 timestamp=self.config.timestamp,
@@ -44,38 +152,76 @@ class ExecutorSimulation(BaseModel):
                 custom_info={}
             )
 
-        last_entry = df_up_to_timestamp.iloc[-1]
-        is_active = last_entry['timestamp'] < self.executor_simulation['timestamp'].max()
+        index = self.start_index + entries_up_to_timestamp - 1
+        net_pnl_pct, net_pnl_quote, filled_amount_quote, average_price = self._state_at_index(index)
+        cum_fees_quote = self.trade_cost * filled_amount_quote
+        is_active = index < self.end_index - 1
+        if not is_active:
+            # The position is closed with an order of the same amount
+            filled_amount_quote *= 2
         return ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
             type=self.config.type,
-            close_timestamp=None if is_active else float(last_entry['timestamp']),
+            close_timestamp=None if is_active else float(self.candles.timestamp[index]),
             close_type=None if is_active else self.close_type,
             status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
             config=self.config,
-            net_pnl_pct=Decimal(last_entry['net_pnl_pct']),
-            net_pnl_quote=Decimal(last_entry['net_pnl_quote']),
-            cum_fees_quote=Decimal(last_entry['cum_fees_quote']),
-            filled_amount_quote=Decimal(last_entry['filled_amount_quote']),
+            net_pnl_pct=Decimal(net_pnl_pct),
+            net_pnl_quote=Decimal(net_pnl_quote),
+            cum_fees_quote=Decimal(cum_fees_quote),
+            filled_amount_quote=Decimal(filled_amount_quote),
             is_active=is_active,
-            is_trading=last_entry['filled_amount_quote'] > 0 and is_active,
-            custom_info=self.get_custom_info(last_entry)
+            is_trading=filled_amount_quote > 0 and is_active,
+            custom_info=self.get_custom_info(self.candles.close[index], average_price)
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
-        current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
+    def get_custom_info(self, close_price: float, current_position_average_price: float) -> dict:
         return {
-            "close_price": last_entry['close'],
+            "close_price": close_price,
             "level_id": self.config.level_id,
             "side": self.config.side,
             "current_position_average_price": current_position_average_price
         }
 
+    @property
+    def executor_simulation(self) -> pd.DataFrame:
+        """
+        Returns the state of the executor at each candle of the simulation, for reporting.
+        """
+        states = np.array([self._state_at_index(index) for index in range(self.start_index, self.end_index)])
+        states = states.reshape(-1, 4)
+        executor_simulation = pd.DataFrame({
+            "timestamp": self.timestamps,
+            "close": self.candles.close[self.start_index:self.end_index],
+            "net_pnl_pct": states[:, 0],
+            "net_pnl_quote": states[:, 1],
+            "cum_fees_quote": self.trade_cost * states[:, 2],
+            "filled_amount_quote": states[:, 2],
+            "current_position_average_price": states[:, 3],
+        })
+        if len(executor_simulation) > 0:
+            executor_simulation.loc[executor_simulation.index[-1], "filled_amount_quote"] *= 2
+        return executor_simulation
+
 
 class ExecutorSimulatorBase:
     """Base class for trading simulators."""
     def simulate(self, df: pd.DataFrame, config, trade_cost: float) -> ExecutorSimulation:
-        """Simulates trading based on provided configuration and market data."""
+        """Simulates trading based on provided configuration and market data starting at the executor creation."""
+        return self.simulate_from_index(SimulationCandles.from_df(df), 0, config, trade_cost)
+
+    def simulate_from_index(self, candles: SimulationCandles, start_index: int, config,
+                            trade_cost: float) -> ExecutorSimulation:
+        """Simulates trading on the shared market data arrays, starting at the candle where the executor is created."""
         # This method should be generic enough to handle various trading strategies.
         raise NotImplementedError
+
+    @staticmethod
+    def simulation_without_fills(candles: SimulationCandles, start_index: int, end_index: int, config,
+                                 trade_cost: float, close_type: CloseType,
+                                 initial_average_price: float) -> ExecutorSimulation:
+        return ExecutorSimulation(config=config, close_type=close_type, candles=candles, start_index=start_index,
+                                  end_index=end_index, fill_indexes=np.empty(0, dtype=int), fill_prices=np.empty(0),
+                                  fill_amounts_quote=np.empty(0), average_prices=np.empty(0),
+                                  initial_average_price=initial_average_price, trade_cost=trade_cost)
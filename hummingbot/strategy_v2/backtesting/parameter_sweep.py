@@ -0,0 +1,322 @@
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.backtesting.backtesting_cache import BacktestingCache
+
+# Space of a random search: list of choices or (low, high) range, integer if both bounds are integers
+SearchSpace = Dict[str, Union[Sequence[Any], Tuple[float, float]]]
+
+# Engine of each worker process, created once by the pool initializer
+_worker_engine = None
+_worker_shared_memory: List[shared_memory.SharedMemory] = []
+
+
+def grid_search_params(param_grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Returns every combination of the values of the parameter grid.
+    """
+    names = list(param_grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*[param_grid[name] for name in names])]
+
+
+def random_search_params(space: SearchSpace, n_samples: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Returns n_samples distinct random combinations of the search space.
+    """
+    rng = random.Random(seed)
+    samples = []
+    seen = set()
+    for _ in range(n_samples * 10):
+        if len(samples) == n_samples:
+            break
+        params = {}
+        for name, values in space.items():
+            if isinstance(values, tuple) and len(values) == 2:
+                low, high = values
+                params[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) \
+                    else rng.uniform(low, high)
+            else:
+                params[name] = rng.choice(list(values))
+        key = json.dumps(params, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            samples.append(params)
+    return samples
+
+
+def config_hash(config_data: Dict[str, Any], start: int, end: int, backtesting_resolution: str,
+                trade_cost: float, controller_fingerprint: str = "", candles_fingerprints: Sequence[str] = ()) -> str:
+    """
+    Returns a hash identifying a backtest: the controller config, the backtesting parameters, the code of the
+    controller and the candles it reads.
+    """
+    payload = json.dumps({"config": config_data, "start": start, "end": end,
+                          "backtesting_resolution": backtesting_resolution, "trade_cost": trade_cost,
+                          "controller_fingerprint": controller_fingerprint,
+                          "candles_fingerprints": list(candles_fingerprints)},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SweepResultsCache:
+    """
+    Stores the results of each backtest in a JSON file named after its config hash.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path or os.path.join(data_path(), "backtesting_sweeps")
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self._path, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        file_path = self._file(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as file:
+                return json.load(file)
+        except ValueError:
+            return None
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        os.makedirs(self._path, exist_ok=True)
+        temporary_path = f"{self._file(key)}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(entry, file, default=str)
+        os.replace(temporary_path, self._file(key))
+
+
+def _attach_shared_dataframe(spec: Dict[str, Any]) -> pd.DataFrame:
+    # The workers share the resource tracker of the parent process, which unregisters the segment when unlinking it
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    _worker_shared_memory.append(shm)
+    values = np.ndarray(spec["shape"], dtype=spec["dtype"], buffer=shm.buf)
+    values.flags.writeable = False
+    return pd.DataFrame(values, columns=spec["columns"], copy=False)
+
+
+def _init_worker(candles_specs: Dict[str, Dict[str, Any]], trading_rules: Dict[str, Any],
+                 cache_path: Optional[str] = None):
+    global _worker_engine
+    from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+    _worker_engine = BacktestingEngineBase(cache=BacktestingCache(cache_path) if cache_path is not None else None)
+    data_provider = _worker_engine.backtesting_data_provider
+    data_provider.set_candles_feeds({key: _attach_shared_dataframe(spec) for key, spec in candles_specs.items()})
+    data_provider.trading_rules = trading_rules
+
+
+def _run_backtest(key: str, config_data: Dict[str, Any], start: int, end: int, backtesting_resolution: str,
+                  trade_cost: float) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    try:
+        controller_config = _worker_engine.get_controller_config_instance_from_dict(config_data)
+        backtesting_result = asyncio.run(_worker_engine.run_backtesting(
+            controller_config, start, end, backtesting_resolution, trade_cost))
+        return key, backtesting_result["results"], None
+    except Exception as e:
+        return key, None, f"{type(e).__name__}: {e}"
+
+
+class ParameterSweep:
+    """
+    Runs the backtests of a controller config for a set of parameter combinations.
+
+    The candles required by all the combinations are downloaded once, copied to shared memory and used by every
+    worker of a process pool. Results are cached by config hash, which also covers the code of the controller and the
+    candles, so combinations already evaluated with the same code and data are not run again.
+    With a backtesting cache, the workers also share the features computed by the controller, so combinations that
+    only change executor parameters don't compute them again.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 base_config: Dict[str, Any],
+                 start: int,
+                 end: int,
+                 backtesting_resolution: str = "1m",
+                 trade_cost: float = 0.0006,
+                 max_workers: Optional[int] = None,
+                 results_cache: Optional[SweepResultsCache] = None,
+                 backtesting_cache: Optional[BacktestingCache] = None):
+        self.base_config = base_config
+        self.start = start
+        self.end = end
+        self.backtesting_resolution = backtesting_resolution
+        self.trade_cost = trade_cost
+        self.max_workers = max_workers or os.cpu_count()
+        self.results_cache = results_cache or SweepResultsCache()
+        self.backtesting_cache = backtesting_cache
+
+    def get_config_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        config_data = dict(self.base_config)
+        config_data.update(params)
+        return config_data
+
+    def get_config_hash(self, config_data: Dict[str, Any], candles: Dict[str, pd.DataFrame]) -> str:
+        """
+        Returns the config hash of a combination, with the fingerprints of the code of its controller and of the
+        candles it reads from the loaded candles.
+        """
+        from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+        controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(config_data)
+        controller_fingerprint = BacktestingEngineBase.get_controller_class_code_fingerprint(
+            controller_config.get_controller_class())
+        candles_fingerprints = []
+        for key, candles_config in sorted(self._candles_configs(controller_config).items()):
+            # Only the candles of the backtest are fingerprinted, the loaded ones can start earlier for other configs
+            start_time = self.start - candles_config.max_records * CandlesBase.interval_to_seconds[candles_config.interval]
+            candles_df = candles[key]
+            candles_fingerprints.append(BacktestingCache.fingerprint(candles_df[
+                (candles_df["timestamp"] >= start_time) & (candles_df["timestamp"] <= self.end)]))
+        return config_hash(config_data, self.start, self.end, self.backtesting_resolution, self.trade_cost,
+                           controller_fingerprint, candles_fingerprints)
+
+    def run(self, params_list: List[Dict[str, Any]],
+            on_result: Optional[Callable[[Dict[str, Any], int, int], None]] = None) -> pd.DataFrame:
+        """
+        Runs the backtests of the parameter combinations and returns a table with the parameters and the metrics of
+        summarize_results, one row per combination.
+        :param params_list: combinations of parameters, applied on top of the base config
+        :param on_result: called with each result row, the number of completed runs and the total
+        """
+        return pd.DataFrame(list(self.iter_results(params_list, on_result)))
+
+    def iter_results(self, params_list: List[Dict[str, Any]],
+                     on_result: Optional[Callable[[Dict[str, Any], int, int], None]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the result row of each combination as soon as it is available, cached results first.
+        """
+        pending: Dict[str, Dict[str, Any]] = {}
+        completed = 0
+        candles = self._load_candles([self.get_config_data(params) for params in params_list])
+        for params in params_list:
+            config_data = self.get_config_data(params)
+            key = self.get_config_hash(config_data, candles)
+            cached = self.results_cache.get(key)
+            if cached is not None:
+                completed += 1
+                row = self._result_row(key, params, cached["results"])
+                if on_result is not None:
+                    on_result(row, completed, len(params_list))
+                yield row
+            elif key not in pending:
+                pending[key] = params
+        if len(pending) == 0:
+            return
+
+        candles_specs, shared_segments = self._copy_candles_to_shared_memory({
+            key: candles[key]
+            for key in self._required_candles_configs([self.get_config_data(params) for params in pending.values()])})
+        try:
+            trading_rules = asyncio.run(self._load_trading_rules())
+            cache_path = self.backtesting_cache.root_path if self.backtesting_cache is not None else None
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                     initargs=(candles_specs, trading_rules, cache_path)) as executor:
+                futures = [executor.submit(_run_backtest, key, self.get_config_data(params), self.start, self.end,
+                                           self.backtesting_resolution, self.trade_cost)
+                           for key, params in pending.items()]
+                for future in as_completed(futures):
+                    key, results, error = future.result()
+                    completed += 1
+                    if error is not None:
+                        self.logger().error(f"Backtest of {pending[key]} failed: {error}")
+                        results = {}
+                    else:
+                        self.results_cache.set(key, {"config": self.get_config_data(pending[key]),
+                                                     "results": results})
+                    row = self._result_row(key, pending[key], results)
+                    if on_result is not None:
+                        on_result(row, completed, len(params_list))
+                    yield row
+        finally:
+            for segment in shared_segments:
+                segment.close()
+                segment.unlink()
+
+    @staticmethod
+    def _result_row(key: str, params: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+        row = {"config_hash": key[:12]}
+        row.update(params)
+        row.update({metric: value for metric, value in results.items() if metric != "close_types"})
+        return row
+
+    def _candles_configs(self, controller_config) -> Dict[str, CandlesConfig]:
+        """
+        Returns the candles read by the backtest of a controller config, by feed key.
+        """
+        configs = [CandlesConfig(connector=controller_config.connector_name,
+                                 trading_pair=controller_config.trading_pair,
+                                 interval=self.backtesting_resolution)] + list(controller_config.candles_config)
+        return {f"{candles_config.connector}_{candles_config.trading_pair}_{candles_config.interval}": candles_config
+                for candles_config in configs}
+
+    def _required_candles_configs(self, configs_data: List[Dict[str, Any]]) -> Dict[str, CandlesConfig]:
+        """
+        Returns the candles needed by the controller configs, by feed key, with the highest max_records requested.
+        """
+        from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+        candles_configs: Dict[str, CandlesConfig] = {}
+        for config_data in configs_data:
+            controller_config = BacktestingEngineBase.get_controller_config_instance_from_dict(config_data)
+            for key, candles_config in self._candles_configs(controller_config).items():
+                if key not in candles_configs or candles_configs[key].max_records < candles_config.max_records:
+                    candles_configs[key] = candles_config
+        return candles_configs
+
+    def _load_candles(self, configs_data: List[Dict[str, Any]]) -> Dict[str, pd.DataFrame]:
+        from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+        data_provider = BacktestingDataProvider(connectors={})
+        data_provider.update_backtesting_time(self.start, self.end)
+        return {key: asyncio.run(data_provider.get_candles_feed(candles_config))
+                for key, candles_config in self._required_candles_configs(configs_data).items()}
+
+    @staticmethod
+    def _copy_candles_to_shared_memory(candles: Dict[str, pd.DataFrame]):
+        candles_specs = {}
+        shared_segments = []
+        try:
+            for key, candles_df in candles.items():
+                values = np.ascontiguousarray(candles_df.to_numpy(dtype=float))
+                segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+                shared_segments.append(segment)
+                np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)[:] = values
+                candles_specs[key] = {"name": segment.name, "shape": values.shape, "dtype": values.dtype.str,
+                                      "columns": list(candles_df.columns)}
+        except Exception:
+            for segment in shared_segments:
+                segment.close()
+                segment.unlink()
+            raise
+        return candles_specs, shared_segments
+
+    async def _load_trading_rules(self) -> Dict[str, Any]:
+        from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+        data_provider = BacktestingDataProvider(connectors={})
+        await data_provider.initialize_trading_rules(self.base_config["connector_name"])
+        return data_provider.trading_rules
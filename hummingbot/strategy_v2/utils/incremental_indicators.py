@@ -0,0 +1,433 @@
+import math
+import sys
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+NaN = float("nan")
+EPSILON = sys.float_info.epsilon
+
+# Candle values passed to the indicators, in this order
+CANDLE_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+def _non_zero(value: float) -> float:
+    """
+    Mirrors pandas_ta non_zero_range, avoiding divisions by zero on flat ranges.
+    """
+    return value + EPSILON if value == 0 else value
+
+
+class _EMA:
+    """
+    Exponential moving average seeded with the SMA of the first `length` values (pandas_ta default).
+    The state is an immutable tuple (count, seed_sum, value) so it can be advanced speculatively.
+    """
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2.0 / (length + 1)
+
+    @staticmethod
+    def initial_state() -> tuple:
+        return 0, 0.0, NaN
+
+    def step(self, state: tuple, x: float) -> Tuple[tuple, float]:
+        if math.isnan(x):
+            return state, NaN
+        count, seed_sum, value = state
+        count += 1
+        if count < self.length:
+            return (count, seed_sum + x, NaN), NaN
+        if count == self.length:
+            value = (seed_sum + x) / self.length
+        else:
+            value = value + self.alpha * (x - value)
+        return (count, 0.0, value), value
+
+
+class _RMA:
+    """
+    Wilder's moving average as computed by pandas_ta (ewm with alpha 1 / length, adjust=True, min_periods=length).
+    The state is an immutable tuple (count, weighted_sum, weights_sum).
+    """
+    def __init__(self, length: int):
+        self.length = length
+        self.decay = 1.0 - 1.0 / length if length > 0 else 0.5
+
+    @staticmethod
+    def initial_state() -> tuple:
+        return 0, 0.0, 0.0
+
+    def step(self, state: tuple, x: float) -> Tuple[tuple, float]:
+        if math.isnan(x):
+            return state, NaN
+        count, weighted_sum, weights_sum = state
+        count += 1
+        weighted_sum = x + self.decay * weighted_sum
+        weights_sum = 1.0 + self.decay * weights_sum
+        value = weighted_sum / weights_sum if count >= self.length else NaN
+        return (count, weighted_sum, weights_sum), value
+
+
+class IncrementalIndicator:
+    """
+    Base class for indicators that are updated one candle at a time.
+
+    `update` consumes a closed candle and advances the internal state, while `peek` returns the values the indicator
+    would have for a forming candle without modifying the state. Both are O(1) on the number of stored candles.
+    Candles are passed as (timestamp, open, high, low, close, volume) tuples.
+    """
+
+    @property
+    def columns(self) -> List[str]:
+        raise NotImplementedError
+
+    def reset(self):
+        raise NotImplementedError
+
+    def update(self, candle: tuple) -> tuple:
+        raise NotImplementedError
+
+    def peek(self, candle: tuple) -> tuple:
+        raise NotImplementedError
+
+
+class _StatefulIndicator(IncrementalIndicator):
+    """
+    Helper base for indicators whose full state fits in an immutable value, so peek is a step without commit.
+    """
+    def __init__(self):
+        self._state = self._initial_state()
+
+    def _initial_state(self):
+        raise NotImplementedError
+
+    def _step(self, state, candle: tuple) -> Tuple[object, tuple]:
+        raise NotImplementedError
+
+    def reset(self):
+        self._state = self._initial_state()
+
+    def update(self, candle: tuple) -> tuple:
+        self._state, values = self._step(self._state, candle)
+        return values
+
+    def peek(self, candle: tuple) -> tuple:
+        return self._step(self._state, candle)[1]
+
+
+class EMA(_StatefulIndicator):
+    def __init__(self, length: int = 10):
+        self._ema = _EMA(length)
+        self.length = length
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self.length}"]
+
+    def _initial_state(self):
+        return self._ema.initial_state()
+
+    def _step(self, state, candle: tuple):
+        state, value = self._ema.step(state, candle[4])
+        return state, (value,)
+
+
+class MACD(_StatefulIndicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._fast_ema = _EMA(fast)
+        self._slow_ema = _EMA(slow)
+        self._signal_ema = _EMA(signal)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self.fast}_{self.slow}_{self.signal}"
+        return [f"MACD{props}", f"MACDh{props}", f"MACDs{props}"]
+
+    def _initial_state(self):
+        return self._fast_ema.initial_state(), self._slow_ema.initial_state(), self._signal_ema.initial_state()
+
+    def _step(self, state, candle: tuple):
+        fast_state, slow_state, signal_state = state
+        close = candle[4]
+        fast_state, fast_value = self._fast_ema.step(fast_state, close)
+        slow_state, slow_value = self._slow_ema.step(slow_state, close)
+        macd = fast_value - slow_value
+        signal_state, signal_value = self._signal_ema.step(signal_state, macd)
+        return (fast_state, slow_state, signal_state), (macd, macd - signal_value, signal_value)
+
+
+class RSI(_StatefulIndicator):
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._positive_rma = _RMA(length)
+        self._negative_rma = _RMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self.length}"]
+
+    def _initial_state(self):
+        return NaN, self._positive_rma.initial_state(), self._negative_rma.initial_state()
+
+    def _step(self, state, candle: tuple):
+        prev_close, positive_state, negative_state = state
+        close = candle[4]
+        diff = close - prev_close
+        positive_state, positive_avg = self._positive_rma.step(positive_state, max(diff, 0.0) if diff == diff else NaN)
+        negative_state, negative_avg = self._negative_rma.step(negative_state, min(diff, 0.0) if diff == diff else NaN)
+        total = positive_avg + abs(negative_avg)
+        rsi = 100 * positive_avg / total if total != 0 else NaN
+        return (close, positive_state, negative_state), (rsi,)
+
+
+class ATR(_StatefulIndicator):
+    """
+    Average true range smoothed with RMA, as the pandas_ta default.
+    """
+    def __init__(self, length: int = 14):
+        self.length = length
+        self._rma = _RMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"ATRr_{self.length}"]
+
+    def _initial_state(self):
+        return NaN, self._rma.initial_state()
+
+    def _true_range(self, prev_close: float, candle: tuple) -> float:
+        high, low = candle[2], candle[3]
+        if math.isnan(prev_close):
+            return NaN
+        return max(abs(_non_zero(high - low)), abs(high - prev_close), abs(prev_close - low))
+
+    def _step(self, state, candle: tuple):
+        prev_close, rma_state = state
+        rma_state, atr = self._rma.step(rma_state, self._true_range(prev_close, candle))
+        return (candle[4], rma_state), (atr,)
+
+
+class NATR(ATR):
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self.length}"]
+
+    def _step(self, state, candle: tuple):
+        state, (atr,) = super()._step(state, candle)
+        return state, (100 * atr / candle[4],)
+
+
+class SuperTrend(_StatefulIndicator):
+    def __init__(self, length: int = 7, multiplier: float = 3.0):
+        self.length = length
+        self.multiplier = multiplier
+        self._atr = ATR(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self.length}_{self.multiplier}"
+        return [f"SUPERT{props}", f"SUPERTd{props}", f"SUPERTl{props}", f"SUPERTs{props}"]
+
+    def _initial_state(self):
+        # (atr state, previous upper band, previous lower band, previous direction, is first candle)
+        return self._atr._initial_state(), NaN, NaN, 1, True
+
+    def _step(self, state, candle: tuple):
+        atr_state, prev_upper, prev_lower, prev_direction, is_first = state
+        high, low, close = candle[2], candle[3], candle[4]
+        atr_state, (atr,) = self._atr._step(atr_state, candle)
+        hl2 = (high + low) / 2
+        upper = hl2 + self.multiplier * atr
+        lower = hl2 - self.multiplier * atr
+        if is_first:
+            return (atr_state, upper, lower, 1, False), (0.0, 1, NaN, NaN)
+        if close > prev_upper:
+            direction = 1
+        elif close < prev_lower:
+            direction = -1
+        else:
+            direction = prev_direction
+            if direction > 0 and lower < prev_lower:
+                lower = prev_lower
+            if direction < 0 and upper > prev_upper:
+                upper = prev_upper
+        if direction > 0:
+            values = (lower, direction, lower, NaN)
+        else:
+            values = (upper, direction, NaN, upper)
+        return (atr_state, upper, lower, direction, False), values
+
+
+class BollingerBands(IncrementalIndicator):
+    """
+    Bollinger Bands over a rolling window, using population standard deviation (pandas_ta default ddof=0).
+    Keeps running sums of the window, re-summed every `length` updates to avoid floating point drift.
+    """
+    def __init__(self, length: int = 5, std: float = 2.0):
+        self.length = length
+        self.std = std
+        self._window = deque(maxlen=length)
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._updates_since_resum = 0
+
+    @property
+    def columns(self) -> List[str]:
+        props = f"_{self.length}_{self.std}"
+        return [f"BBL{props}", f"BBM{props}", f"BBU{props}", f"BBB{props}", f"BBP{props}"]
+
+    def reset(self):
+        self._window.clear()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._updates_since_resum = 0
+
+    def _values(self, window_sum: float, window_sum_sq: float, size: int, close: float) -> tuple:
+        if size < self.length:
+            return NaN, NaN, NaN, NaN, NaN
+        mid = window_sum / size
+        deviation = self.std * math.sqrt(max(window_sum_sq / size - mid * mid, 0.0))
+        lower = mid - deviation
+        upper = mid + deviation
+        bands_range = _non_zero(upper - lower)
+        return lower, mid, upper, 100 * bands_range / mid, _non_zero(close - lower) / bands_range
+
+    def _next_sums(self, close: float) -> Tuple[float, float, int]:
+        window_sum = self._sum + close
+        window_sum_sq = self._sum_sq + close * close
+        size = len(self._window) + 1
+        if size > self.length:
+            oldest = self._window[0]
+            window_sum -= oldest
+            window_sum_sq -= oldest * oldest
+            size = self.length
+        return window_sum, window_sum_sq, size
+
+    def update(self, candle: tuple) -> tuple:
+        close = candle[4]
+        self._sum, self._sum_sq, size = self._next_sums(close)
+        self._window.append(close)
+        self._updates_since_resum += 1
+        if self._updates_since_resum >= self.length:
+            self._sum = math.fsum(self._window)
+            self._sum_sq = math.fsum(value * value for value in self._window)
+            self._updates_since_resum = 0
+        return self._values(self._sum, self._sum_sq, size, close)
+
+    def peek(self, candle: tuple) -> tuple:
+        close = candle[4]
+        return self._values(*self._next_sums(close), close)
+
+
+class IndicatorEngine:
+    """
+    Maintains a set of incremental indicators over a streaming candles DataFrame.
+
+    Each call to `update` only feeds the candles closed since the previous call to the indicators, and evaluates the
+    last (forming) candle without committing it. When no candle closed and the forming candle did not change the
+    features are not rebuilt and `update` returns False, so callers can skip their own recalculation.
+
+    The indicators are seeded with the first candle seen and keep their state while the feed rolls, so values do not
+    depend on the size of the window passed in. If the feed is reset or its history is backfilled the state is rebuilt
+    from the whole DataFrame.
+    """
+    def __init__(self, indicators: List[IncrementalIndicator]):
+        self.indicators = indicators
+        self._columns: List[str] = [column for indicator in indicators for column in indicator.columns]
+        self._history: Dict[str, List[float]] = {column: [] for column in self._columns}
+        self._first_timestamp: Optional[float] = None
+        self._last_closed_timestamp: Optional[float] = None
+        self._forming_candle: Optional[tuple] = None
+        self._features: pd.DataFrame = pd.DataFrame()
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def features(self) -> pd.DataFrame:
+        """
+        Candles DataFrame of the last update with the indicator columns appended.
+        """
+        return self._features
+
+    def reset(self):
+        for indicator in self.indicators:
+            indicator.reset()
+        for values in self._history.values():
+            values.clear()
+        self._first_timestamp = None
+        self._last_closed_timestamp = None
+        self._forming_candle = None
+        self._features = pd.DataFrame()
+
+    def update(self, candles_df: pd.DataFrame) -> bool:
+        """
+        Updates the indicators with the candles DataFrame, the last row is considered the forming candle.
+        :param candles_df: candles sorted by timestamp in ascending order
+        :return: True if the features changed since the previous update
+        """
+        if candles_df.empty:
+            return False
+        data = [candles_df[column].to_numpy(dtype=float) for column in CANDLE_COLUMNS]
+        timestamps = data[0]
+        n_candles = len(timestamps)
+        if self._last_closed_timestamp is not None and not self._is_continuation(timestamps):
+            self.reset()
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamps[0]
+
+        start = 0 if self._last_closed_timestamp is None else \
+            int(np.searchsorted(timestamps, self._last_closed_timestamp, side="right"))
+        new_closed = max(n_candles - 1 - start, 0)
+        forming_candle = tuple(values[-1] for values in data)
+        if new_closed == 0 and forming_candle == self._forming_candle:
+            return False
+
+        if new_closed > 0:
+            self._commit(zip(*(values[start:n_candles - 1].tolist() for values in data)))
+            self._last_closed_timestamp = timestamps[-2]
+            self._trim_history(n_candles - 1)
+        self._forming_candle = forming_candle
+        self._features = self._build_features(candles_df, n_candles - 1)
+        return True
+
+    def _is_continuation(self, timestamps: np.ndarray) -> bool:
+        if timestamps[0] < self._first_timestamp:
+            return False
+        index = np.searchsorted(timestamps, self._last_closed_timestamp)
+        return index < len(timestamps) and timestamps[index] == self._last_closed_timestamp
+
+    def _commit(self, candles):
+        history = [self._history[column] for column in self._columns]
+        for candle in candles:
+            position = 0
+            for indicator in self.indicators:
+                for value in indicator.update(candle):
+                    history[position].append(value)
+                    position += 1
+
+    def _trim_history(self, keep: int):
+        for values in self._history.values():
+            if len(values) > 2 * keep:
+                del values[:-keep]
+
+    def _build_features(self, candles_df: pd.DataFrame, n_closed: int) -> pd.DataFrame:
+        features = candles_df.copy()
+        forming_values = [value for indicator in self.indicators for value in indicator.peek(self._forming_candle)]
+        for column, forming_value in zip(self._columns, forming_values):
+            closed_values = self._history[column][-n_closed:] if n_closed > 0 else []
+            padding = [NaN] * (n_closed - len(closed_values))
+            features[column] = np.array(padding + closed_values + [forming_value], dtype=float)
+        return features
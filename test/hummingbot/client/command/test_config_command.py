@@ -81,6 +81,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ mqtt_events                     | True                 |\n"
                            "    | ∟ mqtt_external_events            | True                 |\n"
                            "    | ∟ mqtt_autostart                  | False                |\n"
+                           "    | ∟ mqtt_loop_metrics               | False                |\n"
                            "    | send_error_logs                   | True                 |\n"
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
@@ -61,20 +61,20 @@ class CreateCommandTest(unittest.TestCase):
 
     @patch("shutil.copy")
     @patch("hummingbot.client.command.create_command.save_to_yml_legacy")
-    @patch("hummingbot.client.config.security.Security.is_decryption_done")
+    @patch("hummingbot.client.config.security.Security.is_connector_decryption_done")
     @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections")
     @patch("hummingbot.core.utils.market_price.get_last_price")
     def test_prompt_for_configuration_re_prompts_on_lower_than_minimum_amount(
         self,
         get_last_price_mock: AsyncMock,
         validate_required_connections_mock: AsyncMock,
-        is_decryption_done_mock: MagicMock,
+        is_connector_decryption_done_mock: MagicMock,
         save_to_yml_mock: MagicMock,
         _: MagicMock,
     ):
         get_last_price_mock.return_value = Decimal("11")
         validate_required_connections_mock.return_value = {}
-        is_decryption_done_mock.return_value = True
+        is_connector_decryption_done_mock.return_value = True
         config_maps = []
         save_to_yml_mock.side_effect = lambda _, cm: config_maps.append(cm)
 
@@ -100,20 +100,20 @@ class CreateCommandTest(unittest.TestCase):
 
     @patch("shutil.copy")
     @patch("hummingbot.client.command.create_command.save_to_yml_legacy")
-    @patch("hummingbot.client.config.security.Security.is_decryption_done")
+    @patch("hummingbot.client.config.security.Security.is_connector_decryption_done")
     @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections")
     @patch("hummingbot.core.utils.market_price.get_last_price")
     def test_prompt_for_configuration_accepts_zero_amount_on_get_last_price_network_timeout(
         self,
         get_last_price_mock: AsyncMock,
         validate_required_connections_mock: AsyncMock,
-        is_decryption_done_mock: MagicMock,
+        is_connector_decryption_done_mock: MagicMock,
         save_to_yml_mock: MagicMock,
         _: MagicMock,
     ):
         get_last_price_mock.side_effect = self.get_async_sleep_fn(delay=0.02)
         validate_required_connections_mock.return_value = {}
-        is_decryption_done_mock.return_value = True
+        is_connector_decryption_done_mock.return_value = True
         config_maps = []
         save_to_yml_mock.side_effect = lambda _, cm: config_maps.append(cm)
 
@@ -173,20 +173,20 @@ class CreateCommandTest(unittest.TestCase):
 
     @patch("shutil.copy")
     @patch("hummingbot.client.command.create_command.save_to_yml_legacy")
-    @patch("hummingbot.client.config.security.Security.is_decryption_done")
+    @patch("hummingbot.client.config.security.Security.is_connector_decryption_done")
     @patch("hummingbot.client.command.status_command.StatusCommand.validate_required_connections")
     @patch("hummingbot.core.utils.market_price.get_last_price")
     def test_prompt_for_configuration_handles_status_network_timeout(
         self,
         get_last_price_mock: AsyncMock,
         validate_required_connections_mock: AsyncMock,
-        is_decryption_done_mock: MagicMock,
+        is_connector_decryption_done_mock: MagicMock,
         _: MagicMock,
         __: MagicMock,
     ):
         get_last_price_mock.return_value = None
         validate_required_connections_mock.side_effect = self.get_async_sleep_fn(delay=0.02)
-        is_decryption_done_mock.return_value = True
+        is_connector_decryption_done_mock.return_value = True
         self.client_config_map.commands_timeout.create_command_timeout = 0.005
         self.client_config_map.commands_timeout.other_commands_timeout = 0.01
         strategy_file_name = "some-strategy.yml"
@@ -1,8 +1,11 @@
 import asyncio
+import threading
+import time
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import MagicMock, patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -78,6 +81,9 @@ class SecurityTest(unittest.TestCase):
         Security.secrets_manager = None
         Security._secure_configs = {}
         Security._decryption_done = asyncio.Event()
+        Security._connectors_decryption_done = {}
+        Security._encrypted_connectors = None
+        Security._ev_loop = None
 
     def test_password_process(self):
         self.assertTrue(Security.new_password_required())
@@ -150,3 +156,66 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_decryption_is_signalled_per_connector(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+
+        self.assertFalse(Security.is_connector_decryption_done(self.connector))
+        self.assertFalse(Security.is_connector_decryption_done("kucoin"))
+
+        Security.decrypt_all()
+        self.async_run_with_timeout(Security.wait_til_connector_decryption_done(self.connector))
+
+        self.assertTrue(Security.is_connector_decryption_done(self.connector))
+        self.assertTrue(Security.is_connector_decryption_done("kucoin"))
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+
+    def test_decryption_off_the_main_thread_wakes_up_the_waiters(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+        # The decryption is run on a thread below instead of being scheduled on an executor
+        with patch("hummingbot.client.config.security.safe_ensure_future"), \
+                patch.object(AsyncCallScheduler, "call_async"):
+            Security.login(secrets_manager)
+
+        decryption_end_times = []
+
+        def decrypt_all():
+            Security.decrypt_all()
+            decryption_end_times.append(time.monotonic())
+
+        async def wait_for_decryption_on_another_thread() -> float:
+            waiter = asyncio.ensure_future(Security.wait_til_connector_decryption_done(self.connector))
+            await asyncio.sleep(0)
+            decryption_thread = threading.Thread(target=decrypt_all)
+            decryption_thread.start()
+            # Nothing else wakes up the loop until the timeout
+            await asyncio.wait_for(waiter, timeout=5)
+            wake_up_time = time.monotonic()
+            decryption_thread.join()
+            return wake_up_time
+
+        wake_up_time = self.async_run_with_timeout(wait_for_decryption_on_another_thread(), timeout=6)
+
+        self.assertLess(wake_up_time - decryption_end_times[0], 1)
+        self.assertTrue(Security.is_connector_decryption_done(self.connector))
+        self.assertTrue(Security.is_decryption_done())
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+
+    @patch("hummingbot.client.config.security.Security.decrypt_connector_config")
+    def test_decryption_error_of_a_connector_does_not_block_the_others(self, decrypt_connector_config_mock: MagicMock):
+        decrypt_connector_config_mock.side_effect = ValueError("MAC mismatch")
+        self.store_binance_config()
+
+        Security.decrypt_all()
+
+        self.assertTrue(Security.is_decryption_done())
+        self.assertTrue(Security.is_connector_decryption_done(self.connector))
+        self.assertIsNone(Security.decrypted_value(self.connector))
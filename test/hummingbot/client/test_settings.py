@@ -1,9 +1,12 @@
+import json
+import tempfile
 import unittest
+from os.path import exists, join
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType, LazyConnectorSetting
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
@@ -195,3 +198,76 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, KujiraAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class AllConnectorSettingsCacheTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_path = join(self.cache_dir.name, "connector_settings_cache.json")
+        binance_dirs = [(type_name, connector_dir) for type_name, connector_dir in AllConnectorSettings._connector_dirs()
+                        if connector_dir.name == "binance"]
+        self.patchers = [
+            patch("hummingbot.client.settings.AllConnectorSettings.connector_settings_cache_path",
+                  return_value=self.cache_path),
+            patch("hummingbot.client.settings.AllConnectorSettings._connector_dirs", return_value=binance_dirs),
+            patch("hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[]),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.all_connector_settings = AllConnectorSettings.all_connector_settings
+        self.paper_trade_connectors_names = AllConnectorSettings.paper_trade_connectors_names
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        AllConnectorSettings.all_connector_settings = self.all_connector_settings
+        AllConnectorSettings.paper_trade_connectors_names = self.paper_trade_connectors_names
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    def test_connector_settings_are_read_from_the_cache(self):
+        imported_settings = AllConnectorSettings.create_connector_settings()
+        self.assertTrue(exists(self.cache_path))
+
+        cached_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual({"binance", "binance_us"}, set(cached_settings.keys()))
+        for name, setting in cached_settings.items():
+            self.assertIsInstance(setting, LazyConnectorSetting)
+            self.assertEqual(imported_settings[name].type, setting.type)
+            self.assertEqual(imported_settings[name].example_pair, setting.example_pair)
+            self.assertEqual(imported_settings[name].trade_fee_schema, setting.trade_fee_schema)
+            self.assertEqual(imported_settings[name].domain_parameter, setting.domain_parameter)
+            self.assertIs(imported_settings[name].config_keys, setting.config_keys)
+
+    def test_paper_trade_settings_keep_config_keys_unloaded(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        paper_trade_settings = AllConnectorSettings.all_connector_settings["binance_paper_trade"]
+
+        self.assertIsInstance(paper_trade_settings, LazyConnectorSetting)
+        self.assertEqual("binance", paper_trade_settings.parent_name)
+        self.assertIsInstance(paper_trade_settings.config_keys, BinanceConfigMap)
+
+    def test_cache_is_not_used_when_its_key_changes(self):
+        AllConnectorSettings.create_connector_settings()
+
+        with patch("hummingbot.client.settings.AllConnectorSettings._connector_settings_cache_key",
+                   return_value="newKey"):
+            settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertNotIsInstance(settings["binance"], LazyConnectorSetting)
+        with open(self.cache_path) as cache_file:
+            self.assertEqual("newKey", json.load(cache_file)["key"])
+
+    @patch("hummingbot.client.settings.importlib.import_module")
+    def test_cache_is_not_written_when_a_connector_dependency_is_missing(self, import_module_mock: MagicMock):
+        import_module_mock.side_effect = ModuleNotFoundError("No module named 'someDependency'", name="someDependency")
+
+        settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual({}, settings)
+        self.assertFalse(exists(self.cache_path))
@@ -0,0 +1,142 @@
+import asyncio
+import math
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List, Optional
+
+from hummingbot.connector.exchange.paper_trade.market_data_service import PaperTradeMarketDataService
+from hummingbot.connector.exchange.paper_trade.market_data_service_data_source import (
+    MarketDataServiceOrderBookDataSource,
+)
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class ExchangeOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Data source standing for the exchange connection of the service, fed with the messages added by the tests.
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: math.nan for trading_pair in trading_pairs}
+
+    async def listen_for_subscriptions(self):
+        pass
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair, "update_id": 1, "bids": [[99, 1]], "asks": [[101, 2]]}, timestamp=1.0)
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def add_message(self, message: OrderBookMessage):
+        queue_key = (self._trade_messages_queue_key
+                     if message.type is OrderBookMessageType.TRADE
+                     else self._diff_messages_queue_key)
+        self._message_queue[queue_key].put_nowait(message)
+
+
+class PaperTradeMarketDataServiceTests(IsolatedAsyncioWrapperTestCase):
+    connector_name = "binance"
+    trading_pair = "COINALPHA-HBOT"
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "market_data.sock")
+        self.tracked_trading_pairs: List[List[str]] = []
+        self.service = PaperTradeMarketDataService(socket_path=self.socket_path,
+                                                   order_book_tracker_factory=self.create_exchange_tracker)
+        await self.service.start()
+        self.client_trackers: List[OrderBookTracker] = []
+
+    async def asyncTearDown(self):
+        for client_tracker in self.client_trackers:
+            client_tracker.stop()
+        await self.service.stop()
+        self.temp_dir.cleanup()
+        await super().asyncTearDown()
+
+    def create_exchange_tracker(self, connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
+        self.tracked_trading_pairs.append(trading_pairs)
+        return OrderBookTracker(data_source=ExchangeOrderBookDataSource(trading_pairs), trading_pairs=trading_pairs)
+
+    def create_client_tracker(self, trading_pairs: List[str]) -> OrderBookTracker:
+        data_source = MarketDataServiceOrderBookDataSource(trading_pairs, self.connector_name, self.socket_path)
+        client_tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        client_tracker.start()
+        self.client_trackers.append(client_tracker)
+        return client_tracker
+
+    async def wait_for(self, condition, timeout: float = 5):
+        async def poll():
+            while not condition():
+                await asyncio.sleep(0.05)
+        await asyncio.wait_for(poll(), timeout=timeout)
+
+    async def test_client_order_books_follow_the_exchange_order_books(self):
+        client_tracker = self.create_client_tracker([self.trading_pair])
+        await asyncio.wait_for(client_tracker.wait_ready(), timeout=5)
+        order_book: OrderBook = client_tracker.order_books[self.trading_pair]
+        self.assertEqual([OrderBookRow(99, 1, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(101, 2, 1)], list(order_book.ask_entries()))
+
+        exchange_data_source = self.service.order_book_trackers[self.connector_name][0].data_source
+        exchange_data_source.add_message(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 2, "bids": [[100, 3]], "asks": []}, timestamp=2.0))
+        await self.wait_for(lambda: order_book.get_price(False) == 100)
+
+        exchange_data_source.add_message(OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair, "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+            "update_id": 2, "price": 100.5, "amount": 1}, timestamp=3.0))
+        await self.wait_for(lambda: order_book.last_trade_price == 100.5)
+
+        last_traded_prices = await client_tracker.data_source.get_last_traded_prices([self.trading_pair])
+        self.assertEqual({self.trading_pair: 100.5}, last_traded_prices)
+
+        # A new client gets the current order book
+        other_client_tracker = self.create_client_tracker([self.trading_pair])
+        await asyncio.wait_for(other_client_tracker.wait_ready(), timeout=5)
+        self.assertEqual([(100, 3), (99, 1)],
+                         [(row.price, row.amount)
+                          for row in other_client_tracker.order_books[self.trading_pair].bid_entries()])
+        self.assertEqual([[self.trading_pair]], self.tracked_trading_pairs)
+
+    async def test_new_trading_pairs_get_their_own_exchange_tracker(self):
+        client_tracker = self.create_client_tracker([self.trading_pair])
+        await asyncio.wait_for(client_tracker.wait_ready(), timeout=5)
+
+        other_client_tracker = self.create_client_tracker([self.trading_pair, "WETH-HBOT"])
+        await asyncio.wait_for(other_client_tracker.wait_ready(), timeout=5)
+
+        self.assertEqual([[self.trading_pair], ["WETH-HBOT"]], self.tracked_trading_pairs)
+        self.assertEqual(99, other_client_tracker.order_books["WETH-HBOT"].get_price(False))
+
+    async def test_order_books_of_existing_clients_stay_in_sync_when_a_client_adds_trading_pairs(self):
+        client_tracker = self.create_client_tracker([self.trading_pair])
+        await asyncio.wait_for(client_tracker.wait_ready(), timeout=5)
+        order_book: OrderBook = client_tracker.order_books[self.trading_pair]
+        exchange_tracker = self.service.order_book_trackers[self.connector_name][0]
+        exchange_tracker.data_source.add_message(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 2, "bids": [[100, 3]], "asks": []}, timestamp=2.0))
+        await self.wait_for(lambda: order_book.get_price(False) == 100)
+
+        other_client_tracker = self.create_client_tracker(["WETH-HBOT"])
+        await asyncio.wait_for(other_client_tracker.wait_ready(), timeout=5)
+        exchange_tracker.data_source.add_message(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 3, "bids": [], "asks": [[100.5, 4]]}, timestamp=3.0))
+        await self.wait_for(lambda: order_book.get_price(True) == 100.5)
+
+        self.assertIs(exchange_tracker, self.service.order_book_trackers[self.connector_name][0])
+        self.assertTrue(exchange_tracker.ready)
+        self.assertEqual([(100, 3), (99, 1)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(100.5, 4), (101, 2)], [(row.price, row.amount) for row in order_book.ask_entries()])
@@ -0,0 +1,146 @@
+import json
+import math
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.order_book_recording import (
+    OrderBookRecording,
+    OrderBookRecordingWriter,
+    convert_downloaded_order_book_and_trades,
+)
+from hummingbot.connector.exchange.paper_trade.order_book_replay import OrderBookReplay, OrderBookReplayExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class OrderBookReplayTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = self.temp_dir.name
+        with OrderBookRecordingWriter(self.path, self.trading_pair, buffer_size=2) as writer:
+            writer.add_snapshot(self.start_timestamp, bids=[[99, 1], [98, 2]], asks=[[101, 1], [102, 2]], update_id=1)
+            writer.add_diff(self.start_timestamp + 2, bids=[[99, 0], [100, 3]], asks=[], update_id=2)
+            writer.add_trade(self.start_timestamp + 3, price=97, amount=2, is_buy=False)
+            writer.add_snapshot(self.start_timestamp + 5, bids=[[95, 1]], asks=[[96, 1]], update_id=3)
+            writer.add_diff(self.start_timestamp + 6, bids=[], asks=[[97, 4]], update_id=4)
+        self.recording = OrderBookRecording(self.path, self.trading_pair)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_recording_round_trip(self):
+        self.assertEqual((9, 6), self.recording.book.shape)
+        self.assertEqual((1, 4), self.recording.trades.shape)
+        self.assertEqual(self.start_timestamp, self.recording.start_time)
+        self.assertEqual(self.start_timestamp + 6, self.recording.end_time)
+        self.assertEqual([0, 4, 6, 8], list(self.recording.message_starts(0, len(self.recording.book))))
+        self.assertEqual(6, self.recording.book_index_after(self.start_timestamp + 2))
+        self.assertEqual(0, self.recording.trades_index_after(self.start_timestamp + 2))
+
+    def test_convert_downloaded_order_book_and_trades(self):
+        order_book_file_path = os.path.join(self.path, "order_book.txt")
+        trades_file_path = os.path.join(self.path, "trades.txt")
+        with open(order_book_file_path, "w") as file:
+            file.write(json.dumps({"ts": 10.0, "bids": [[9.0, 1.0]], "asks": [[11.0, 2.0]]}) + "\n")
+            file.write(json.dumps({"ts": 11.0, "bids": [[9.5, 1.0]], "asks": [[10.5, 2.0]]}) + "\n")
+        with open(trades_file_path, "w") as file:
+            file.write(json.dumps({"ts": 10.5, "price": 10.5, "q_base": 0.5, "side": "buy"}) + "\n")
+
+        recording = convert_downloaded_order_book_and_trades(
+            order_book_file_path, trades_file_path, os.path.join(self.path, "converted"), self.trading_pair)
+
+        self.assertEqual([0, 2], list(recording.message_starts(0, len(recording.book))))
+        self.assertEqual([10.5, 10.5, 0.5, 0], list(recording.trades[0]))
+
+    def test_replay_applies_messages_up_to_the_clock_time(self):
+        replay = OrderBookReplay([self.recording])
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        clock.add_iterator(replay)
+        order_book = replay.order_books[self.trading_pair]
+
+        clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+
+        clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual(97, order_book.last_trade_price)
+
+        clock.backtest_til(self.start_timestamp + 6)
+        self.assertEqual(95, order_book.get_price(False))
+        self.assertEqual(96, order_book.get_price(True))
+
+    def test_replay_starts_from_the_last_snapshot(self):
+        replay = OrderBookReplay([self.recording])
+        replay.replay_until(self.trading_pair, self.start_timestamp + 2)
+        order_book = replay.order_books[self.trading_pair]
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+
+        replay = OrderBookReplay([self.recording])
+        replay.replay_until(self.trading_pair, self.start_timestamp + 10)
+        order_book = replay.order_books[self.trading_pair]
+        # The trade recorded before the last snapshot isn't replayed
+        self.assertTrue(order_book.last_trade_price != order_book.last_trade_price)
+        self.assertEqual([(96, 1), (97, 4)], [(entry.price, entry.amount) for entry in order_book.ask_entries()])
+
+    def test_recorded_trades_fill_limit_orders(self):
+        replay = OrderBookReplay([self.recording])
+        exchange = OrderBookReplayExchange(ClientConfigAdapter(ClientConfigMap()), "binance", replay)
+        exchange.set_balance("COINALPHA", Decimal("0"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        order_fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, order_fill_logger)
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        clock.add_iterator(replay)
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp + 1)
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("98"))
+        clock.backtest_til(self.start_timestamp + 3)
+
+        self.assertEqual(1, len(order_fill_logger.event_log))
+        fill_event = order_fill_logger.event_log[0]
+        self.assertEqual(Decimal("98"), fill_event.price)
+        self.assertEqual(Decimal("1"), fill_event.amount)
+        self.assertEqual(Decimal("902"), exchange.get_balance("HBOT"))
+
+    def test_replay_with_clock_skipping_idle_ticks(self):
+        replay = OrderBookReplay([self.recording])
+        exchange = OrderBookReplayExchange(ClientConfigAdapter(ClientConfigMap()), "binance", replay)
+        exchange.set_balance("HBOT", Decimal("1000"))
+        order_fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, order_fill_logger)
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 100, skip_idle_ticks=True)
+        clock.add_iterator(replay)
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(self.start_timestamp + 2, replay.next_event_time(clock.current_timestamp))
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.MARKET)
+        self.assertEqual(self.start_timestamp + 6, exchange.next_event_time(clock.current_timestamp))
+
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("90"))
+        self.assertEqual(self.start_timestamp + 1, exchange.next_event_time(clock.current_timestamp))
+
+        clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(self.start_timestamp + 6, exchange.next_event_time(clock.current_timestamp))
+        clock.backtest_til(self.start_timestamp + 6)
+        self.assertEqual(1, len(order_fill_logger.event_log))
+        self.assertEqual(Decimal("96"), order_fill_logger.event_log[0].price)
+
+        clock.backtest()
+        self.assertEqual(math.inf, replay.next_event_time(clock.current_timestamp))
+        self.assertEqual(math.inf, exchange.next_event_time(clock.current_timestamp))
+        self.assertEqual(self.start_timestamp + 100, clock.current_timestamp)
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,10 +6,20 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import LatencyModel
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def trade_event(self, trade_type: TradeType, price: Decimal, amount: Decimal) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(self.trading_pair, self.start_timestamp, trade_type, price, amount)
 
     def test_get_order_book_tracker_for_connector_using_generic_tracker(self):
         tracker = get_order_book_tracker(connector_name="binance", trading_pairs=["COINALPHA-HBOT"])
@@ -29,3 +40,67 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_on_hold_balances_follow_the_open_orders(self):
+        exchange = MockPaperExchange(ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(self.trading_pair, 100, 90, 110, 1, 10)
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        exchange.set_fill_simulation(queue_position=True)
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp + 1)
+        filled_order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("95"))
+        cancelled_order_id = exchange.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("105"))
+        self.assertEqual({"HBOT": Decimal("289"), "COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+        self.assertEqual({"HBOT": Decimal("711"), "COINALPHA": Decimal("7")}, exchange.available_balances)
+        self.assertEqual(Decimal("711"), exchange.get_available_balance("hbot"))
+        self.assertEqual(Decimal("0"), exchange.get_available_balance("WETH"))
+
+        # A partial fill keeps the whole order amount on hold
+        exchange.match_trade_to_limit_orders(self.trade_event(TradeType.SELL, Decimal("99"), Decimal("0.4")))
+        self.assertIn(filled_order_id, [order.client_order_id for order in exchange.limit_orders])
+        self.assertEqual({"HBOT": Decimal("289"), "COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+
+        exchange.match_trade_to_limit_orders(self.trade_event(TradeType.SELL, Decimal("99"), Decimal("0.6")))
+        self.assertNotIn(filled_order_id, [order.client_order_id for order in exchange.limit_orders])
+        self.assertEqual({"HBOT": Decimal("190"), "COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+        self.assertEqual(Decimal("901") - Decimal("190"), exchange.get_available_balance("HBOT"))
+        self.assertEqual(Decimal("11") - Decimal("3"), exchange.get_available_balance("COINALPHA"))
+
+        exchange.match_trade_to_limit_orders(self.trade_event(TradeType.SELL, Decimal("94"), Decimal("5")))
+        self.assertEqual({"COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+        self.assertEqual(Decimal("711"), exchange.get_available_balance("HBOT"))
+
+        exchange.cancel(self.trading_pair, cancelled_order_id)
+        self.assertEqual({}, exchange.on_hold_balances)
+        self.assertEqual(Decimal("13"), exchange.get_available_balance("COINALPHA"))
+
+    def test_on_hold_balances_are_released_when_the_orders_are_removed_without_a_fill(self):
+        exchange = MockPaperExchange(ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book(self.trading_pair, 100, 90, 110, 1, 10)
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        exchange.set_fill_simulation(queue_position=False, cancel_latency=LatencyModel(2))
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        clock.add_iterator(exchange)
+
+        clock.backtest_til(self.start_timestamp + 1)
+        cancelled_order_id = exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("95"))
+        exchange.sell(self.trading_pair, Decimal("3"), OrderType.LIMIT, Decimal("105"))
+        self.assertEqual({"HBOT": Decimal("190"), "COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+
+        # The balance stays on hold until the cancellation takes effect
+        exchange.cancel(self.trading_pair, cancelled_order_id)
+        self.assertEqual({"HBOT": Decimal("190"), "COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+        clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual({"COINALPHA": Decimal("3")}, exchange.on_hold_balances)
+
+        # The order is cancelled when there isn't enough balance left to fill it
+        exchange.set_balance("COINALPHA", Decimal("1"))
+        exchange.match_trade_to_limit_orders(self.trade_event(TradeType.BUY, Decimal("106"), Decimal("5")))
+        self.assertEqual(0, len(exchange.limit_orders))
+        self.assertEqual({}, exchange.on_hold_balances)
+        self.assertEqual(Decimal("1"), exchange.get_available_balance("COINALPHA"))
@@ -0,0 +1,134 @@
+import math
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.order_book_recording import OrderBookRecording, OrderBookRecordingWriter
+from hummingbot.connector.exchange.paper_trade.order_book_replay import OrderBookReplay, OrderBookReplayExchange
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import LatencyModel
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class PaperTradeFillSimulationTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.order_fill_logger = EventLogger()
+        self.order_cancelled_logger = EventLogger()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_exchange(self, diffs=(), trades=()) -> OrderBookReplayExchange:
+        with OrderBookRecordingWriter(self.temp_dir.name, self.trading_pair) as writer:
+            writer.add_snapshot(self.start_timestamp, bids=[[99, 5], [98, 2]], asks=[[101, 1], [102, 2]], update_id=1)
+            for update_id, (offset, bids) in enumerate(diffs, start=2):
+                writer.add_diff(self.start_timestamp + offset, bids=bids, asks=[], update_id=update_id)
+            for offset, price, amount in trades:
+                writer.add_trade(self.start_timestamp + offset, price=price, amount=amount, is_buy=False)
+        replay = OrderBookReplay([OrderBookRecording(self.temp_dir.name, self.trading_pair)])
+        exchange = OrderBookReplayExchange(ClientConfigAdapter(ClientConfigMap()), "binance", replay)
+        exchange.set_balance("COINALPHA", Decimal("0"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        exchange.add_listener(MarketEvent.OrderFilled, self.order_fill_logger)
+        exchange.add_listener(MarketEvent.OrderCancelled, self.order_cancelled_logger)
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        self.clock.add_iterator(replay)
+        self.clock.add_iterator(exchange)
+        return exchange
+
+    def test_latency_model(self):
+        self.assertEqual(0.5, LatencyModel(0.5).sample())
+
+        latency_model = LatencyModel(0.5, 0.2, seed=1)
+        samples = [latency_model.sample() for _ in range(5000)]
+        self.assertTrue(all(sample > 0 for sample in samples))
+        self.assertAlmostEqual(0.5, sum(samples) / len(samples), delta=0.02)
+
+        with self.assertRaises(ValueError):
+            LatencyModel(-1)
+
+    def test_trades_at_the_order_price_consume_the_queue_ahead(self):
+        exchange = self.create_exchange(diffs=[(3, [[99, 1]])], trades=[(2, 99, 3), (4, 99, 1.5), (5, 99, 0.6)])
+        exchange.set_fill_simulation(queue_position=True)
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        queue_state = exchange.limit_order_queue_states[order_id]
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(2, queue_state.queue_ahead)
+        self.assertEqual(0, queue_state.traded_volume)
+
+        # The level got smaller than the queue ahead of the order, so part of the queue was cancelled
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(1, queue_state.queue_ahead)
+
+        self.clock.backtest_til(self.start_timestamp + 4)
+        self.assertEqual(0, queue_state.queue_ahead)
+        self.assertEqual(0.5, queue_state.traded_volume)
+        self.assertEqual(0, len(self.order_fill_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertEqual(1, len(self.order_fill_logger.event_log))
+        self.assertEqual(order_id, self.order_fill_logger.event_log[0].order_id)
+        self.assertEqual(Decimal("99"), self.order_fill_logger.event_log[0].price)
+        self.assertEqual(0, len(exchange.limit_orders))
+        self.assertEqual(0, len(exchange.limit_order_queue_states))
+
+    def test_trades_at_the_order_price_do_not_fill_without_queue_simulation(self):
+        exchange = self.create_exchange(trades=[(2, 99, 10)])
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        self.clock.backtest_til(self.start_timestamp + 3)
+
+        self.assertEqual(0, len(self.order_fill_logger.event_log))
+        self.assertEqual(0, len(exchange.limit_order_queue_states))
+
+    def test_orders_are_not_filled_before_reaching_the_order_book(self):
+        exchange = self.create_exchange(trades=[(2, 97, 2), (4, 97, 2)])
+        exchange.set_fill_simulation(queue_position=False, order_entry_latency=LatencyModel(2))
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("98"))
+        self.assertEqual(self.start_timestamp + 3, exchange.limit_order_queue_states[order_id].active_timestamp)
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(0, len(self.order_fill_logger.event_log))
+        self.assertEqual(self.start_timestamp + 3, exchange.next_event_time(self.clock.current_timestamp))
+
+        self.clock.backtest_til(self.start_timestamp + 4)
+        self.assertEqual(1, len(self.order_fill_logger.event_log))
+        self.assertEqual(order_id, self.order_fill_logger.event_log[0].order_id)
+
+    def test_orders_can_be_filled_until_the_cancellation_takes_effect(self):
+        exchange = self.create_exchange(trades=[(2, 97, 2)])
+        exchange.set_fill_simulation(queue_position=False, cancel_latency=LatencyModel(2))
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+        filled_order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("98"))
+        cancelled_order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("96"))
+        exchange.cancel(self.trading_pair, filled_order_id)
+        exchange.cancel(self.trading_pair, cancelled_order_id)
+        self.assertEqual(2, len(exchange.limit_orders))
+        self.assertEqual(0, len(self.order_cancelled_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual([filled_order_id], [event.order_id for event in self.order_fill_logger.event_log])
+        self.assertEqual(self.start_timestamp + 3, exchange.next_event_time(self.clock.current_timestamp))
+
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual([cancelled_order_id], [event.order_id for event in self.order_cancelled_logger.event_log])
+        self.assertEqual(0, len(exchange.limit_orders))
+        self.assertEqual(0, len(exchange.limit_order_queue_states))
+        self.assertEqual(math.inf, exchange.next_event_time(self.clock.current_timestamp))
@@ -75,3 +75,20 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_offset_is_computed_once_per_sample(self, time_mock, seconds_counter_mock):
+        time_mock.return_value = 1640000000.0
+        seconds_counter_mock.return_value = 100.0
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        with patch("hummingbot.connector.time_synchronizer.numpy.median") as median_mock:
+            self.assertEqual(100.0 + 2.25, time_provider.time())
+            self.assertEqual(100.0 + 2.25, time_provider.time())
+            median_mock.assert_not_called()
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertEqual(1640000000.0, time_provider.time())
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.management.diagnosis import active_tasks, task_census
+from hummingbot.core.management.loop_monitor import EventLoopMonitor
+
+
+class EventLoopMonitorTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.monitor = EventLoopMonitor(sampling_interval=0.01, window_size=3)
+
+    async def asyncTearDown(self):
+        self.monitor.stop()
+        await super().asyncTearDown()
+
+    def test_rolling_lag_histogram(self):
+        for lag in (0.0005, 0.02, 0.2, 2):
+            self.monitor.record_lag(lag)
+
+        histogram = self.monitor.lag_histogram()
+        self.assertEqual(0, histogram["<=1ms"])
+        self.assertEqual(1, histogram["<=50ms"])
+        self.assertEqual(1, histogram["<=500ms"])
+        self.assertEqual(1, histogram["<=5000ms"])
+        self.assertEqual(3, sum(histogram.values()))
+        self.assertEqual(2, self.monitor.last_lag)
+        self.assertEqual(2, self.monitor.max_lag)
+        self.assertEqual(0.2, self.monitor.lag_percentile(50))
+
+    async def test_blocking_callbacks_are_measured_as_lag(self):
+        self.monitor.start()
+        await asyncio.sleep(0.005)
+        time.sleep(0.06)
+        await asyncio.sleep(0.03)
+
+        self.assertGreaterEqual(self.monitor.max_lag, 0.04)
+        self.assertEqual(1, task_census().loc["EventLoopMonitor._sampling_loop()", "count"])
+
+    async def test_slow_callback_report(self):
+        self.monitor.enable_slow_callback_report(slow_callback_duration=0.01)
+        logging.getLogger("asyncio").warning("Executing %s took %.3f seconds", "<Handle blocking()>", 0.05)
+
+        self.assertTrue(self.monitor.slow_callbacks_reported)
+        self.assertEqual([("<Handle blocking()>", 0.05)],
+                         [(callback, duration) for _, callback, duration in self.monitor.slow_callbacks()])
+        self.assertEqual(1, self.monitor.metrics()["slow_callbacks"])
+
+        self.monitor.disable_slow_callback_report()
+        self.assertFalse(asyncio.get_event_loop().get_debug())
+        self.assertEqual([], self.monitor.slow_callbacks())
+
+    async def test_task_census_groups_tasks_by_coroutine(self):
+        async def waiting():
+            await asyncio.sleep(10)
+
+        tasks = [asyncio.ensure_future(waiting()) for _ in range(3)]
+        await asyncio.sleep(0)
+        try:
+            census = task_census()
+            self.assertEqual(3, census.loc[f"{waiting.__qualname__}()", "count"])
+            self.assertEqual(3, len(active_tasks().loc[f"{waiting.__qualname__}()"]))
+            self.assertEqual(census["count"].sum(), self.monitor.metrics()["tasks"]["total"])
+        finally:
+            for task in tasks:
+                task.cancel()
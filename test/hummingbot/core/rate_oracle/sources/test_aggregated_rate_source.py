@@ -0,0 +1,108 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Callable, Dict, List, Optional
+from unittest.mock import patch
+
+from hummingbot.core.rate_oracle.sources.aggregated_rate_source import AggregatedRateSource, WeightedRateSource
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+
+
+class DummyRateSource(RateSourceBase):
+    def __init__(self, name: str, prices: Dict[str, Decimal], streaming: bool = False):
+        self._name = name
+        self.prices = prices
+        self._streaming = streaming
+        self.price_callback: Optional[Callable[[str, Decimal], None]] = None
+        self.stream_error: Optional[Exception] = None
+        self.stream_cancelled = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def supports_price_stream(self) -> bool:
+        return self._streaming
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        return dict(self.prices)
+
+    async def listen_for_prices(self, trading_pairs: List[str], price_callback: Callable[[str, Decimal], None]):
+        self.price_callback = price_callback
+        if self.stream_error is not None:
+            raise self.stream_error
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.stream_cancelled = True
+            raise
+
+
+class AggregatedRateSourceTest(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.time_patcher = patch(
+            "hummingbot.core.rate_oracle.sources.aggregated_rate_source.AggregatedRateSource._time", return_value=1000)
+        self.time_mock = self.time_patcher.start()
+        self.first_source = DummyRateSource("first", {"BTC-USDT": Decimal("100"), "ETH-USDT": Decimal("10")},
+                                            streaming=True)
+        self.second_source = DummyRateSource("second", {"BTC-USDT": Decimal("110")})
+        self.rate_source = AggregatedRateSource([
+            WeightedRateSource(self.first_source, weight=Decimal("3"), max_age=10),
+            WeightedRateSource(self.second_source, weight=Decimal("1"), max_age=30),
+        ])
+
+    def tearDown(self):
+        self.time_patcher.stop()
+        super().tearDown()
+
+    async def test_prices_are_the_weighted_average_of_the_sources(self):
+        prices = await self.rate_source.get_prices()
+
+        self.assertEqual({"BTC-USDT": Decimal("102.5"), "ETH-USDT": Decimal("10")}, prices)
+        self.assertTrue(self.rate_source.supports_price_stream)
+
+    async def test_stale_prices_are_left_out(self):
+        await self.rate_source.get_prices()
+        self.first_source.prices = {}
+        self.time_mock.return_value = 1000 + 20
+        prices = await self.rate_source.get_prices()
+
+        self.assertEqual({"BTC-USDT": Decimal("110")}, prices)
+
+    async def test_streamed_prices_are_aggregated_and_not_replaced_by_polled_prices(self):
+        await self.rate_source.get_prices()
+        streamed_prices = {}
+        listen_task = asyncio.ensure_future(
+            self.rate_source.listen_for_prices(["BTC-USDT"], lambda pair, price: streamed_prices.update({pair: price})))
+        await asyncio.sleep(0.01)
+
+        self.first_source.price_callback("BTC-USDT", Decimal("90"))
+        self.assertEqual({"BTC-USDT": Decimal("95")}, streamed_prices)
+
+        prices = await self.rate_source.get_prices()
+        self.assertEqual(Decimal("95"), prices["BTC-USDT"])
+        listen_task.cancel()
+
+    async def test_streams_of_the_other_sources_are_stopped_when_one_fails(self):
+        failing_source = DummyRateSource("failing", {}, streaming=True)
+        failing_source.stream_error = ConnectionError("Connection closed")
+        rate_source = AggregatedRateSource([WeightedRateSource(self.first_source), WeightedRateSource(failing_source)])
+
+        with self.assertRaises(ConnectionError):
+            await rate_source.listen_for_prices(["BTC-USDT"], lambda pair, price: None)
+        await asyncio.sleep(0)
+
+        self.assertTrue(self.first_source.stream_cancelled)
+
+    async def test_streams_of_the_sources_are_stopped_when_cancelled(self):
+        listen_task = asyncio.ensure_future(self.rate_source.listen_for_prices(["BTC-USDT"], lambda pair, price: None))
+        await asyncio.sleep(0.01)
+        listen_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await listen_task
+        await asyncio.sleep(0)
+
+        self.assertTrue(self.first_source.stream_cancelled)
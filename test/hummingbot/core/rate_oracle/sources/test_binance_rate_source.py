@@ -3,10 +3,12 @@ import json
 import unittest
 from decimal import Decimal
 from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 
@@ -79,3 +81,52 @@ class BinanceRateSourceTest(unittest.TestCase):
         self.assertEqual(expected_rate, prices[self.trading_pair])
         # self.assertIn(self.us_trading_pair, prices)
         self.assertNotIn(self.ignored_trading_pair, prices)
+
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_prices_streams_book_ticker_mid_prices(self, mock_api, ws_connect_mock):
+        self.setup_binance_responses(mock_api=mock_api, expected_rate=Decimal("10"))
+        mocking_assistant = NetworkMockingAssistant()
+        ws_connect_mock.return_value = mocking_assistant.create_websocket_mock()
+        mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+        mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"u": 400900217, "s": self.binance_pair, "b": "9.9", "B": "31.21", "a": "10.1",
+                                "A": "40.66"}))
+
+        prices = {}
+        rate_source = BinanceRateSource()
+        listen_task = self.ev_loop.create_task(rate_source.listen_for_prices(
+            [self.trading_pair, self.ignored_trading_pair], lambda pair, price: prices.update({pair: price})))
+        mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([f"{self.binance_pair.lower()}@bookTicker"], sent_messages[0]["params"])
+        self.assertEqual({self.trading_pair: Decimal("10")}, prices)
+        self.assertTrue(rate_source.supports_price_stream)
+        listen_task.cancel()
+
+    @patch("hummingbot.connector.exchange.binance.binance_constants.WS_MAX_STREAMS_PER_REQUEST", 2)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_prices_splits_the_subscription_in_requests_of_max_streams(self, ws_connect_mock):
+        mocking_assistant = NetworkMockingAssistant()
+        ws_connect_mock.return_value = mocking_assistant.create_websocket_mock()
+        mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+        exchange = MagicMock()
+        exchange.exchange_symbol_associated_to_pair = AsyncMock(
+            side_effect=lambda trading_pair: trading_pair.replace("-", ""))
+
+        listen_task = self.ev_loop.create_task(BinanceRateSource._listen_for_binance_prices(
+            exchange=exchange, domain="com", trading_pairs=["BTC-USDT", "ETH-USDT", "SOL-USDT"],
+            price_callback=lambda pair, price: None))
+        mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([["btcusdt@bookTicker", "ethusdt@bookTicker"], ["solusdt@bookTicker"]],
+                         [message["params"] for message in sent_messages])
+        self.assertEqual([1, 2], [message["id"] for message in sent_messages])
+        listen_task.cancel()
@@ -2,7 +2,8 @@ import asyncio
 import unittest
 from copy import deepcopy
 from decimal import Decimal
-from typing import Awaitable, Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,7 +11,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -25,6 +26,27 @@ class DummyRateSource(RateSourceBase):
         return deepcopy(self._price_dict)
 
 
+class StreamingDummyRateSource(DummyRateSource):
+    def __init__(self, price_dict: Dict[str, Decimal]):
+        super().__init__(price_dict)
+        self.get_prices_calls = 0
+        self.subscribed_pairs: List[List[str]] = []
+        self.price_callback: Optional[Callable[[str, Decimal], None]] = None
+
+    @property
+    def supports_price_stream(self) -> bool:
+        return True
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.get_prices_calls += 1
+        return await super().get_prices(quote_token)
+
+    async def listen_for_prices(self, trading_pairs: List[str], price_callback: Callable[[str, Decimal], None]):
+        self.subscribed_pairs.append(trading_pairs)
+        self.price_callback = price_callback
+        await asyncio.Event().wait()
+
+
 class RateOracleTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -82,6 +104,37 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_through_several_links(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-DAI": Decimal("0.5"), "DAI-GBP": Decimal("2"),
+                  "COINALPHA-BTC": Decimal("4")}
+        self.assertEqual(Decimal("100"), find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("0.01"), find_rate(prices, "GBP-HBOT"))
+        self.assertIsNone(find_rate(prices, "HBOT-BTC"))
+
+    def test_conversion_graph_follows_price_changes(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        graph = RateConversionGraph(prices, quote_tokens=["GBP"])
+
+        self.assertEqual(Decimal("75"), graph.find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("2"), graph.find_rate(prices, "HBOT-AAVE"))
+        self.assertEqual(Decimal("1"), graph.find_rate(prices, "HBOT-HBOT"))
+        self.assertIsNone(graph.find_rate(prices, "ZBOT-GBP"))
+
+        prices["HBOT-USDT"] = Decimal("200")
+        self.assertEqual(Decimal("150"), graph.find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(("HBOT-USDT", False), graph.conversion_paths("GBP")["HBOT"][0])
+
+    def test_pair_rate_uses_new_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}), quote_token="USDT")
+        rate_oracle.set_price("HBOT-USDT", Decimal("100"))
+        self.assertEqual(Decimal("0.01"), rate_oracle.get_pair_rate("USDT-HBOT"))
+        self.assertIsNone(rate_oracle.get_pair_rate("AAVE-HBOT"))
+
+        rate_oracle.set_price("AAVE-USDT", Decimal("50"))
+        self.assertEqual(Decimal("0.5"), rate_oracle.get_pair_rate("AAVE-HBOT"))
+        rate_oracle.set_price("AAVE-USDT", Decimal("20"))
+        self.assertEqual(Decimal("0.2"), rate_oracle.get_pair_rate("AAVE-HBOT"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -101,3 +154,63 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle._time")
+    def test_requested_rates_are_streamed(self, time_mock):
+        time_mock.return_value = 1000
+        source = StreamingDummyRateSource(price_dict={
+            "BTC-USDT": Decimal("100"), "USDT-USD": Decimal("1"), "ETH-USDT": Decimal("10")})
+        rate_oracle = RateOracle(source=source, quote_token="USD")
+
+        rate_oracle.start()
+        self.async_run_with_timeout(rate_oracle.get_ready())
+        self.assertEqual(Decimal("100"), rate_oracle.get_pair_rate("BTC-USD"))
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        # The pairs of the conversion path of the requested rate are subscribed to
+        self.assertEqual([["BTC-USDT", "USDT-USD"]], source.subscribed_pairs)
+
+        source.price_callback("BTC-USDT", Decimal("200"))
+        self.assertEqual(Decimal("200"), rate_oracle.get_pair_rate("BTC-USD"))
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        # The polled price doesn't replace the streamed one
+        self.assertEqual(Decimal("200"), rate_oracle.get_pair_rate("BTC-USD"))
+        polls = source.get_prices_calls
+
+        # Polls stop while the streams are up to date
+        source.price_callback("USDT-USD", Decimal("1"))
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        self.assertEqual(polls, source.get_prices_calls)
+
+        # And resume when they get stale
+        time_mock.return_value = 1000 + 11
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        self.assertGreater(source.get_prices_calls, polls)
+        self.assertEqual(Decimal("100"), rate_oracle.get_pair_rate("BTC-USD"))
+
+        self.async_run_with_timeout(rate_oracle.stop_network())
+        self.assertIsNone(rate_oracle._price_stream_task)
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle._time")
+    def test_rates_not_requested_again_stop_being_streamed(self, time_mock):
+        time_mock.return_value = 1000
+        source = StreamingDummyRateSource(price_dict={
+            "BTC-USDT": Decimal("100"), "USDT-USD": Decimal("1"), "ETH-USDT": Decimal("10")})
+        rate_oracle = RateOracle(source=source, quote_token="USD")
+
+        rate_oracle.start()
+        self.async_run_with_timeout(rate_oracle.get_ready())
+        rate_oracle.get_pair_rate("BTC-USD")
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        self.assertEqual([["BTC-USDT", "USDT-USD"]], source.subscribed_pairs)
+
+        time_mock.return_value = 1000 + 200
+        rate_oracle.get_pair_rate("ETH-USD")
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        self.assertEqual(["BTC-USDT", "ETH-USDT", "USDT-USD"], source.subscribed_pairs[-1])
+
+        time_mock.return_value = 1000 + 301
+        self.async_run_with_timeout(asyncio.sleep(1.1), timeout=2)
+        self.assertEqual(["ETH-USDT", "USDT-USD"], source.subscribed_pairs[-1])
+        self.assertEqual({"ETH-USD"}, set(rate_oracle._requested_pairs))
+
+        self.async_run_with_timeout(rate_oracle.stop_network())
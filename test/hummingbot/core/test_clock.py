@@ -1,10 +1,15 @@
 import asyncio
+import math
 import time
 import unittest
 
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -122,3 +127,129 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_skipping_idle_ticks(self):
+        class EventIterator(PyTimeIterator):
+            def __init__(self, event_times):
+                super().__init__()
+                self.event_times = event_times
+                self.ticks = []
+
+            def tick(self, timestamp: float):
+                self.ticks.append(timestamp)
+
+            def next_event_time(self, timestamp: float) -> float:
+                return min([event_time for event_time in self.event_times if event_time > timestamp], default=math.inf)
+
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 10.0, start, start + 1000, skip_idle_ticks=True)
+        first_iterator = EventIterator([start + 15, start + 500])
+        second_iterator = EventIterator([start + 40])
+        clock.add_iterator(first_iterator)
+        clock.add_iterator(second_iterator)
+
+        clock.backtest()
+
+        self.assertTrue(clock.skip_idle_ticks)
+        expected_ticks = [start + 20, start + 40, start + 500, start + 1000]
+        self.assertEqual(expected_ticks, first_iterator.ticks)
+        self.assertEqual(expected_ticks, second_iterator.ticks)
+        self.assertEqual(start + 1000, clock.current_timestamp)
+
+    def test_backtest_skipping_idle_ticks_ticks_every_time_by_default(self):
+        time_iterator = TimeIterator()
+        clock = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp,
+                      self.backtest_start_timestamp + 5, skip_idle_ticks=True)
+        clock.add_iterator(time_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 1)
+        self.assertEqual(self.backtest_start_timestamp + 1, time_iterator.current_timestamp)
+        clock.backtest()
+        self.assertEqual(self.backtest_start_timestamp + 5, time_iterator.current_timestamp)
+
+    def test_iterators_with_tick_interval_are_ticked_less_often(self):
+        class TickRecorder(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.ticks = []
+
+            def tick(self, timestamp: float):
+                self.ticks.append(timestamp)
+
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 25)
+        every_tick, every_ten_seconds, too_short_interval = TickRecorder(), TickRecorder(), TickRecorder()
+        clock.add_iterator(every_tick)
+        clock.add_iterator(every_ten_seconds, tick_interval=10)
+        clock.add_iterator(too_short_interval, tick_interval=0.5)
+
+        clock.backtest()
+
+        self.assertEqual(25, len(every_tick.ticks))
+        self.assertEqual(every_tick.ticks, too_short_interval.ticks)
+        self.assertEqual([start + 1, start + 10, start + 20], every_ten_seconds.ticks)
+        self.assertEqual(10, clock.get_tick_interval(every_ten_seconds))
+        self.assertIsNone(clock.get_tick_interval(too_short_interval))
+
+        clock.remove_iterator(every_ten_seconds)
+        self.assertIsNone(clock.get_tick_interval(every_ten_seconds))
+
+    def test_backtest_skipping_idle_ticks_waits_for_the_tick_interval(self):
+        class TickRecorder(PyTimeIterator):
+            def __init__(self):
+                super().__init__()
+                self.ticks = []
+
+            def tick(self, timestamp: float):
+                self.ticks.append(timestamp)
+
+        start = self.backtest_start_timestamp
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 25, skip_idle_ticks=True)
+        iterator = TickRecorder()
+        clock.add_iterator(iterator, tick_interval=10)
+
+        clock.backtest()
+
+        self.assertEqual([start + 1, start + 10, start + 20], iterator.ticks)
+        self.assertEqual(start + 25, clock.current_timestamp)
+
+    def test_realtime_tick_durations_are_recorded(self):
+        class SlowIterator(PyTimeIterator):
+            def tick(self, timestamp: float):
+                time.sleep(0.2)
+
+        clock = Clock(ClockMode.REALTIME, 0.1)
+        slow_iterator, fast_iterator = SlowIterator(), TimeIterator()
+        clock.add_iterator(slow_iterator)
+        clock.add_iterator(fast_iterator)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        stats = dict((id(iterator), iterator_stats) for iterator, iterator_stats in clock.tick_stats)
+        self.assertGreater(stats[id(slow_iterator)].ticks, 0)
+        self.assertEqual(stats[id(slow_iterator)].ticks, stats[id(slow_iterator)].overruns)
+        self.assertGreaterEqual(stats[id(slow_iterator)].max_duration, 0.2)
+        self.assertEqual(0, stats[id(fast_iterator)].overruns)
+        self.assertEqual(stats[id(slow_iterator)].ticks, clock.tick_overruns)
+
+    def test_batched_events_are_delivered_after_each_tick(self):
+        class TriggeringIterator(PyTimeIterator):
+            def __init__(self, pubsub: PubSub):
+                super().__init__()
+                self.pubsub = pubsub
+
+            def tick(self, timestamp: float):
+                self.pubsub.trigger_event(MarketEvent.OrderFilled, timestamp)
+                self.pubsub.trigger_event(MarketEvent.OrderFilled, timestamp)
+
+        pubsub = PubSub()
+        batches = []
+        forwarder = EventForwarder(lambda batch: batches.append((self.clock_backtest.current_timestamp, list(batch))))
+        pubsub.add_batch_listener(MarketEvent.OrderFilled, forwarder)
+        self.clock_backtest.add_iterator(TriggeringIterator(pubsub))
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 2)
+
+        first_tick, second_tick = self.backtest_start_timestamp + 1, self.backtest_start_timestamp + 2
+        self.assertEqual([(first_tick, [first_tick, first_tick]), (second_tick, [second_tick, second_tick])], batches)
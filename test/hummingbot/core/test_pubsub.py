@@ -1,10 +1,34 @@
+import asyncio
 import gc
 import unittest
 import weakref
 from test.mock.mock_events import MockEvent, MockEventType
 
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
-from hummingbot.core.pubsub import PubSub
+from hummingbot.core.pubsub import PubSub, deliver_batched_events
+
+
+class ListenerRemovingListener(EventListener):
+    def __init__(self, pubsub: PubSub, event_tag: MockEventType, listener: EventListener):
+        super().__init__()
+        self.pubsub = pubsub
+        self.event_tag = event_tag
+        self.listener = listener
+        self.calls_count = 0
+
+    def __call__(self, arg):
+        self.calls_count += 1
+        self.pubsub.remove_listener(self.event_tag, self.listener)
+
+
+class BatchLogger(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def __call__(self, arg):
+        self.batches.append(list(arg))
 
 
 class PubSubTest(unittest.TestCase):
@@ -88,6 +112,88 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_collection(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listeners_are_called_in_the_order_they_were_added(self):
+        listeners = [EventLogger() for _ in range(10)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+        self.assertEqual(listeners, self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listeners_removed_while_triggering_are_called_for_the_current_event(self):
+        remover = ListenerRemovingListener(self.pubsub, self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, remover)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+        self.assertEqual([remover], self.pubsub.get_listeners(self.event_tag_zero))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+        self.assertEqual(2, remover.calls_count)
+
+    def test_removing_the_last_listener_removes_the_event_tag(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(0, len(self.listener_zero.event_log))
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
+    def test_batch_listeners_receive_the_events_triggered_since_the_last_delivery(self):
+        batch_logger = BatchLogger()
+        self.pubsub.add_batch_listener(self.event_tag_zero, batch_logger)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        events = [MockEvent(payload=i) for i in range(3)]
+
+        for event in events:
+            self.pubsub.trigger_event(self.event_tag_zero, event)
+        self.pubsub.trigger_event(self.event_tag_one, self.event)
+        self.assertEqual(3, len(self.listener_zero.event_log))
+        self.assertEqual([], batch_logger.batches)
+
+        deliver_batched_events()
+        self.assertEqual([events], batch_logger.batches)
+        self.assertEqual([batch_logger], self.pubsub.get_batch_listeners(self.event_tag_zero))
+
+        deliver_batched_events()
+        self.assertEqual(1, len(batch_logger.batches))
+
+    def test_batches_are_delivered_on_the_next_event_loop_iteration(self):
+        batch_logger = BatchLogger()
+        self.pubsub.add_batch_listener(self.event_tag_zero, batch_logger)
+
+        async def trigger_events():
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+            await asyncio.sleep(0)
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+            await asyncio.sleep(0)
+
+        asyncio.new_event_loop().run_until_complete(trigger_events())
+        self.assertEqual([[self.event, self.event], [self.event]], batch_logger.batches)
+
+    def test_removed_batch_listeners_do_not_receive_pending_events(self):
+        batch_logger = BatchLogger()
+        self.pubsub.add_batch_listener(self.event_tag_zero, batch_logger)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.remove_batch_listener(self.event_tag_zero, batch_logger)
+
+        deliver_batched_events()
+        self.assertEqual([], batch_logger.batches)
+        self.assertEqual([], self.pubsub.get_batch_listeners(self.event_tag_zero))
+
 
 if __name__ == "__main__":
     unittest.main()
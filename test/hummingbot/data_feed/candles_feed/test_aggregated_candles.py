@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.aggregated_candles import AggregatedCandles
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+
+
+class AggregatedCandlesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.start_time = 1700000400  # aligned to 5m, not to 15m
+        self.base_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=100)
+        rng = np.random.default_rng(7)
+        n_candles = 60
+        close = 100 + np.cumsum(rng.normal(0, 1, n_candles))
+        self.base_candles = np.column_stack([
+            self.start_time + np.arange(n_candles) * 60.0,
+            close + rng.normal(0, 0.3, n_candles),
+            close + rng.random(n_candles),
+            close - rng.random(n_candles),
+            close,
+            rng.random((n_candles, 5)),
+        ])
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def resample(self, candles: np.ndarray, interval: str) -> pd.DataFrame:
+        df = pd.DataFrame(candles, columns=self.base_feed.columns)
+        df.index = pd.to_datetime(df["timestamp"], unit="s")
+        aggregations = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+                        "quote_asset_volume": "sum", "n_trades": "sum", "taker_buy_base_volume": "sum",
+                        "taker_buy_quote_volume": "sum"}
+        resampled = df.resample(interval).agg(aggregations)
+        resampled.insert(0, "timestamp", resampled.index.astype(np.int64) // 10 ** 9)
+        return resampled.reset_index(drop=True)
+
+    def test_can_aggregate(self):
+        self.assertTrue(AggregatedCandles.can_aggregate(self.base_feed, "5m"))
+        self.assertTrue(AggregatedCandles.can_aggregate(self.base_feed, "1d"))
+        self.assertFalse(AggregatedCandles.can_aggregate(self.base_feed, "1m"))
+        self.assertFalse(AggregatedCandles.can_aggregate(self.base_feed, "1w"))
+        self.assertFalse(AggregatedCandles.can_aggregate(self.base_feed, "1s"))
+        with self.assertRaises(ValueError):
+            AggregatedCandles(self.base_feed, "1w")
+
+    def test_candles_match_resampled_base_candles(self):
+        feed = AggregatedCandles(self.base_feed, "5m", max_records=20)
+        for i in range(1, len(self.base_candles) + 1):
+            self.base_feed._candles.extend(self.base_candles[i - 1:i])
+            feed.candles_df
+
+        expected = self.resample(self.base_candles, "5min")
+        np.testing.assert_allclose(expected.values, feed.candles_df.values)
+
+    def test_forming_candle_is_updated(self):
+        feed = AggregatedCandles(self.base_feed, "5m", max_records=20)
+        self.base_feed._candles.extend(self.base_candles[:7])
+        self.assertEqual(2, len(feed.candles_df))
+        forming_row = self.base_candles[6].copy()
+        forming_row[2] = 1000
+        self.base_feed._candles[-1] = forming_row
+
+        candles_df = feed.candles_df
+        self.assertEqual(1000, candles_df["high"].iloc[-1])
+        self.assertEqual(self.start_time + 300, candles_df["timestamp"].iloc[-1])
+        self.assertEqual(1, len(feed._candles))
+
+    def test_incomplete_first_interval_is_discarded(self):
+        feed = AggregatedCandles(self.base_feed, "15m", max_records=20)
+        self.base_feed._candles.extend(self.base_candles)
+        expected = self.resample(self.base_candles, "15min").iloc[1:]
+        np.testing.assert_allclose(expected.values, feed.candles_df.values)
+
+    def test_fill_historical_candles_fetches_older_candles(self):
+        feed = AggregatedCandles(self.base_feed, "5m", max_records=15)
+        self.base_feed._candles.extend(self.base_candles)
+        history = self.resample(self.base_candles, "5min").values.copy()
+        history[:, 0] -= 300 * len(history)
+        feed._history_feed.fetch_candles = AsyncMock(return_value=history)
+
+        self.async_run_with_timeout(feed.fill_historical_candles())
+
+        self.assertTrue(feed.ready)
+        timestamps = feed.candles_df["timestamp"].values
+        self.assertEqual(15, len(timestamps))
+        self.assertTrue(np.all(np.diff(timestamps) == 300))
+        feed._history_feed.fetch_candles.assert_awaited_once_with(end_time=self.start_time, limit=4)
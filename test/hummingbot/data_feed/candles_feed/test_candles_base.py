@@ -8,6 +8,7 @@ from collections import deque
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pandas as pd
 from aioresponses import aioresponses
 
@@ -84,7 +85,7 @@ class TestCandlesBase(unittest.TestCase, ABC):
 
     def test_ready_property(self):
         self.assertFalse(self.data_feed.ready)
-        self.data_feed._candles.extend(range(self.max_records))
+        self.data_feed._candles.extend([[i] * len(self.data_feed.columns) for i in range(self.max_records)])
         self.assertTrue(self.data_feed.ready)
 
     def test_candles_df_property(self):
@@ -93,6 +94,20 @@ class TestCandlesBase(unittest.TestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_cached_until_candles_change(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        first_df = self.data_feed.candles_df
+        first_df["signal"] = 1
+        second_df = self.data_feed.candles_df
+        self.assertNotIn("signal", second_df.columns)
+        self.assertTrue(np.shares_memory(first_df["close"].values, second_df["close"].values))
+
+        last_candle = self.data_feed._candles[-1].copy()
+        last_candle[4] += 1
+        self.data_feed._candles[-1] = last_candle
+        self.assertEqual(last_candle[4], self.data_feed.candles_df["close"].iloc[-1])
+        self.assertNotEqual(last_candle[4], second_df["close"].iloc[-1])
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
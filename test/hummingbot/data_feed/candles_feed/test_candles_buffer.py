@@ -0,0 +1,69 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesBuffer(maxlen=3, n_columns=2)
+
+    def test_append_discards_oldest_when_full(self):
+        for i in range(5):
+            self.buffer.append([i, i * 10])
+        self.assertEqual(3, len(self.buffer))
+        np.testing.assert_array_equal(np.array([[2, 20], [3, 30], [4, 40]]), self.buffer.view())
+
+    def test_extendleft_has_deque_semantics(self):
+        expected = deque(maxlen=3)
+        expected.append(np.array([10.0, 0.0]))
+        self.buffer.append([10, 0])
+        rows = [[9, 0], [8, 0], [7, 0]]
+        expected.extendleft(np.array(rows, dtype=float))
+        self.buffer.extendleft(rows)
+        np.testing.assert_array_equal(np.array(expected), self.buffer.view())
+
+    def test_set_last_row(self):
+        self.buffer.extend([[1, 1], [2, 2]])
+        self.buffer[-1] = [2, 5]
+        self.assertEqual(5, self.buffer[-1][1])
+        with self.assertRaises(IndexError):
+            self.buffer[2] = [3, 3]
+
+    def test_view_is_read_only(self):
+        self.buffer.append([1, 1])
+        view = self.buffer.view()
+        with self.assertRaises(ValueError):
+            view[0, 0] = 2
+
+    def test_views_are_not_modified_by_later_writes(self):
+        self.buffer.extend([[1, 1], [2, 2]])
+        view = self.buffer.view()
+        self.buffer[-1] = [2, 3]
+        for i in range(3, 10):
+            self.buffer.append([i, i])
+        self.buffer.clear()
+        self.buffer.extendleft([[0, 0]])
+        np.testing.assert_array_equal(np.array([[1, 1], [2, 2]]), view)
+
+    def test_append_does_not_copy_stored_candles(self):
+        self.buffer.append([1, 1])
+        view = self.buffer.view()
+        self.buffer.append([2, 2])
+        self.assertTrue(np.shares_memory(view, self.buffer.view()))
+
+    def test_version_changes_on_modification(self):
+        version = self.buffer.version
+        self.buffer.append([1, 1])
+        self.assertGreater(self.buffer.version, version)
+        version = self.buffer.version
+        self.buffer[-1] = [1, 2]
+        self.assertGreater(self.buffer.version, version)
+
+    def test_invalid_rows_raise_error(self):
+        with self.assertRaises(ValueError):
+            self.buffer.extend(range(3))
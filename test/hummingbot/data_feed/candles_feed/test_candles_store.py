@@ -0,0 +1,140 @@
+import asyncio
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+
+class CandlesStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(root_path=self.temporary_directory.name)
+        self.name = "binance_BTC-USDT"
+        self.interval = "1m"
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def candles(start_time: int, end_time: int, close: float = 1.0) -> np.ndarray:
+        timestamps = np.arange(start_time, end_time + 60, 60, dtype=float)
+        candles = np.full((len(timestamps), 10), close)
+        candles[:, 0] = timestamps
+        return candles
+
+    def test_missing_ranges_of_empty_store(self):
+        self.assertEqual([(0, 600)], self.store.missing_ranges(self.name, self.interval, 60, 0, 600))
+
+    def test_missing_ranges_only_returns_gaps(self):
+        self.store.save(self.name, self.interval, 60, self.candles(120, 240), [(120, 240)])
+        self.store.save(self.name, self.interval, 60, self.candles(480, 540), [(480, 540)])
+        self.assertEqual([(0, 60), (300, 420), (600, 600)],
+                         self.store.missing_ranges(self.name, self.interval, 60, 0, 600))
+        self.assertEqual([], self.store.missing_ranges(self.name, self.interval, 60, 120, 240))
+
+    def test_adjacent_ranges_are_merged(self):
+        self.store.save(self.name, self.interval, 60, self.candles(0, 120), [(0, 120)])
+        self.store.save(self.name, self.interval, 60, self.candles(180, 300), [(180, 300)])
+        self.assertEqual([(0, 300)], self.store.covered_ranges(self.name, self.interval))
+
+    def test_ranges_without_candles_are_covered(self):
+        self.store.save(self.name, self.interval, 60, np.empty((0, 10)), [(0, 600)])
+        self.assertEqual([], self.store.missing_ranges(self.name, self.interval, 60, 0, 600))
+        self.assertEqual(0, len(self.store.load(self.name, self.interval, 0, 600)))
+
+    def test_load_returns_requested_range_sorted(self):
+        self.store.save(self.name, self.interval, 60, self.candles(300, 600), [(300, 600)])
+        self.store.save(self.name, self.interval, 60, self.candles(0, 240), [(0, 240)])
+        candles = self.store.load(self.name, self.interval, 120, 420)
+        np.testing.assert_array_equal(np.arange(120, 480, 60), candles[:, 0])
+
+    def test_save_keeps_last_version_of_duplicated_candles(self):
+        self.store.save(self.name, self.interval, 60, self.candles(0, 120, close=1.0), [(0, 120)])
+        self.store.save(self.name, self.interval, 60, self.candles(60, 180, close=2.0), [(60, 180)])
+        candles = self.store.load(self.name, self.interval, 0, 180)
+        np.testing.assert_array_equal(np.arange(0, 240, 60), candles[:, 0])
+        np.testing.assert_array_equal([1.0, 2.0, 2.0, 2.0], candles[:, 4])
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.initialize_exchange_data",
+           new_callable=AsyncMock)
+    def test_historical_candles_only_fetch_missing_ranges(self, _):
+        feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval)
+        feed.set_candles_store(self.store)
+        start_time = 1699999980
+        self.store.save(feed.name, self.interval, 60, self.candles(start_time, start_time + 6000),
+                        [(start_time, start_time + 6000)])
+        requested_ranges = []
+
+        async def fetch_candles(start_time, end_time, limit):
+            requested_ranges.append((start_time, end_time))
+            return self.candles(start_time, end_time)
+
+        feed.fetch_candles = fetch_candles
+        config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval=self.interval,
+                                         start_time=start_time, end_time=start_time + 12000)
+        with patch.object(feed, "_time", return_value=start_time + 100000):
+            candles_df = self.async_run_with_timeout(feed.get_historical_candles(config))
+
+        self.assertEqual([(start_time + 6060, start_time + 12000)], requested_ranges)
+        np.testing.assert_array_equal(np.arange(start_time, start_time + 12060, 60), candles_df["timestamp"].values)
+        self.assertEqual([(start_time, start_time + 12000)], self.store.covered_ranges(feed.name, self.interval))
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.initialize_exchange_data",
+           new_callable=AsyncMock)
+    def test_historical_candles_fetch_a_missing_range_of_one_candle(self, _):
+        feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval)
+        feed.set_candles_store(self.store)
+        start_time = 1699999980
+        self.store.save(feed.name, self.interval, 60, self.candles(start_time, start_time + 600),
+                        [(start_time, start_time + 600)])
+        requested_ranges = []
+
+        async def fetch_candles(start_time, end_time, limit):
+            requested_ranges.append((start_time, end_time))
+            return self.candles(end_time - limit * 60, end_time)
+
+        feed.fetch_candles = fetch_candles
+        config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval=self.interval,
+                                         start_time=start_time, end_time=start_time + 660)
+        with patch.object(feed, "_time", return_value=start_time + 100000):
+            candles_df = self.async_run_with_timeout(feed.get_historical_candles(config))
+
+        self.assertEqual([(start_time + 660, start_time + 660)], requested_ranges)
+        np.testing.assert_array_equal(np.arange(start_time, start_time + 720, 60), candles_df["timestamp"].values)
+        self.assertEqual([(start_time, start_time + 660)], self.store.covered_ranges(feed.name, self.interval))
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.initialize_exchange_data",
+           new_callable=AsyncMock)
+    def test_historical_candles_only_cover_the_ranges_returned_by_the_exchange(self, _):
+        feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval)
+        feed.set_candles_store(self.store)
+        start_time = 1699999980
+        first_listed_time = start_time + 3000
+
+        async def fetch_candles(start_time, end_time, limit):
+            return self.candles(max(first_listed_time, end_time - limit * 60), end_time)
+
+        feed.fetch_candles = fetch_candles
+        config = HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval=self.interval,
+                                         start_time=start_time, end_time=start_time + 6000)
+        with patch.object(feed, "_time", return_value=start_time + 100000):
+            candles_df = self.async_run_with_timeout(feed.get_historical_candles(config))
+
+        np.testing.assert_array_equal(np.arange(first_listed_time, start_time + 6060, 60),
+                                      candles_df["timestamp"].values)
+        self.assertEqual([(first_listed_time, start_time + 6000)], self.store.covered_ranges(feed.name, self.interval))
+        self.assertEqual([(start_time, first_listed_time - 60)],
+                         self.store.missing_ranges(feed.name, self.interval, 60, start_time, start_time + 6000))
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_stream_manager import CandlesStreamManager
+
+
+class CandlesStreamManagerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.btc_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        self.eth_feed = BinanceSpotCandles(trading_pair="ETH-USDT", interval="1m")
+        self.manager = CandlesStreamManager(self.btc_feed.wss_url)
+
+    def tearDown(self) -> None:
+        for connection in self.manager.connections:
+            connection.stop()
+        CandlesStreamManager._instances.clear()
+        super().tearDown()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def kline_message(symbol: str, interval: str = "1m"):
+        return {
+            "e": "kline", "E": 1718667728540, "s": symbol,
+            "k": {"t": 1718667720000, "T": 1718667779999, "s": symbol, "i": interval, "o": "1", "c": "2", "h": "3",
+                  "l": "0.5", "v": "10", "n": 246, "x": False, "q": "20", "V": "5", "Q": "10", "B": "0"}
+        }
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_share_connection_and_messages_are_routed(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.manager.subscribe(self.btc_feed)
+        self.manager.subscribe(self.eth_feed)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps(self.kline_message("BTCUSDT")))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value, message=json.dumps(self.kline_message("BTCUSDT", "5m")))
+
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(1, len(self.manager.connections))
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m", "ethusdt@kline_1m"], "id": 1}],
+                         sent_messages)
+        self.assertEqual(1, len(self.btc_feed.candles_df))
+        self.assertEqual(2.0, self.btc_feed.candles_df["close"].iloc[-1])
+        self.assertEqual(0, len(self.eth_feed.candles_df))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_join_and_leave_open_connection(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.manager.subscribe(self.btc_feed)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.manager.subscribe(self.eth_feed)
+        self.manager.unsubscribe(self.btc_feed)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([
+            {"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+            {"method": "UNSUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+            {"method": "SUBSCRIBE", "params": ["ethusdt@kline_1m"], "id": 1},
+        ], sent_messages)
+        self.assertEqual([self.eth_feed], self.manager.connections[0].feeds)
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.ws_max_streams_per_connection",
+           new_callable=PropertyMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_new_connection_opened_when_connection_is_full(self, ws_connect_mock, max_streams_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        max_streams_mock.return_value = 1
+        self.manager.subscribe(self.btc_feed)
+        self.manager.subscribe(self.eth_feed)
+        self.manager.subscribe(BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m"))
+
+        self.assertEqual(2, len(self.manager.connections))
+        self.assertEqual(2, len(self.manager.connections[0].feeds))
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.initialize_exchange_data",
+           new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_start_and_stop_network_use_shared_manager(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.btc_feed.start_network())
+        self.async_run_with_timeout(self.eth_feed.start_network())
+
+        manager = CandlesStreamManager.get_instance(self.btc_feed.wss_url)
+        self.assertEqual(1, len(manager.connections))
+        self.assertIsNone(self.btc_feed._listen_candles_task)
+
+        self.async_run_with_timeout(self.btc_feed.stop_network())
+        self.async_run_with_timeout(self.eth_feed.stop_network())
+        self.assertNotIn(self.btc_feed.wss_url, CandlesStreamManager._instances)
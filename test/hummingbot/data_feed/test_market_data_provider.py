@@ -1,3 +1,4 @@
+import asyncio
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -6,7 +7,10 @@ import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.data_feed.candles_feed.aggregated_candles import AggregatedCandles
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
@@ -118,6 +122,22 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         mock_candles_feed.stop.assert_called_once()
         self.assertNotIn(key, self.provider.candles_feeds)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    @patch.object(CandlesBase, "stop", MagicMock())
+    def test_candles_feed_aggregated_from_existing_feed(self):
+        base_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100)
+        config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="15m", max_records=100)
+        base_feed = self.provider.get_candles_feed(base_config)
+        with patch.object(AggregatedCandles, "start", MagicMock()):
+            feed = self.provider.get_candles_feed(config)
+        self.assertIsInstance(feed, AggregatedCandles)
+        self.assertIs(base_feed, feed.base_feed)
+
+        self.provider.stop_candle_feed(base_config)
+        base_feed.stop.assert_not_called()
+        self.provider.stop_candle_feed(config)
+        base_feed.stop.assert_called_once()
+
     def test_ready(self):
         # Mocking connector and candle feed readiness
         self.mock_connector.ready = True
@@ -156,6 +176,7 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
             self.assertEqual(result, 100)
 
     @patch.object(MarketDataProvider, "update_rates_task", MagicMock())
+    @patch.object(MarketDataProvider, "update_order_book_rates_task", MagicMock())
     def test_initialize_rate_sources(self):
         self.provider.initialize_rate_sources([ConnectorPair(connector_name="binance", trading_pair="BTC-USDT")])
         self.assertEqual(len(self.provider._rate_sources), 1)
@@ -169,3 +190,63 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         connector.get_last_traded_prices.side_effect = Exception("Error")
         result = await self.provider._safe_get_last_traded_prices(connector, ["BTC-USDT"])
         self.assertEqual(result, {})
+
+    async def test_safe_get_last_traded_prices_times_out(self):
+        async def get_last_traded_prices(trading_pairs):
+            await asyncio.sleep(10)
+
+        connector = MagicMock()
+        connector.get_last_traded_prices = get_last_traded_prices
+        result = await self.provider._safe_get_last_traded_prices(connector, ["BTC-USDT"], timeout=0.01)
+        self.assertEqual(result, {})
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle.get_instance")
+    async def test_update_rates_task_fetches_the_rate_sources_concurrently(self, mock_get_instance):
+        release_slow_source = asyncio.Event()
+
+        async def slow_last_traded_prices(trading_pairs):
+            await release_slow_source.wait()
+            return {"ETH-USDT": 2000}
+
+        fast_source = AsyncMock()
+        fast_source.get_last_traded_prices.return_value = {"BTC-USDT": 100}
+        slow_source = MagicMock()
+        slow_source.get_last_traded_prices = slow_last_traded_prices
+        self.provider._rate_sources = {"fast": fast_source, "slow": slow_source}
+        self.provider._rates_required = {
+            "slow": [ConnectorPair(connector_name="slow", trading_pair="ETH-USDT")],
+            "fast": [ConnectorPair(connector_name="fast", trading_pair="BTC-USDT")],
+        }
+
+        task = asyncio.ensure_future(self.provider.update_rates_task())
+        await asyncio.sleep(0.01)
+        # The fast source is not delayed by the slow one
+        mock_get_instance.return_value.set_price.assert_called_once_with("BTC-USDT", Decimal(100))
+        release_slow_source.set()
+        await asyncio.sleep(0.01)
+        mock_get_instance.return_value.set_price.assert_called_with("ETH-USDT", Decimal(2000))
+        task.cancel()
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle.get_instance")
+    async def test_rates_of_pairs_with_live_order_books_use_the_mid_price(self, mock_get_instance):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.mock_connector.order_books = {"BTC-USDT": order_book, "ETH-USDT": OrderBook()}
+        rate_source = AsyncMock()
+        rate_source.get_last_traded_prices.return_value = {"ETH-USDT": 2000}
+        self.provider._rate_sources = {"mock_connector": rate_source}
+        self.provider._rates_required = {
+            "mock_connector": [ConnectorPair(connector_name="mock_connector", trading_pair="BTC-USDT"),
+                               ConnectorPair(connector_name="mock_connector", trading_pair="ETH-USDT")],
+        }
+
+        rates_task = asyncio.ensure_future(self.provider.update_rates_task())
+        order_book_rates_task = asyncio.ensure_future(self.provider.update_order_book_rates_task())
+        await asyncio.sleep(0.01)
+        rates_task.cancel()
+        order_book_rates_task.cancel()
+
+        # The empty order book has no mid price yet, so its pair is fetched from the rate source
+        rate_source.get_last_traded_prices.assert_awaited_once_with(trading_pairs=["ETH-USDT"])
+        mock_get_instance.return_value.set_price.assert_any_call("ETH-USDT", Decimal(2000))
+        mock_get_instance.return_value.set_price.assert_any_call("BTC-USDT", Decimal(100))
@@ -0,0 +1,110 @@
+import logging
+import threading
+import unittest
+from typing import List
+
+from hummingbot.logger.log_queue import LogQueue, LogQueueHandler
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level=level)
+        self.records: List[logging.LogRecord] = []
+        self.threads: List[threading.Thread] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+        self.threads.append(threading.current_thread())
+
+
+class BlockingHandler(RecordingHandler):
+    def __init__(self):
+        super().__init__()
+        self.unblocked = threading.Event()
+
+    def emit(self, record: logging.LogRecord):
+        self.unblocked.wait(5)
+        super().emit(record)
+
+
+class LogQueueTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logger = logging.getLogger(f"{__name__}.{self._testMethodName}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        super().tearDown()
+
+    def test_records_are_handled_by_the_logger_handlers_on_the_logging_thread(self):
+        debug_handler = RecordingHandler()
+        warning_handler = RecordingHandler(level=logging.WARNING)
+        self.logger.addHandler(debug_handler)
+        self.logger.addHandler(warning_handler)
+        log_queue = LogQueue()
+        log_queue.start([self.logger])
+
+        self.assertEqual(1, len(self.logger.handlers))
+        self.assertIsInstance(self.logger.handlers[0], LogQueueHandler)
+        arguments = {"price": 1}
+        self.logger.info("Price %s", arguments)
+        arguments["price"] = 2
+        self.logger.warning("Warning")
+        log_queue.stop()
+
+        self.assertEqual(["Price {'price': 1}", "Warning"], [record.getMessage() for record in debug_handler.records])
+        self.assertEqual(["Warning"], [record.getMessage() for record in warning_handler.records])
+        self.assertNotIn(threading.current_thread(), debug_handler.threads)
+
+    def test_exception_info_is_left_to_the_handlers(self):
+        handler = RecordingHandler()
+        self.logger.addHandler(handler)
+        log_queue = LogQueue()
+        log_queue.start([self.logger])
+
+        try:
+            raise ValueError("Error")
+        except ValueError:
+            self.logger.error("Unexpected error", exc_info=True)
+        log_queue.stop()
+
+        self.assertEqual("Unexpected error", handler.records[0].getMessage())
+        self.assertIs(ValueError, handler.records[0].exc_info[0])
+
+    def test_records_are_dropped_and_counted_when_the_queue_is_full(self):
+        handler = BlockingHandler()
+        self.logger.addHandler(handler)
+        log_queue = LogQueue(queue_size=2)
+        log_queue.start([self.logger])
+
+        for i in range(10):
+            self.logger.info(f"Record {i}")
+        self.assertGreaterEqual(log_queue.dropped_records, 7)
+        handler.unblocked.set()
+        log_queue.stop()
+
+        dropped_records = log_queue.dropped_records
+        self.assertEqual(10 - dropped_records + 1, len(handler.records))
+        self.assertEqual(f"{dropped_records} log records were dropped because the log queue was full.",
+                         handler.records[-1].getMessage())
+        self.assertEqual(logging.WARNING, handler.records[-1].levelno)
+
+    def test_handlers_added_and_removed_behind_the_queue(self):
+        handler = RecordingHandler()
+        self.logger.addHandler(handler)
+        log_queue = LogQueue()
+        log_queue.start([self.logger])
+        added_handler = RecordingHandler()
+
+        log_queue.add_handler(self.logger, added_handler)
+        self.logger.info("First")
+        log_queue.remove_handler(self.logger, added_handler)
+        self.logger.info("Second")
+        log_queue.stop()
+
+        self.assertEqual(["First", "Second"], [record.getMessage() for record in handler.records])
+        self.assertEqual(["First"], [record.getMessage() for record in added_handler.records])
+        self.assertEqual(1, len(self.logger.handlers))
@@ -1146,6 +1146,26 @@ class RemoteIfaceMQTTTests(TestCase):
         gw.remove_external_event_listener('test.a.b', clb)
         self.assertTrue(len(gw._external_events._listeners.get('test.a.b')) == 0)
 
+    def test_mqtt_log_handler_publishes_from_the_logging_thread(self):
+        import logging
+        import threading
+
+        from hummingbot.remote_iface.mqtt import MQTTLogHandler
+        self.start_mqtt()
+
+        handler = MQTTLogHandler(self.hbapp, self.gateway)
+        record = logging.LogRecord('testlogger', logging.INFO, '', 0, 'message %s', ('from thread',), None)
+        with patch.object(handler.log_pub, "publish") as publish_mock:
+            thread = threading.Thread(target=handler.emit, args=(record,))
+            thread.start()
+            thread.join()
+
+        publish_mock.assert_called_once()
+        msg = publish_mock.call_args[0][0]
+        self.assertEqual("message from thread", msg.msg)
+        self.assertEqual("INFO", msg.level_name)
+        self.assertEqual("testlogger", msg.logger_name)
+
     def test_mqtt_log_handler(self):
         import logging
 
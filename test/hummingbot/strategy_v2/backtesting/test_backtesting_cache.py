@@ -0,0 +1,125 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_cache import BacktestingCache
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class SignalControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "signal_controller"
+    signal_length: int = 10
+
+
+class SignalController(DirectionalTradingControllerBase):
+    pass
+
+
+class BacktestingCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = BacktestingCache(self.cache_dir.name)
+        self.candles = pd.DataFrame({"timestamp": [1.0, 2.0, 3.0], "close": [100.0, 101.0, 102.0]})
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    def test_fingerprint_depends_on_the_content(self):
+        key = self.cache.fingerprint(1, {"a": 1, "b": 2}, self.candles)
+
+        self.assertEqual(key, self.cache.fingerprint(1, {"b": 2, "a": 1}, self.candles.copy()))
+        # The index is not part of the content
+        self.assertEqual(key, self.cache.fingerprint(1, {"a": 1, "b": 2}, self.candles.set_index(pd.Index([5, 6, 7]))))
+        changed_candles = self.candles.copy()
+        changed_candles.loc[2, "close"] = 103.0
+        self.assertNotEqual(key, self.cache.fingerprint(1, {"a": 1, "b": 2}, changed_candles))
+        self.assertNotEqual(key, self.cache.fingerprint(1, {"a": 1, "b": 2}, self.candles.rename(columns={"close": "c"})))
+        self.assertNotEqual(key, self.cache.fingerprint(2, {"a": 1, "b": 2}, self.candles))
+
+    def test_get_and_set(self):
+        key = self.cache.fingerprint(self.candles)
+        self.assertIsNone(self.cache.get("features", key))
+
+        self.cache.set("features", key, {"features": self.candles, "signal": 1})
+
+        entry = self.cache.get("features", key)
+        pd.testing.assert_frame_equal(self.candles, entry["features"])
+        self.assertEqual(1, entry["signal"])
+        self.assertIsNone(self.cache.get("simulation", key))
+
+    def test_invalid_entries_are_ignored(self):
+        self.cache.set("features", "key", lambda: None)
+        self.assertIsNone(self.cache.get("features", "key"))
+
+        os.makedirs(os.path.join(self.cache_dir.name, "simulation"))
+        with open(os.path.join(self.cache_dir.name, "simulation", "key.pkl"), "wb") as file:
+            file.write(b"invalid")
+        self.assertIsNone(self.cache.get("simulation", "key"))
+
+    def test_features_config_data_excludes_executor_fields(self):
+        config = SignalControllerConfig(connector_name="binance", trading_pair="BTC-USDT", candles_config=[],
+                                        stop_loss=Decimal("0.01"), take_profit=Decimal("0.02"))
+        features_config_data = BacktestingEngineBase.get_features_config_data(config)
+
+        self.assertEqual({"controller_name", "controller_type", "connector_name", "trading_pair", "candles_config",
+                          "signal_length"}, set(features_config_data.keys()))
+        config.take_profit = Decimal("0.03")
+        self.assertEqual(features_config_data, BacktestingEngineBase.get_features_config_data(config))
+
+    def create_engine(self) -> BacktestingEngineBase:
+        with patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider"):
+            engine = BacktestingEngineBase(cache=self.cache)
+        engine.backtesting_data_provider.initialize_trading_rules = AsyncMock()
+        engine.backtesting_data_provider.initialize_candles_feed = AsyncMock()
+        engine.backtesting_data_provider.get_candles_df.return_value = self.candles
+        return engine
+
+    def executor_info(self, controller_id: str) -> ExecutorInfo:
+        config = PositionExecutorConfig(timestamp=1.0, trading_pair="BTC-USDT", connector_name="binance",
+                                        side=TradeType.BUY, amount=Decimal("1"), controller_id=controller_id)
+        return ExecutorInfo(id=config.id, timestamp=1.0, type="position_executor", status=RunnableStatus.TERMINATED,
+                            config=config, filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(1),
+                            net_pnl_pct=Decimal("0.01"), cum_fees_quote=Decimal(0), is_trading=False,
+                            is_active=False, custom_info={})
+
+    def test_configs_differing_by_their_generated_id_share_the_cached_simulation(self):
+        config = SignalControllerConfig(connector_name="binance", trading_pair="BTC-USDT", candles_config=[])
+        other_config = SignalControllerConfig(connector_name="binance", trading_pair="BTC-USDT", candles_config=[])
+        self.assertNotEqual(config.id, other_config.id)
+        engine = self.create_engine()
+        run_simulation_mock = AsyncMock(side_effect=lambda trade_cost: {
+            "executors": [self.executor_info(engine.controller.config.id)],
+            "results": {"net_pnl_quote": 1},
+            "processed_data": {"signal": 1},
+        })
+        engine.run_simulation = run_simulation_mock
+        loop = asyncio.get_event_loop()
+
+        loop.run_until_complete(engine.run_backtesting(config, 1, 3))
+        result = loop.run_until_complete(engine.run_backtesting(other_config, 1, 3))
+
+        self.assertEqual(1, run_simulation_mock.call_count)
+        self.assertEqual({"net_pnl_quote": 1}, result["results"])
+        self.assertEqual(other_config.id, result["executors"][0].config.controller_id)
+        self.assertEqual(other_config.id, engine.controller.executors_info[0].config.controller_id)
+
+        changed_config = SignalControllerConfig(connector_name="binance", trading_pair="BTC-USDT", candles_config=[],
+                                                stop_loss=Decimal("0.05"))
+        loop.run_until_complete(engine.run_backtesting(changed_config, 1, 3))
+        self.assertEqual(2, run_simulation_mock.call_count)
@@ -0,0 +1,120 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import SimulationCandles
+from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TestExecutorSimulation(unittest.TestCase):
+
+    def setUp(self):
+        close = [100.0, 101.0, 102.0, 103.0, 99.0, 98.0]
+        self.candles = SimulationCandles.from_df(pd.DataFrame({
+            "timestamp": [100.0, 160.0, 220.0, 280.0, 340.0, 400.0],
+            "high": [price + 0.5 for price in close],
+            "low": [price - 0.5 for price in close],
+            "close": close,
+        }))
+
+    def position_config(self, **triple_barrier_config) -> PositionExecutorConfig:
+        return PositionExecutorConfig(
+            timestamp=100, connector_name="binance", trading_pair="BTC-USDT", side=TradeType.BUY,
+            entry_price=Decimal("100"), amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(**triple_barrier_config))
+
+    def test_candles_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.candles.close[0] = 1
+
+    def test_position_take_profit(self):
+        simulation = PositionExecutorSimulator().simulate_from_index(
+            self.candles, 0, self.position_config(take_profit=Decimal("0.015")), trade_cost=0.0)
+
+        self.assertEqual(CloseType.TAKE_PROFIT, simulation.close_type)
+        self.assertEqual(100.0, simulation.start_timestamp)
+        self.assertEqual(220.0, simulation.close_timestamp)
+
+    def test_position_stop_loss_before_time_limit(self):
+        config = self.position_config(stop_loss=Decimal("0.015"), time_limit=300)
+        simulation = PositionExecutorSimulator().simulate_from_index(self.candles, 0, config, trade_cost=0.0)
+        self.assertEqual(CloseType.STOP_LOSS, simulation.close_type)
+        self.assertEqual(340.0, simulation.close_timestamp)
+
+        config = self.position_config(stop_loss=Decimal("0.015"), time_limit=200)
+        simulation = PositionExecutorSimulator().simulate_from_index(self.candles, 0, config, trade_cost=0.0)
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(280.0, simulation.close_timestamp)
+
+    def test_position_trailing_stop(self):
+        config = self.position_config(trailing_stop=TrailingStop(activation_price=Decimal("0.02"),
+                                                                 trailing_delta=Decimal("0.005")))
+        simulation = PositionExecutorSimulator().simulate_from_index(self.candles, 0, config, trade_cost=0.0)
+        self.assertEqual(CloseType.TRAILING_STOP, simulation.close_type)
+        self.assertEqual(340.0, simulation.close_timestamp)
+
+    def test_position_limit_order_not_filled(self):
+        config = self.position_config(open_order_type=OrderType.LIMIT, take_profit=Decimal("0.01"))
+        config.entry_price = Decimal("90")
+        simulation = PositionExecutorSimulator().simulate_from_index(self.candles, 0, config, trade_cost=0.0)
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        self.assertEqual(Decimal("0"), simulation.get_executor_info_at_timestamp(400).filled_amount_quote)
+
+    def test_executor_info_while_active(self):
+        simulation = PositionExecutorSimulator().simulate_from_index(
+            self.candles, 0, self.position_config(take_profit=Decimal("0.025")), trade_cost=0.001)
+
+        executor_info = simulation.get_executor_info_at_timestamp(190)
+        self.assertEqual(RunnableStatus.RUNNING, executor_info.status)
+        self.assertTrue(executor_info.is_active)
+        self.assertAlmostEqual(0.009, float(executor_info.net_pnl_pct))
+        self.assertAlmostEqual(0.9, float(executor_info.net_pnl_quote))
+        self.assertAlmostEqual(0.1, float(executor_info.cum_fees_quote))
+        self.assertEqual(Decimal("100"), executor_info.filled_amount_quote)
+        self.assertEqual(101.0, executor_info.custom_info["close_price"])
+
+    def test_executor_info_after_close(self):
+        simulation = PositionExecutorSimulator().simulate_from_index(
+            self.candles, 0, self.position_config(take_profit=Decimal("0.025")), trade_cost=0.0)
+
+        executor_info = simulation.get_executor_info_at_timestamp(1000)
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(CloseType.TAKE_PROFIT, executor_info.close_type)
+        self.assertEqual(280.0, executor_info.close_timestamp)
+        self.assertAlmostEqual(3.0, float(executor_info.net_pnl_quote))
+        self.assertEqual(Decimal("200"), executor_info.filled_amount_quote)
+
+    def test_executor_info_before_start(self):
+        simulation = PositionExecutorSimulator().simulate_from_index(
+            self.candles, 1, self.position_config(take_profit=Decimal("0.01")), trade_cost=0.0)
+        executor_info = simulation.get_executor_info_at_timestamp(50)
+        self.assertEqual(RunnableStatus.TERMINATED, executor_info.status)
+        self.assertEqual(Decimal("0"), executor_info.net_pnl_quote)
+
+    def test_dca_levels_and_report(self):
+        config = DCAExecutorConfig(
+            timestamp=100, connector_name="binance", trading_pair="BTC-USDT", side=TradeType.BUY,
+            prices=[Decimal("100"), Decimal("99")], amounts_quote=[Decimal("10"), Decimal("30")],
+            stop_loss=Decimal("0.1"), take_profit=Decimal("0.5"))
+        simulation = DCAExecutorSimulator().simulate_from_index(self.candles, 0, config, trade_cost=0.0)
+
+        self.assertEqual(CloseType.TIME_LIMIT, simulation.close_type)
+        executor_info = simulation.get_executor_info_at_timestamp(400)
+        self.assertAlmostEqual(10 * (98 / 100 - 1) + 30 * (98 / 99 - 1), float(executor_info.net_pnl_quote))
+        self.assertAlmostEqual(99.25, executor_info.custom_info["current_position_average_price"])
+
+        report = simulation.executor_simulation
+        self.assertEqual(6, len(report))
+        np.testing.assert_allclose([10, 10, 10, 10, 40, 80], report["filled_amount_quote"].values)
@@ -0,0 +1,166 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from multiprocessing import shared_memory
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.parameter_sweep import (
+    ParameterSweep,
+    SweepResultsCache,
+    config_hash,
+    grid_search_params,
+    random_search_params,
+)
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+
+
+class SweepControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "sweep_controller"
+    signal_period: int = 10
+
+
+class SweepController(DirectionalTradingControllerBase):
+    async def update_processed_data(self):
+        candles = self.market_data_provider.get_candles_df(self.config.connector_name, self.config.trading_pair, "1m")
+        features = candles[["timestamp"]].copy()
+        features["signal"] = np.where(np.arange(len(features)) % self.config.signal_period == 0, 1, 0)
+        self.processed_data = {"signal": 0, "features": features}
+
+
+class ParameterSweepTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.parent_pid = os.getpid()
+        self.close_offset = 0
+        self.base_config = {"controller_name": "sweep_controller", "controller_type": "directional_trading",
+                            "connector_name": "binance", "trading_pair": "BTC-USDT", "candles_config": [],
+                            "signal_period": 10}
+        # The end time is not on a candle boundary, so the last candle starts before it
+        self.sweep = ParameterSweep(self.base_config, start=1700000040, end=1700007230, max_workers=2,
+                                    results_cache=SweepResultsCache(self.cache_dir.name))
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    def historical_candles(self, config) -> pd.DataFrame:
+        timestamps = np.arange(config.start_time // 60 * 60, config.end_time + 1, 60, dtype=float)
+        close = 100 + self.close_offset + np.sin(timestamps / 3600)
+        return pd.DataFrame({"timestamp": timestamps, "open": close, "high": close + 0.5, "low": close - 0.5,
+                             "close": close, "volume": np.ones(len(timestamps))})
+
+    def run_sweep(self, params_list) -> pd.DataFrame:
+        """
+        Runs the sweep on stubbed candles and trading rules. The candles can only be fetched by this process.
+        """
+        async def get_historical_candles(config):
+            if os.getpid() != self.parent_pid:
+                raise AssertionError("Candles fetched by a worker")
+            return self.historical_candles(config)
+
+        async def initialize_trading_rules(data_provider, connector_name):
+            data_provider.trading_rules[connector_name] = {"BTC-USDT": TradingRule(
+                "BTC-USDT", min_price_increment=Decimal("0.01"), min_base_amount_increment=Decimal("0.0001"))}
+
+        copy_candles = ParameterSweep._copy_candles_to_shared_memory
+
+        def copy_candles_to_shared_memory(candles):
+            candles_specs, shared_segments = copy_candles(candles)
+            self.shared_segment_names.extend(segment.name for segment in shared_segments)
+            return candles_specs, shared_segments
+
+        self.shared_segment_names = []
+        self.candle_feed = MagicMock()
+        self.candle_feed.get_historical_candles = AsyncMock(side_effect=get_historical_candles)
+        with patch.object(BacktestingDataProvider, "get_connector"), \
+                patch.object(BacktestingDataProvider, "initialize_trading_rules", autospec=True,
+                             side_effect=initialize_trading_rules), \
+                patch.object(BacktestingEngineBase, "get_controller_config_instance_from_dict",
+                             side_effect=lambda config_data: SweepControllerConfig(**config_data)), \
+                patch.object(ParameterSweep, "_copy_candles_to_shared_memory",
+                             side_effect=copy_candles_to_shared_memory), \
+                patch("hummingbot.strategy_v2.backtesting.backtesting_data_provider.CandlesFactory") as factory_mock:
+            factory_mock.get_candle.return_value = self.candle_feed
+            self.candles_factory = factory_mock
+            return self.sweep.run(params_list)
+
+    def test_grid_search_params(self):
+        params = grid_search_params({"bb_length": [50, 100], "bb_std": [1.5, 2.0, 2.5]})
+        self.assertEqual(6, len(params))
+        self.assertEqual({"bb_length": 50, "bb_std": 1.5}, params[0])
+        self.assertEqual({"bb_length": 100, "bb_std": 2.5}, params[-1])
+
+    def test_random_search_params(self):
+        space = {"bb_length": (20, 200), "bb_std": (1.0, 3.0), "interval": ["1m", "3m"]}
+        params = random_search_params(space, n_samples=10, seed=1)
+
+        self.assertEqual(10, len(params))
+        self.assertEqual(params, random_search_params(space, n_samples=10, seed=1))
+        for sample in params:
+            self.assertIsInstance(sample["bb_length"], int)
+            self.assertTrue(20 <= sample["bb_length"] <= 200)
+            self.assertTrue(1.0 <= sample["bb_std"] <= 3.0)
+            self.assertIn(sample["interval"], ["1m", "3m"])
+
+    def test_random_search_params_stops_when_space_is_exhausted(self):
+        params = random_search_params({"interval": ["1m", "3m"]}, n_samples=5, seed=1)
+        self.assertEqual(2, len(params))
+
+    def test_config_hash(self):
+        key = config_hash({"a": 1, "b": 2}, 1, 2, "1m", 0.001, "code", ["candles"])
+        self.assertEqual(key, config_hash({"b": 2, "a": 1}, 1, 2, "1m", 0.001, "code", ["candles"]))
+        self.assertNotEqual(key, config_hash({"a": 1, "b": 2}, 1, 3, "1m", 0.001, "code", ["candles"]))
+        self.assertNotEqual(key, config_hash({"a": 1, "b": 3}, 1, 2, "1m", 0.001, "code", ["candles"]))
+        self.assertNotEqual(key, config_hash({"a": 1, "b": 2}, 1, 2, "1m", 0.001, "other code", ["candles"]))
+        self.assertNotEqual(key, config_hash({"a": 1, "b": 2}, 1, 2, "1m", 0.001, "code", ["other candles"]))
+
+    def test_sweep_workers_use_the_candles_loaded_once_in_shared_memory(self):
+        results_df = self.run_sweep(grid_search_params({"signal_period": [10, 20, 30]}))
+
+        self.assertEqual([10, 20, 30], sorted(results_df["signal_period"]))
+        self.assertTrue((results_df["total_executors"] > 0).all())
+        self.assertEqual(1, self.candles_factory.get_candle.call_count)
+        self.assertEqual(1, self.candle_feed.get_historical_candles.call_count)
+        self.assertEqual(1, len(self.shared_segment_names))
+        for name in self.shared_segment_names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_cached_results_are_not_run_again(self):
+        config_data = self.sweep.get_config_data({"signal_period": 20})
+        self.assertEqual(20, config_data["signal_period"])
+        self.assertEqual(10, self.base_config["signal_period"])
+        results_df = self.run_sweep([{"signal_period": 20}])
+
+        with patch("hummingbot.strategy_v2.backtesting.parameter_sweep.ProcessPoolExecutor") as pool_mock:
+            cached_results_df = self.run_sweep([{"signal_period": 20}])
+
+        pool_mock.assert_not_called()
+        self.assertEqual(0, len(self.shared_segment_names))
+        pd.testing.assert_frame_equal(results_df, cached_results_df)
+        self.assertNotIn("close_types", cached_results_df.columns)
+
+    def test_results_are_run_again_when_the_candles_or_the_controller_code_change(self):
+        key = self.run_sweep([{"signal_period": 20}])["config_hash"].iloc[0]
+
+        self.close_offset = 1
+        candles_changed_key = self.run_sweep([{"signal_period": 20}])["config_hash"].iloc[0]
+        self.assertNotEqual(key, candles_changed_key)
+        self.assertEqual(1, len(self.shared_segment_names))
+
+        with patch.object(BacktestingEngineBase, "get_controller_class_code_fingerprint", return_value="changed"):
+            code_changed_key = self.run_sweep([{"signal_period": 20}])["config_hash"].iloc[0]
+        self.assertNotIn(code_changed_key, [key, candles_changed_key])
+        self.assertEqual(1, len(self.shared_segment_names))
@@ -0,0 +1,151 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy_v2.utils.incremental_indicators import (
+    ATR,
+    EMA,
+    MACD,
+    NATR,
+    RSI,
+    BollingerBands,
+    IndicatorEngine,
+    SuperTrend,
+)
+
+
+class TestIncrementalIndicators(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        n_candles = 300
+        close = 100 + np.cumsum(rng.normal(0, 1, n_candles))
+        self.candles = pd.DataFrame({
+            "timestamp": np.arange(n_candles) * 60.0,
+            "open": close + rng.normal(0, 0.3, n_candles),
+            "high": close + rng.random(n_candles),
+            "low": close - rng.random(n_candles),
+            "close": close,
+            "volume": rng.random(n_candles),
+        })
+
+    @staticmethod
+    def ema(series: pd.Series, length: int) -> pd.Series:
+        series = series.copy()
+        sma = series[0:length].mean()
+        series[:length - 1] = np.nan
+        series.iloc[length - 1] = sma
+        return series.ewm(span=length, adjust=False).mean()
+
+    @staticmethod
+    def rma(series: pd.Series, length: int) -> pd.Series:
+        return series.ewm(alpha=1.0 / length, min_periods=length).mean()
+
+    def true_range(self) -> pd.Series:
+        prev_close = self.candles["close"].shift(1)
+        true_range = pd.concat([self.candles["high"] - self.candles["low"],
+                                self.candles["high"] - prev_close,
+                                prev_close - self.candles["low"]], axis=1).abs().max(axis=1)
+        true_range.iloc[0] = np.nan
+        return true_range
+
+    def run_engine(self, indicators, window: int = 100) -> pd.DataFrame:
+        engine = IndicatorEngine(indicators)
+        for end in range(window, len(self.candles) + 1):
+            self.assertTrue(engine.update(self.candles.iloc[end - window:end]))
+        return engine.features
+
+    def assert_series_equal(self, features: pd.DataFrame, column: str, expected: pd.Series):
+        expected_values = expected.iloc[-len(features):].to_numpy()
+        np.testing.assert_allclose(features[column].to_numpy(), expected_values, rtol=1e-8, atol=1e-8)
+
+    def test_ema(self):
+        features = self.run_engine([EMA(length=20)])
+        self.assert_series_equal(features, "EMA_20", self.ema(self.candles["close"], 20))
+
+    def test_macd(self):
+        features = self.run_engine([MACD(fast=12, slow=26, signal=9)])
+        close = self.candles["close"]
+        macd = self.ema(close, 12) - self.ema(close, 26)
+        signal = self.ema(macd.loc[macd.first_valid_index():], 9)
+        self.assert_series_equal(features, "MACD_12_26_9", macd)
+        self.assert_series_equal(features, "MACDs_12_26_9", signal)
+        self.assert_series_equal(features, "MACDh_12_26_9", macd - signal)
+
+    def test_bollinger_bands(self):
+        features = self.run_engine([BollingerBands(length=20, std=2.0)])
+        close = self.candles["close"]
+        mid = close.rolling(20).mean()
+        deviation = 2.0 * close.rolling(20).std(ddof=0)
+        self.assert_series_equal(features, "BBL_20_2.0", mid - deviation)
+        self.assert_series_equal(features, "BBM_20_2.0", mid)
+        self.assert_series_equal(features, "BBU_20_2.0", mid + deviation)
+        self.assert_series_equal(features, "BBB_20_2.0", 100 * 2 * deviation / mid)
+        self.assert_series_equal(features, "BBP_20_2.0", (close - mid + deviation) / (2 * deviation))
+
+    def test_atr_and_natr(self):
+        features = self.run_engine([ATR(length=14), NATR(length=14)])
+        atr = self.rma(self.true_range(), 14)
+        self.assert_series_equal(features, "ATRr_14", atr)
+        self.assert_series_equal(features, "NATR_14", 100 * atr / self.candles["close"])
+
+    def test_rsi(self):
+        features = self.run_engine([RSI(length=14)])
+        diff = self.candles["close"].diff()
+        positive = self.rma(diff.clip(lower=0), 14)
+        negative = self.rma(diff.clip(upper=0), 14)
+        self.assert_series_equal(features, "RSI_14", 100 * positive / (positive + negative.abs()))
+
+    def test_supertrend(self):
+        features = self.run_engine([SuperTrend(length=10, multiplier=3.0)])
+        atr = self.rma(self.true_range(), 10)
+        hl2 = (self.candles["high"] + self.candles["low"]) / 2
+        upper = (hl2 + 3.0 * atr).tolist()
+        lower = (hl2 - 3.0 * atr).tolist()
+        close = self.candles["close"].tolist()
+        direction = [1] * len(close)
+        trend = [0.0] * len(close)
+        for i in range(1, len(close)):
+            if close[i] > upper[i - 1]:
+                direction[i] = 1
+            elif close[i] < lower[i - 1]:
+                direction[i] = -1
+            else:
+                direction[i] = direction[i - 1]
+                if direction[i] > 0 and lower[i] < lower[i - 1]:
+                    lower[i] = lower[i - 1]
+                if direction[i] < 0 and upper[i] > upper[i - 1]:
+                    upper[i] = upper[i - 1]
+            trend[i] = lower[i] if direction[i] > 0 else upper[i]
+        self.assert_series_equal(features, "SUPERT_10_3.0", pd.Series(trend))
+        self.assert_series_equal(features, "SUPERTd_10_3.0", pd.Series(direction, dtype=float))
+
+    def test_update_skipped_when_candles_did_not_change(self):
+        engine = IndicatorEngine([EMA(length=5)])
+        window = self.candles.iloc[:50]
+        self.assertTrue(engine.update(window))
+        features = engine.features
+        self.assertFalse(engine.update(window.copy()))
+        self.assertIs(features, engine.features)
+
+    def test_forming_candle_is_not_committed(self):
+        engine = IndicatorEngine([EMA(length=5)])
+        window = self.candles.iloc[:50].copy()
+        engine.update(window)
+        window.loc[window.index[-1], "close"] += 10
+        self.assertTrue(engine.update(window))
+        self.assertTrue(engine.update(self.candles.iloc[:51]))
+        self.assert_series_equal(engine.features, "EMA_5", self.ema(self.candles["close"].iloc[:51], 5))
+
+    def test_state_rebuilt_when_history_is_backfilled(self):
+        engine = IndicatorEngine([EMA(length=5)])
+        engine.update(self.candles.iloc[200:202])
+        engine.update(self.candles.iloc[100:203])
+        expected = self.ema(self.candles["close"].iloc[100:203].reset_index(drop=True), 5)
+        self.assert_series_equal(engine.features, "EMA_5", expected)
+
+    def test_empty_candles(self):
+        engine = IndicatorEngine([EMA(length=5)])
+        self.assertFalse(engine.update(pd.DataFrame(columns=self.candles.columns)))
+        self.assertTrue(engine.features.empty)